@@ -16,6 +16,7 @@ from PyQt5.QtGui import QFont, QIcon, QCursor
 
 from utils.app_utils import (get_installed_apps, get_windows_apps, uninstall_app, 
                            install_app, get_app_details, uninstall_windows_app)
+from utils.file_hashes import shared_hash_cache
 import os
 
 class InstallDialog(QDialog):
@@ -118,6 +119,9 @@ class InstallDialog(QDialog):
 class AppDetailDialog(QDialog):
     """Dialog for displaying application details."""
     
+    # Emitted from the file hash pool
+    fileHashed = pyqtSignal(str, object)
+    
     def __init__(self, app_data, parent=None):
         super().__init__(parent)
         self.app_data = app_data
@@ -149,6 +153,24 @@ class AppDetailDialog(QDialog):
             uninstall_label.setWordWrap(True)
             form_layout.addRow("Uninstall Command:", uninstall_label)
         
+        # Main executable, with its hash and signature (if found)
+        if self.app_data.get('executable'):
+            form_layout.addRow("Executable:", QLabel(self.app_data['executable']))
+            self.sha256_value = QLabel("Hashing...")
+            self.sha256_value.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            self.signature_value = QLabel("")
+            form_layout.addRow("SHA-256:", self.sha256_value)
+            form_layout.addRow("Signature:", self.signature_value)
+            
+            self.fileHashed.connect(self.on_file_hashed)
+            file_hashes = shared_hash_cache()
+            entry = file_hashes.request(self.app_data['executable'], self.fileHashed.emit)
+            if entry is not None:
+                self.on_file_hashed(self.app_data['executable'], entry)
+            elif not file_hashes.pending(self.app_data['executable']):
+                # The file cannot be read, so no result will arrive
+                self.on_file_hashed(self.app_data['executable'], None)
+        
         layout.addLayout(form_layout)
         
         # Additional info (if available)
@@ -166,6 +188,14 @@ class AppDetailDialog(QDialog):
         close_button = QPushButton("Close")
         close_button.clicked.connect(self.accept)
         layout.addWidget(close_button)
+    
+    def on_file_hashed(self, path, entry):
+        """Show the computed hash of the main executable."""
+        if entry is None:
+            self.sha256_value.setText("Unavailable")
+        else:
+            self.sha256_value.setText(entry['sha256'])
+            self.signature_value.setText(entry['signature'])
 
 class AppFilterWidget(QWidget):
     """Widget for filtering applications in the table."""
@@ -17,10 +17,14 @@ from PyQt5.QtGui import QFont, QIcon, QCursor
 from utils.background_utils import (get_services, get_startup_items, get_scheduled_tasks,
                                    toggle_service, toggle_startup_item, get_service_details,
                                    get_startup_details, get_scheduled_task_details)
+from utils.file_hashes import shared_hash_cache
 
 class BackgroundItemDetailDialog(QDialog):
     """Dialog for displaying detailed information about background items."""
     
+    # Emitted from the file hash pool
+    fileHashed = pyqtSignal(str, object)
+    
     def __init__(self, item_type, item_data, parent=None):
         super().__init__(parent)
         self.item_type = item_type
@@ -55,6 +59,8 @@ class BackgroundItemDetailDialog(QDialog):
             form_layout.addRow("User:", QLabel(self.item_data.get('user', 'N/A')))
             form_layout.addRow("Enabled:", QLabel("Yes" if self.item_data.get('enabled', False) else "No"))
             form_layout.addRow("Manufacturer:", QLabel(self.item_data.get('manufacturer', 'N/A')))
+            if self.item_data.get('executable'):
+                self.add_file_hash_rows(form_layout, self.item_data['executable'])
             
         elif self.item_type == "Scheduled Task":
             form_layout.addRow("Name:", QLabel(self.item_data.get('name', 'N/A')))
@@ -73,6 +79,31 @@ class BackgroundItemDetailDialog(QDialog):
         close_button = QPushButton("Close")
         close_button.clicked.connect(self.accept)
         layout.addWidget(close_button)
+    
+    def add_file_hash_rows(self, form_layout, path):
+        """Add the hash and signature of an executable, hashing it in the background on a miss."""
+        self.sha256_value = QLabel("Hashing...")
+        self.sha256_value.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.signature_value = QLabel("")
+        form_layout.addRow("SHA-256:", self.sha256_value)
+        form_layout.addRow("Signature:", self.signature_value)
+        
+        self.fileHashed.connect(self.on_file_hashed)
+        file_hashes = shared_hash_cache()
+        entry = file_hashes.request(path, self.fileHashed.emit)
+        if entry is not None:
+            self.on_file_hashed(path, entry)
+        elif not file_hashes.pending(path):
+            # The file cannot be read, so no result will arrive
+            self.on_file_hashed(path, None)
+    
+    def on_file_hashed(self, path, entry):
+        """Show the computed hash of the executable."""
+        if entry is None:
+            self.sha256_value.setText("Unavailable")
+        else:
+            self.sha256_value.setText(entry['sha256'])
+            self.signature_value.setText(entry['signature'])
 
 class FilterBar(QWidget):
     """Filter bar for background items tables."""
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CPU cores tab for Windows System Manager.
+Displays per-core utilization and the core affinity of the busiest processes.
+"""
+
+import math
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+                            QLabel, QGroupBox, QTableWidget, QTableWidgetItem,
+                            QHeaderView, QSpinBox)
+from PyQt5.QtCore import Qt, QTimer, QRect, QThread, pyqtSignal
+from PyQt5.QtGui import QFont, QColor, QPainter, QPen
+
+from utils.cpu_utils import CoreHistory, get_top_affinities
+from utils.process_utils import get_process_registry
+from ui.process_tab import draw_sparkline
+
+# The affinity heatmap is rebuilt every this many core samples
+AFFINITY_TICKS = 3
+
+# Process data older than this is reported as stale
+STALE_SECONDS = 10.0
+
+def load_color(load):
+    """
+    Get the heatmap color of a load between 0 and 1.
+    
+    Args:
+        load: Fraction of the available cores in use
+    
+    Returns:
+        QColor: Pale blue for idle through dark red for saturated
+    """
+    load = max(0.0, min(1.0, load))
+    if load < 0.5:
+        # Pale blue to amber
+        t = load / 0.5
+        return QColor(int(200 + 55 * t), int(225 - 25 * t), int(255 - 175 * t))
+    t = (load - 0.5) / 0.5
+    return QColor(255, int(200 - 140 * t), int(80 - 40 * t))
+
+class CoreChart(QWidget):
+    """Grid of utilization sparklines, one per logical core."""
+    
+    def __init__(self, history, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.setMinimumHeight(160)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        cores = self.history.cores
+        columns = math.ceil(math.sqrt(cores * 2))
+        rows = math.ceil(cores / columns)
+        cell_width = self.width() // columns
+        cell_height = self.height() // rows
+        latest = self.history.latest()
+        
+        for core in range(cores):
+            cell = QRect((core % columns) * cell_width + 3, (core // columns) * cell_height + 2,
+                         cell_width - 6, cell_height - 4)
+            
+            painter.setPen(self.palette().color(self.foregroundRole()))
+            painter.drawText(cell.adjusted(0, 0, 0, -cell.height() + 16), Qt.AlignLeft,
+                             f"CPU {core}: {latest[core]:.0f}%")
+            
+            plot = cell.adjusted(0, 18, 0, 0)
+            painter.fillRect(plot, load_color(latest[core] / 100).lighter(115))
+            painter.setPen(QPen(QColor("#c0c0c0")))
+            painter.drawRect(plot)
+            draw_sparkline(painter, plot.adjusted(1, 1, -1, -1), self.history.series(core),
+                           QColor("#2a82da"), 100.0)
+
+class AffinityWorker(QThread):
+    """Worker thread that reads the core affinity of the busiest processes."""
+    
+    resultReady = pyqtSignal(object)
+    
+    def __init__(self, rows, top_n, parent=None):
+        super().__init__(parent)
+        self.rows = rows
+        self.top_n = top_n
+    
+    def run(self):
+        try:
+            self.resultReady.emit(get_top_affinities(self.rows, self.top_n))
+        except Exception as e:
+            print(f"Error reading process affinities: {str(e)}")
+
+class CpuTab(QWidget):
+    """CPU cores tab for Windows System Manager."""
+    
+    def __init__(self):
+        super().__init__()
+        # Two minutes of one second samples
+        self.history = CoreHistory(length=120)
+        self.registry = get_process_registry()
+        self.ticks = 0
+        self.affinity_worker = None
+        self.refresh_pending = False
+        self.init_ui()
+        
+        # Setup timer for core sampling (1 second)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.sample_cores)
+        self.refresh_timer.start(1000)
+    
+    def init_ui(self):
+        """Initialize the user interface."""
+        main_layout = QVBoxLayout(self)
+        
+        # Per-core utilization
+        cores_group = QGroupBox("Logical Cores")
+        cores_layout = QVBoxLayout(cores_group)
+        
+        self.summary_label = QLabel("Sampling...")
+        self.summary_label.setFont(QFont("Arial", 10, QFont.Bold))
+        cores_layout.addWidget(self.summary_label)
+        
+        self.core_chart = CoreChart(self.history)
+        cores_layout.addWidget(self.core_chart, 1)
+        main_layout.addWidget(cores_group, 3)
+        
+        # Affinity of the busiest processes; a cell is colored when the process may run on the core
+        affinity_group = QGroupBox("Core Affinity of Top CPU Processes")
+        affinity_layout = QVBoxLayout(affinity_group)
+        
+        options_layout = QHBoxLayout()
+        options_layout.addWidget(QLabel("Processes:"))
+        self.top_spin = QSpinBox()
+        self.top_spin.setRange(1, 50)
+        self.top_spin.setValue(10)
+        self.top_spin.valueChanged.connect(self.refresh)
+        options_layout.addWidget(self.top_spin)
+        options_layout.addStretch()
+        
+        self.refresh_btn = QPushButton("Refresh")
+        self.refresh_btn.clicked.connect(self.refresh)
+        options_layout.addWidget(self.refresh_btn)
+        affinity_layout.addLayout(options_layout)
+        
+        self.affinity_table = QTableWidget(0, 3 + self.history.cores)
+        self.affinity_table.setHorizontalHeaderLabels(
+            ["Process", "PID", "CPU %"] + [str(core) for core in range(self.history.cores)])
+        header = self.affinity_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, 3 + self.history.cores):
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        self.affinity_table.verticalHeader().setVisible(False)
+        self.affinity_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.affinity_table.setSelectionMode(QTableWidget.NoSelection)
+        affinity_layout.addWidget(self.affinity_table)
+        
+        self.findings_label = QLabel("")
+        self.findings_label.setWordWrap(True)
+        affinity_layout.addWidget(self.findings_label)
+        main_layout.addWidget(affinity_group, 2)
+    
+    def sample_cores(self):
+        """Sample all cores and redraw while the tab is shown."""
+        values = self.history.sample()
+        self.ticks += 1
+        if not self.isVisible():
+            return
+        
+        busiest = max(range(len(values)), key=lambda core: values[core]) if values else 0
+        average = sum(values) / len(values) if values else 0.0
+        self.summary_label.setText(
+            f"{self.history.cores} logical cores, {average:.0f}% average, "
+            f"busiest CPU {busiest} at {values[busiest] if values else 0:.0f}%")
+        self.core_chart.update()
+        
+        if self.ticks % AFFINITY_TICKS == 0:
+            self.refresh()
+    
+    def refresh(self):
+        """Read the affinities of the busiest processes on a worker thread."""
+        if self.affinity_worker is not None:
+            # Read again once the running read finishes
+            self.refresh_pending = True
+            return
+        
+        rows = self.registry.rows()
+        if not rows:
+            self.findings_label.setText("Waiting for process data...")
+            return
+        
+        self.affinity_worker = AffinityWorker(rows, self.top_spin.value(), self)
+        self.affinity_worker.resultReady.connect(self.show_affinities)
+        self.affinity_worker.finished.connect(self.on_affinity_finished)
+        self.affinity_worker.start()
+    
+    def on_affinity_finished(self):
+        """Allow the next affinity read."""
+        self.affinity_worker.deleteLater()
+        self.affinity_worker = None
+        if self.refresh_pending:
+            self.refresh_pending = False
+            self.refresh()
+    
+    def shutdown(self):
+        """Stop sampling and wait for an affinity read still running."""
+        self.refresh_timer.stop()
+        self.refresh_pending = False
+        if self.affinity_worker is not None:
+            self.affinity_worker.wait()
+    
+    def show_affinities(self, processes):
+        """Rebuild the affinity heatmap."""
+        cores = self.history.cores
+        load = self.history.latest()
+        findings = []
+        
+        # The rows are only updated while Process Monitor refreshes
+        age = self.registry.age()
+        if age is not None and age > STALE_SECONDS:
+            findings.append(f"Process data is {age:.0f} seconds old; turn on Auto Refresh in "
+                            f"Process Monitor or refresh it for current CPU usage.")
+        
+        self.affinity_table.setRowCount(len(processes))
+        for row, proc in enumerate(processes):
+            self.affinity_table.setItem(row, 0, QTableWidgetItem(proc['name']))
+            self.affinity_table.setItem(row, 1, QTableWidgetItem(str(proc['pid'])))
+            self.affinity_table.setItem(row, 2, QTableWidgetItem(f"{proc['cpu_percent']:.1f}%"))
+            
+            affinity = proc['affinity']
+            allowed = set(affinity) if affinity is not None else set()
+            for core in range(cores):
+                item = QTableWidgetItem("")
+                if affinity is None:
+                    item.setToolTip("Affinity not accessible")
+                elif core in allowed:
+                    # Shade by how much of the allowed cores the process uses
+                    share = proc['cpu_percent'] / (100 * len(allowed))
+                    item.setBackground(load_color(share))
+                    item.setToolTip(f"{proc['name']} may run on CPU {core} "
+                                    f"(core at {load[core]:.0f}%)")
+                else:
+                    item.setBackground(QColor("#e0e0e0"))
+                    item.setToolTip(f"{proc['name']} may not run on CPU {core}")
+                self.affinity_table.setItem(row, 3 + core, item)
+            
+            if affinity is not None and len(affinity) < cores:
+                findings.append(f"{proc['name']} (PID {proc['pid']}) is limited to "
+                                f"{len(affinity)} of {cores} cores.")
+            if proc['single_thread'] and cores > 1:
+                findings.append(f"{proc['name']} (PID {proc['pid']}) is using about one full core "
+                                f"and may be bound by a single thread.")
+        
+        self.findings_label.setText("\n".join(findings) if findings else
+                                    "No restricted affinity or single-thread bottlenecks among these processes.")
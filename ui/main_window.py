@@ -13,6 +13,7 @@ from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QIcon, QFont
 
 from ui.memory_tab import MemoryTab
+from ui.cpu_tab import CpuTab
 from ui.drive_tab import DriveTab
 from ui.process_tab import ProcessTab
 from ui.background_tab import BackgroundTab
@@ -53,6 +54,7 @@ class MainWindow(QMainWindow):
         
         # Add tabs
         self.memory_tab = MemoryTab()
+        self.cpu_tab = CpuTab()
         self.drive_tab = DriveTab()
         self.process_tab = ProcessTab()
         self.background_tab = BackgroundTab()
@@ -61,6 +63,7 @@ class MainWindow(QMainWindow):
         self.achievements_tab = AchievementsTab()
         
         self.tabs.addTab(self.memory_tab, get_icon("memory"), "Memory Management")
+        self.tabs.addTab(self.cpu_tab, get_icon("cpu"), "CPU Cores")
         self.tabs.addTab(self.drive_tab, get_icon("drive"), "Drive Management")
         self.tabs.addTab(self.process_tab, get_icon("process"), "Process Monitor")
         self.tabs.addTab(self.background_tab, get_icon("background"), "Background Tasks")
@@ -116,6 +119,12 @@ class MainWindow(QMainWindow):
         if hasattr(current_tab, 'refresh'):
             current_tab.refresh()
     
+    def closeEvent(self, event):
+        """Stop background workers before the window closes."""
+        self.process_tab.shutdown()
+        self.cpu_tab.shutdown()
+        super().closeEvent(event)
+    
     def show_about(self):
         """Show the about dialog."""
         QMessageBox.about(
@@ -126,6 +135,7 @@ class MainWindow(QMainWindow):
             "<p>Features:</p>"
             "<ul>"
             "<li>Memory optimization</li>"
+            "<li>Per-core CPU monitoring</li>"
             "<li>Drive management</li>"
             "<li>Process monitoring</li>"
             "<li>Background task inspection</li>"
@@ -6,25 +6,773 @@ Process monitoring tab for Windows System Manager.
 Lists running processes with their resource usage and provides process control.
 """
 
+import os
+
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                             QLabel, QProgressBar, QFrame, QGridLayout, QGroupBox,
-                            QMessageBox, QTableWidget, QTableWidgetItem, QHeaderView,
+                            QMessageBox, QTableView, QHeaderView, QAbstractItemView,
                             QLineEdit, QComboBox, QMenu, QAction, QCheckBox,
-                            QApplication)
-from PyQt5.QtCore import Qt, QTimer, QDateTime, QSortFilterProxyModel, pyqtSignal
-from PyQt5.QtGui import QFont, QIcon, QCursor
+                            QApplication, QStyledItemDelegate, QStyle, QTreeView,
+                            QStackedWidget, QTabWidget, QTableWidget, QTableWidgetItem)
+from PyQt5.QtCore import (Qt, QTimer, QDateTime, QSortFilterProxyModel, pyqtSignal, QThread,
+                          QAbstractTableModel, QAbstractItemModel, QModelIndex, QPointF,
+                          QItemSelectionModel)
+from PyQt5.QtGui import QFont, QIcon, QCursor, QPainter, QPen, QColor, QPolygonF
 
-from utils.process_utils import (get_processes, kill_process, get_process_details, 
-                               set_process_priority)
+from utils.process_utils import (get_process_registry, kill_processes, set_process_priority)
+from utils.process_history import ProcessHistory
+from utils.process_tree import ProcessTree
+from utils.process_groups import ProcessGroups, ProcessGroup
+from utils.process_connections import ConnectionIndex, describe_connection
+from utils.process_search import ProcessSearchIndex
+from utils.process_anomaly import RunawayDetector, load_runaway_settings
+from utils.process_rules import ProcessRuleEngine
+from utils.process_limiter import CpuLimiter
+from utils.process_freezer import ProcessFreezer, collect_tree, collect_group
+from utils.process_threads import ThreadSampler
+from utils.process_memory_maps import MemoryMapCache, CancelToken
+from utils.process_sampler import LaneScheduler, PinnedSampler
+from utils.process_leaks import LeakTrendTracker
+from utils.file_hashes import shared_hash_cache
 import traceback
 
+# Model role carrying a row's (pid, create_time) identity
+KEY_ROLE = Qt.UserRole + 1
+
+# Disk I/O above this rate counts as high (1 MB/s)
+HIGH_DISK_IO_BYTES = 1024 * 1024
+
+# Number of busiest threads highlighted in the thread table
+TOP_THREADS = 3
+
+# Sampling interval of pinned processes, in seconds
+PINNED_INTERVAL = 0.25
+
+# Interval at which new processes are added to the search index, in seconds
+SEARCH_INDEX_INTERVAL = 3.0
+
+def format_rate(bytes_per_sec):
+    """Format a byte rate for display."""
+    if bytes_per_sec < 1024:
+        return f"{bytes_per_sec:.0f} B/s"
+    
+    rate_names = ("KB/s", "MB/s", "GB/s")
+    i = 0
+    bytes_per_sec /= 1024
+    while bytes_per_sec >= 1024 and i < len(rate_names) - 1:
+        bytes_per_sec /= 1024
+        i += 1
+    
+    return f"{bytes_per_sec:.1f} {rate_names[i]}"
+
+def draw_sparkline(painter, rect, values, color, floor=1.0):
+    """
+    Draw a series of values as a line scaled to fit a rectangle.
+    
+    Args:
+        painter: Active QPainter
+        rect: Target QRect
+        values: Samples, oldest first
+        color: Line color
+        floor: Minimum top of the vertical scale
+    """
+    if len(values) < 2 or rect.width() < 2 or rect.height() < 2:
+        return
+    
+    top = max(max(values), floor)
+    step = rect.width() / (len(values) - 1)
+    points = QPolygonF([
+        QPointF(rect.left() + i * step, rect.bottom() - (value / top) * rect.height())
+        for i, value in enumerate(values)
+    ])
+    
+    painter.save()
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(QPen(color, 1.2))
+    painter.drawPolyline(points)
+    painter.restore()
+
+class ProcessCollector(QThread):
+    """Worker thread that samples the process registry and streams deltas."""
+    
+    batchReady = pyqtSignal(object)
+    runawaysDetected = pyqtSignal(object)
+    rulesApplied = pyqtSignal(object)
+    collectionFailed = pyqtSignal(str)
+    
+    def __init__(self, registry, history, search_index, detector, rule_engine, parent=None):
+        super().__init__(parent)
+        self.registry = registry
+        self.history = history
+        self.search_index = search_index
+        self.detector = detector
+        self.rule_engine = rule_engine
+        self._rule_reports = []
+    
+    def run(self):
+        """Run one registry update, emitting each partial delta as it is ready."""
+        try:
+            self._rule_reports = []
+            self.history.begin_tick()
+            self.registry.update(on_batch=self.on_batch)
+            
+            # Every live process is sampled, including those whose row did not change
+            runaways = self.detector.sample(self.registry.rows())
+            if runaways:
+                self.runawaysDetected.emit(runaways)
+            if self._rule_reports:
+                self.rulesApplied.emit(self._rule_reports)
+        except Exception as e:
+            self.collectionFailed.emit(str(e))
+    
+    def on_batch(self, delta):
+        """Record a partial delta in the history and pass it to the GUI thread."""
+        self.history.apply_delta(delta)
+        self._rule_reports.extend(self.rule_engine.apply_delta(delta))
+        self.search_index.forget(delta.exited)
+        self.batchReady.emit(delta)
+
+class ThreadCollector(QThread):
+    """Worker thread that samples the threads of the selected process."""
+    
+    sampleReady = pyqtSignal(object, object)
+    sampleFailed = pyqtSignal(object, str)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sampler = None
+    
+    def run(self):
+        sampler = self.sampler
+        try:
+            self.sampleReady.emit(sampler.key, sampler.sample())
+        except Exception as e:
+            self.sampleFailed.emit(sampler.key, str(e))
+
+class ProcessActionWorker(QThread):
+    """Worker thread that runs one process action and reports its result."""
+    
+    resultReady = pyqtSignal(object)
+    actionFailed = pyqtSignal(str)
+    
+    def __init__(self, action, args=(), kwargs=None, parent=None):
+        super().__init__(parent)
+        self.action = action
+        self.args = args
+        self.kwargs = kwargs or {}
+    
+    def run(self):
+        try:
+            self.resultReady.emit(self.action(*self.args, **self.kwargs))
+        except Exception as e:
+            self.actionFailed.emit(str(e))
+
+class SparklineDelegate(QStyledItemDelegate):
+    """Paints a process's recent history of one metric inside a table cell."""
+    
+    def __init__(self, history, metric, color, floor=1.0, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.metric = metric
+        self.color = QColor(color)
+        self.floor = floor
+    
+    def paint(self, painter, option, index):
+        # Let the style draw selection and alternating backgrounds
+        option.text = ""
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+        
+        key = index.data(KEY_ROLE)
+        if key is None:
+            return
+        rect = option.rect.adjusted(3, 3, -3, -3)
+        draw_sparkline(painter, rect, self.history.series(key, self.metric), self.color, self.floor)
+
+class HistoryChart(QWidget):
+    """Mini chart of a process's CPU, memory and disk I/O history."""
+    
+    SERIES = [
+        ('cpu', "CPU %", "#2a82da", 10.0),
+        ('rss', "Memory MB", "#2e8b57", 1.0),
+        ('io', "Disk I/O B/s", "#d2691e", 1024.0)
+    ]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.series = {}
+        self.caption = ""
+        self.setMinimumHeight(90)
+    
+    def set_series(self, series, caption=""):
+        """Set the samples to draw, as a dict of metric -> values."""
+        self.series = series
+        self.caption = caption
+        self.update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        band_width = self.width() // len(self.SERIES)
+        
+        for i, (metric, title, color, floor) in enumerate(self.SERIES):
+            band = self.rect().adjusted(i * band_width + 4, 0, 0, 0)
+            band.setWidth(band_width - 8)
+            values = self.series.get(metric, [])
+            latest = f"{values[-1]:.1f}" if values else "-"
+            if self.caption:
+                title = f"{title} ({self.caption})"
+            
+            painter.setPen(self.palette().color(self.foregroundRole()))
+            painter.drawText(band.adjusted(0, 0, 0, -band.height() + 16), Qt.AlignLeft, f"{title}: {latest}")
+            
+            plot = band.adjusted(0, 18, 0, -2)
+            painter.setPen(QPen(QColor("#c0c0c0")))
+            painter.drawRect(plot)
+            draw_sparkline(painter, plot.adjusted(1, 1, -1, -1), values, QColor(color), floor)
+
+class ProcessTableModel(QAbstractTableModel):
+    """Table model of running processes, updated in place from registry deltas."""
+    
+    COLUMNS = ["PID", "Name", "CPU %", "Memory Usage", "Disk Read", "Disk Write",
+               "Read Ops/s", "Write Ops/s", "Conns", "Handle Growth", "Status", "Type",
+               "CPU History", "Memory History"]
+    
+    # Process dictionary field behind each column; history columns sort by the latest sample
+    FIELDS = {
+        "PID": 'pid',
+        "Name": 'name',
+        "CPU %": 'cpu_percent',
+        "Memory Usage": 'memory_mb',
+        "Disk Read": 'io_read_bytes_per_sec',
+        "Disk Write": 'io_write_bytes_per_sec',
+        "Read Ops/s": 'io_read_ops_per_sec',
+        "Write Ops/s": 'io_write_ops_per_sec',
+        "Status": 'status',
+        "Type": 'type',
+        "CPU History": 'cpu_percent',
+        "Memory History": 'memory_mb'
+    }
+    
+    def __init__(self, connections=None, detector=None, limiter=None, pinned=None, leaks=None,
+                 freezer=None, parent=None):
+        super().__init__(parent)
+        self.connections = connections if connections is not None else ConnectionIndex()
+        self.detector = detector if detector is not None else RunawayDetector()
+        self.limiter = limiter if limiter is not None else CpuLimiter()
+        self.pinned = pinned
+        self.leaks = leaks if leaks is not None else LeakTrendTracker()
+        self.freezer = freezer if freezer is not None else ProcessFreezer()
+        self._rows = []   # process dictionaries in insertion order
+        self._search = [] # (lowercase name, PID text) per row, for filtering
+        self._index = {}  # (pid, create_time) -> row number
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        proc = self._rows[index.row()]
+        column = self.COLUMNS[index.column()]
+        
+        if role == Qt.DisplayRole:
+            if column == "PID":
+                return str(proc['pid'])
+            elif column == "CPU %":
+                return f"{proc['cpu_percent']:.1f}%"
+            elif column == "Memory Usage":
+                return f"{proc['memory_mb']:.1f} MB"
+            elif column in ("Disk Read", "Disk Write"):
+                return format_rate(proc[self.FIELDS[column]])
+            elif column in ("Read Ops/s", "Write Ops/s"):
+                return f"{proc[self.FIELDS[column]]:.0f}"
+            elif column == "Conns":
+                return str(self.connections.count(proc['pid']))
+            elif column == "Handle Growth":
+                growth = self.leaks.growth((proc['pid'], proc['create_time']))
+                return f"{growth[0]:+.1f}/h" if growth is not None else ""
+            elif column == "Status":
+                if self.freezer.is_frozen((proc['pid'], proc['create_time'])):
+                    return "frozen"
+                limit = self.limiter.limit((proc['pid'], proc['create_time']))
+                if limit is not None:
+                    return f"{proc['status']} (limited to {limit:g}%)"
+                return proc['status']
+            elif column in ("Name", "Type"):
+                return proc[self.FIELDS[column]]
+        
+        elif role == Qt.UserRole:
+            # Raw values used for sorting
+            if column == "Conns":
+                return self.connections.count(proc['pid'])
+            if column == "Handle Growth":
+                growth = self.leaks.growth((proc['pid'], proc['create_time']))
+                return growth[0] if growth is not None else 0.0
+            value = proc[self.FIELDS[column]]
+            return value.lower() if isinstance(value, str) else value
+        
+        elif role == KEY_ROLE:
+            return (proc['pid'], proc['create_time'])
+        
+        elif role == Qt.ForegroundRole and self.is_suspended(proc):
+            # Frozen and suspended processes are greyed out
+            return QColor("#6b7b8c")
+        
+        elif role == Qt.ForegroundRole and column == "CPU %":
+            # Colorize high CPU usage
+            if proc['cpu_percent'] > 50:
+                return Qt.red
+            elif proc['cpu_percent'] > 20:
+                return Qt.darkYellow
+        
+        elif role == Qt.ForegroundRole and column == "Handle Growth":
+            # Colorize steady handle or thread growth
+            growth = self.leaks.growth((proc['pid'], proc['create_time']))
+            if growth is not None and growth[2]:
+                return QColor("#d2691e")
+        
+        elif role == Qt.FontRole:
+            # Pinned processes are shown in bold
+            if self.pinned is not None and self.pinned.is_pinned((proc['pid'], proc['create_time'])):
+                font = QFont()
+                font.setBold(True)
+                return font
+        
+        elif role == Qt.BackgroundRole:
+            # Highlight suspended and runaway processes
+            if self.is_suspended(proc):
+                return QColor("#dde6f0")
+            if self.detector.reason((proc['pid'], proc['create_time'])):
+                return QColor("#ffd6d6")
+        
+        elif role == Qt.ToolTipRole:
+            if column == "Handle Growth":
+                growth = self.leaks.growth((proc['pid'], proc['create_time']))
+                if growth is not None:
+                    text = f"Handles {growth[0]:+.1f}/h, threads {growth[1]:+.1f}/h"
+                    return text + " (growing steadily)" if growth[2] else text
+            group = self.freezer.group_of((proc['pid'], proc['create_time']))
+            if group is not None:
+                return f"Frozen with {group.name}"
+            reason = self.detector.reason((proc['pid'], proc['create_time']))
+            if reason:
+                return f"Runaway process: {reason}"
+        
+        return None
+    
+    def is_suspended(self, proc):
+        """Check whether a process is frozen here or suspended by anything else."""
+        return proc['status'] == 'stopped' or self.freezer.is_frozen((proc['pid'], proc['create_time']))
+    
+    def process_at(self, row):
+        """Get the process dictionary for a model row."""
+        return self._rows[row]
+    
+    def process_for_key(self, key):
+        """Get the process dictionary for a (pid, create_time) identity, if shown."""
+        row = self._index.get(key)
+        return self._rows[row] if row is not None else None
+    
+    def column_changed(self, name):
+        """Refresh a column whose values come from outside the process rows."""
+        if self._rows:
+            column = self.COLUMNS.index(name)
+            self.dataChanged.emit(self.index(0, column), self.index(len(self._rows) - 1, column))
+    
+    def search_key(self, row):
+        """Get the precomputed (lowercase name, PID text) of a model row."""
+        return self._search[row]
+    
+    def key_at(self, row):
+        """Get the (pid, create_time) identity of a model row."""
+        proc = self._rows[row]
+        return (proc['pid'], proc['create_time'])
+    
+    def apply_delta(self, delta):
+        """
+        Apply a registry delta, touching only the rows that changed.
+        
+        Args:
+            delta: ProcessDelta with added, changed and exited processes
+        """
+        last_column = len(self.COLUMNS) - 1
+        
+        for proc in delta.changed:
+            row = self._index.get((proc['pid'], proc['create_time']))
+            if row is None:
+                continue
+            self._rows[row] = proc
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+        
+        if delta.exited:
+            removed = sorted((self._index[key] for key in delta.exited if key in self._index),
+                             reverse=True)
+            for row in removed:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                del self._search[row]
+                self.endRemoveRows()
+            
+            # Only rows after the first removed one have moved
+            if removed:
+                for key in delta.exited:
+                    self._index.pop(key, None)
+                for row in range(removed[-1], len(self._rows)):
+                    proc = self._rows[row]
+                    self._index[(proc['pid'], proc['create_time'])] = row
+        
+        added = [proc for proc in delta.added
+                 if (proc['pid'], proc['create_time']) not in self._index]
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            for row, proc in enumerate(added, first):
+                self._rows.append(proc)
+                self._search.append((proc['name'].lower(), str(proc['pid'])))
+                self._index[(proc['pid'], proc['create_time'])] = row
+            self.endInsertRows()
+
+class ProcessTreeModel(QAbstractItemModel):
+    """
+    Tree model of processes by parent, with CPU, memory and thread totals per subtree.
+    
+    The model acts as the ProcessTree's listener, so structural changes
+    from a delta arrive as row insert/remove notifications and total
+    changes as dataChanged on the affected ancestors.
+    """
+    
+    COLUMNS = ["Name", "PID", "Total CPU %", "Total Memory", "Total Threads"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tree = ProcessTree(listener=self)
+        self.built = False
+    
+    def populate(self, rows):
+        """Build the tree from a full snapshot."""
+        self.beginResetModel()
+        self.tree.build(rows)
+        self.built = True
+        self.endResetModel()
+    
+    def apply_delta(self, delta):
+        """Apply a registry delta once the tree has been built."""
+        if self.built:
+            self.tree.apply_delta(delta)
+    
+    def node_at(self, index):
+        """Get the tree node of a model index."""
+        return index.internalPointer() if index.isValid() else None
+    
+    def index(self, row, column, parent=QModelIndex()):
+        parent_node = self.node_at(parent)
+        children = parent_node.children if parent_node is not None else self.tree.roots
+        if 0 <= row < len(children) and 0 <= column < len(self.COLUMNS):
+            return self.createIndex(row, column, children[row])
+        return QModelIndex()
+    
+    def parent(self, index):
+        node = self.node_at(index)
+        if node is None or node.parent is None:
+            return QModelIndex()
+        return self._index_of(node.parent)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        parent_node = self.node_at(parent)
+        return len(parent_node.children if parent_node is not None else self.tree.roots)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        node = self.node_at(index)
+        if node is None:
+            return None
+        
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return node.row['name']
+            elif column == 1:
+                return str(node.row['pid'])
+            elif column == 2:
+                return f"{node.totals['cpu_percent']:.1f}%"
+            elif column == 3:
+                return f"{node.totals['memory_mb']:.1f} MB"
+            elif column == 4:
+                return str(node.totals['num_threads'])
+        
+        elif role == Qt.UserRole:
+            # Raw values used for sorting
+            if column == 0:
+                return node.row['name'].lower()
+            elif column == 1:
+                return node.row['pid']
+            elif column == 2:
+                return node.totals['cpu_percent']
+            elif column == 3:
+                return node.totals['memory_mb']
+            elif column == 4:
+                return node.totals['num_threads']
+        
+        elif role == KEY_ROLE:
+            return node.key
+        
+        return None
+    
+    def _index_of(self, node, column=0):
+        """Get the model index of a node."""
+        if node is None:
+            return QModelIndex()
+        siblings = node.parent.children if node.parent is not None else self.tree.roots
+        return self.createIndex(siblings.index(node), column, node)
+    
+    # ProcessTree listener interface
+    
+    def begin_insert(self, parent, row):
+        self.beginInsertRows(self._index_of(parent), row, row)
+    
+    def end_insert(self):
+        self.endInsertRows()
+    
+    def begin_remove(self, parent, row):
+        self.beginRemoveRows(self._index_of(parent), row, row)
+    
+    def end_remove(self):
+        self.endRemoveRows()
+    
+    def node_changed(self, node):
+        self.dataChanged.emit(self._index_of(node, 2), self._index_of(node, len(self.COLUMNS) - 1))
+
+class ProcessGroupModel(QAbstractItemModel):
+    """
+    Two-level model of processes grouped by image name, with summed usage per group.
+    
+    Like ProcessTreeModel, the model is the ProcessGroups listener, so
+    deltas arrive as row insert/remove notifications and dataChanged on
+    the affected groups and members.
+    """
+    
+    COLUMNS = ["Name", "Count", "CPU %", "Memory", "Threads"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.groups = ProcessGroups(listener=self)
+        self.built = False
+    
+    def populate(self, rows):
+        """Group a full snapshot."""
+        self.beginResetModel()
+        self.groups.build(rows)
+        self.built = True
+        self.endResetModel()
+    
+    def apply_delta(self, delta):
+        """Apply a registry delta once the groups have been built."""
+        if self.built:
+            self.groups.apply_delta(delta)
+    
+    def node_at(self, index):
+        """Get the group or member of a model index."""
+        return index.internalPointer() if index.isValid() else None
+    
+    def processes_at(self, index):
+        """Get the process dictionaries of a group or member index."""
+        node = self.node_at(index)
+        if isinstance(node, ProcessGroup):
+            return [member.row for member in node.members]
+        return [node.row] if node is not None else []
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if not 0 <= column < len(self.COLUMNS):
+            return QModelIndex()
+        group = self.node_at(parent)
+        if group is None:
+            if 0 <= row < len(self.groups.groups):
+                return self.createIndex(row, column, self.groups.groups[row])
+        elif isinstance(group, ProcessGroup) and 0 <= row < len(group.members):
+            return self.createIndex(row, column, group.members[row])
+        return QModelIndex()
+    
+    def parent(self, index):
+        node = self.node_at(index)
+        if node is None or isinstance(node, ProcessGroup):
+            return QModelIndex()
+        return self._index_of(node.group)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        node = self.node_at(parent)
+        if node is None:
+            return len(self.groups.groups)
+        return len(node.members) if isinstance(node, ProcessGroup) else 0
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        node = self.node_at(index)
+        if node is None:
+            return None
+        
+        column = index.column()
+        is_group = isinstance(node, ProcessGroup)
+        values = node.totals if is_group else node.row
+        
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return node.name if is_group else node.row['name']
+            elif column == 1:
+                return str(len(node)) if is_group else f"PID {node.row['pid']}"
+            elif column == 2:
+                return f"{values['cpu_percent']:.1f}%"
+            elif column == 3:
+                return f"{values['memory_mb']:.1f} MB"
+            elif column == 4:
+                return str(values['num_threads'])
+        
+        elif role == Qt.UserRole:
+            # Raw values used for sorting
+            if column == 0:
+                return (node.name if is_group else node.row['name']).lower()
+            elif column == 1:
+                return len(node) if is_group else node.row['pid']
+            elif column == 2:
+                return values['cpu_percent']
+            elif column == 3:
+                return values['memory_mb']
+            elif column == 4:
+                return values['num_threads']
+        
+        elif role == KEY_ROLE and not is_group:
+            return node.key
+        
+        return None
+    
+    def _index_of(self, node, column=0):
+        """Get the model index of a group or member."""
+        if node is None:
+            return QModelIndex()
+        if isinstance(node, ProcessGroup):
+            return self.createIndex(self.groups.groups.index(node), column, node)
+        return self.createIndex(node.group.members.index(node), column, node)
+    
+    # ProcessGroups listener interface
+    
+    def begin_insert(self, parent, row):
+        self.beginInsertRows(self._index_of(parent), row, row)
+    
+    def end_insert(self):
+        self.endInsertRows()
+    
+    def begin_remove(self, parent, row):
+        self.beginRemoveRows(self._index_of(parent), row, row)
+    
+    def end_remove(self):
+        self.endRemoveRows()
+    
+    def node_changed(self, node):
+        self.dataChanged.emit(self._index_of(node, 1), self._index_of(node, len(self.COLUMNS) - 1))
+
+class ProcessFilterProxyModel(QSortFilterProxyModel):
+    """Sorts the process model and filters it by text and process type."""
+    
+    def __init__(self, search_index=None, parent=None):
+        super().__init__(parent)
+        self.search_index = search_index if search_index is not None else ProcessSearchIndex()
+        self.search_matches = set()
+        self.filter_text = ""
+        self.filter_type = "All"
+        self.setSortRole(Qt.UserRole)
+        self.setDynamicSortFilter(True)
+    
+    def set_filter(self, text, filter_type):
+        """Set the filter text and type."""
+        text = text.strip().lower()
+        if text == self.filter_text and filter_type == self.filter_type:
+            return
+        
+        self.filter_text = text
+        self.filter_type = filter_type
+        self.search_matches = self.search_index.query(text)
+        self.invalidateFilter()
+    
+    def search_index_changed(self):
+        """Re-run the text filter after more processes were indexed."""
+        if self.filter_text:
+            self.search_matches = self.search_index.query(self.filter_text)
+            self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        
+        # Text filter against the model's precomputed name and PID, then the
+        # path and command line index
+        if self.filter_text:
+            name, pid = model.search_key(source_row)
+            if (self.filter_text not in name and self.filter_text not in pid and
+                    model.key_at(source_row) not in self.search_matches):
+                return False
+        
+        proc = model.process_at(source_row)
+        
+        # Type filter
+        if self.filter_type == "High CPU":
+            return proc['cpu_percent'] > 5.0  # Show processes using more than 5% CPU
+        elif self.filter_type == "High Memory":
+            return proc['memory_mb'] > 100.0  # Show processes using more than 100MB
+        elif self.filter_type == "High Disk I/O":
+            return proc['io_bytes_per_sec'] > HIGH_DISK_IO_BYTES
+        elif self.filter_type == "System Processes":
+            return proc['type'] == "System"
+        elif self.filter_type == "User Processes":
+            return proc['type'] == "User"
+        elif self.filter_type == "Runaway Processes":
+            return model.detector.reason((proc['pid'], proc['create_time'])) is not None
+        elif self.filter_type == "Possible Leaks":
+            growth = model.leaks.growth((proc['pid'], proc['create_time']))
+            return growth is not None and growth[2]
+        elif self.filter_type == "Suspended Processes":
+            return model.is_suspended(proc)
+        
+        return True
+
 class ProcessFilterWidget(QWidget):
     """Widget for filtering processes in the table."""
     
     filterChanged = pyqtSignal(str, str)
     
+    # Delay before a typed filter is applied
+    DEBOUNCE_MS = 250
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.on_filter_changed)
         self.init_ui()
     
     def init_ui(self):
@@ -36,12 +784,14 @@ class ProcessFilterWidget(QWidget):
         layout.addWidget(self.filter_label)
         
         self.filter_text = QLineEdit()
-        self.filter_text.setPlaceholderText("Enter process name or PID")
-        self.filter_text.textChanged.connect(self.on_filter_changed)
+        self.filter_text.setPlaceholderText("Enter process name, PID, path or command line")
+        self.filter_text.textChanged.connect(self.debounce_timer.start)
         layout.addWidget(self.filter_text)
         
         self.filter_type = QComboBox()
-        self.filter_type.addItems(["All", "High CPU", "High Memory", "System Processes", "User Processes"])
+        self.filter_type.addItems(["All", "High CPU", "High Memory", "High Disk I/O",
+                                   "System Processes", "User Processes", "Runaway Processes",
+                                   "Possible Leaks", "Suspended Processes"])
         self.filter_type.currentTextChanged.connect(self.on_filter_changed)
         layout.addWidget(self.filter_type)
         
@@ -51,6 +801,7 @@ class ProcessFilterWidget(QWidget):
     
     def on_filter_changed(self, *args):
         """Emit signal when filter changes."""
+        self.debounce_timer.stop()
         self.filterChanged.emit(
             self.filter_text.text(),
             self.filter_type.currentText()
@@ -64,12 +815,85 @@ class ProcessFilterWidget(QWidget):
 class ProcessTab(QWidget):
     """Process monitoring tab for Windows System Manager."""
     
+    # Emitted from the sampling scheduler's threads
+    pinnedSampled = pyqtSignal()
+    searchIndexed = pyqtSignal()
+    connectionsRefreshed = pyqtSignal()
+    leaksSampled = pyqtSignal()
+    
+    # Emitted from the file hash pool
+    fileHashed = pyqtSignal(str, object)
+    
     def __init__(self):
         super().__init__()
-        self.process_list = []
         self.selected_pid = None
+        self.selected_key = None
+        self.last_updated = None
+        self.action_workers = set()
+        
+        # 10 minutes of samples at the 3 second refresh interval
+        self.history = ProcessHistory(length=200)
+        
+        # Connections are re-indexed every 10 seconds rather than every refresh
+        self.connections = ConnectionIndex(max_age=10.0)
+        self.search_index = ProcessSearchIndex()
+        self.detector = RunawayDetector(**load_runaway_settings())
+        self.rule_engine = ProcessRuleEngine()
+        self.limiter = CpuLimiter()
+        self.freezer = ProcessFreezer(self.limiter)
+        
+        # Pinned processes keep a separate one minute history at 250 ms
+        self.fast_history = ProcessHistory(length=240, max_processes=16)
+        self.pinned = PinnedSampler(self.fast_history)
+        
+        # Handle and thread counts are trended over two hours of one minute samples
+        self.leaks = LeakTrendTracker(interval=60.0, window=120)
+        
+        # Executable hashes are shared with the other tabs and kept across sessions
+        self.file_hashes = shared_hash_cache()
+        self.fileHashed.connect(self.on_file_hashed)
         self.init_ui()
         
+        # Threads of the selected process are sampled only while the Threads tab is shown
+        self.thread_sampler = None
+        self.thread_collector = ThreadCollector(self)
+        self.thread_collector.sampleReady.connect(self.on_thread_sample)
+        self.thread_collector.sampleFailed.connect(self.on_thread_sample_failed)
+        self.thread_timer = QTimer(self)
+        self.thread_timer.timeout.connect(self.sample_threads)
+        self.thread_timer.setInterval(1000)
+        self.details_tabs.currentChanged.connect(self.update_thread_sampling)
+        
+        # Memory maps are read on demand when their tab is shown
+        self.memory_maps = MemoryMapCache(ttl=30.0)
+        self.memory_map_cancel = None
+        self.memory_map_key = None
+        self.details_tabs.currentChanged.connect(self.update_memory_map)
+        
+        # Process collection runs on a worker thread; a tick never overlaps a running pass
+        self.registry = get_process_registry()
+        self.collector = ProcessCollector(self.registry, self.history, self.search_index,
+                                          self.detector, self.rule_engine, self)
+        self.collector.batchReady.connect(self.on_process_batch)
+        self.collector.runawaysDetected.connect(self.on_runaways_detected)
+        self.collector.rulesApplied.connect(self.on_rules_applied)
+        self.collector.collectionFailed.connect(self.on_collection_failed)
+        self.collector.finished.connect(self.on_collection_finished)
+        
+        # Faster and slower tiers than the table refresh run as scheduler lanes: pinned
+        # processes every 250 ms, the search index every 3 seconds, the connection index
+        # every 10 seconds and leak trends every minute
+        self.pinnedSampled.connect(self.on_pinned_sampled)
+        self.searchIndexed.connect(self.proxy_model.search_index_changed)
+        self.connectionsRefreshed.connect(self.on_connections_updated)
+        self.scheduler = LaneScheduler()
+        self.leaksSampled.connect(self.on_leaks_sampled)
+        self.scheduler.add_lane("search", SEARCH_INDEX_INTERVAL, self.index_new_processes,
+                                priority=1, background=True)
+        self.scheduler.add_lane("connections", self.connections.max_age, self.refresh_connections,
+                                priority=1, background=True)
+        self.scheduler.add_lane("leaks", self.leaks.interval, self.sample_leaks, priority=2, background=True)
+        
         # Setup timer for auto-refresh (3 seconds)
         self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self.refresh)
@@ -87,26 +911,125 @@ class ProcessTab(QWidget):
         self.filter_widget.filterChanged.connect(self.apply_filter)
         main_layout.addWidget(self.filter_widget)
         
-        # Process table
-        self.process_table = QTableWidget()
-        self.process_table.setColumnCount(6)
-        self.process_table.setHorizontalHeaderLabels([
-            "PID", "Name", "CPU %", "Memory Usage", "Status", "Type"
-        ])
-        self.process_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.process_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.process_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # Notification banner for newly detected runaway processes
+        self.runaway_banner = QFrame()
+        self.runaway_banner.setStyleSheet("background-color: #ffd6d6; border-radius: 4px;")
+        banner_layout = QHBoxLayout(self.runaway_banner)
+        banner_layout.setContentsMargins(8, 4, 8, 4)
+        self.runaway_label = QLabel("")
+        self.runaway_label.setWordWrap(True)
+        banner_layout.addWidget(self.runaway_label, 1)
+        self.runaway_dismiss_btn = QPushButton("Dismiss")
+        self.runaway_dismiss_btn.clicked.connect(self.runaway_banner.hide)
+        banner_layout.addWidget(self.runaway_dismiss_btn)
+        self.runaway_banner.hide()
+        main_layout.addWidget(self.runaway_banner)
+        
+        # Reminder of frozen process groups, shown while any are frozen
+        self.frozen_banner = QFrame()
+        self.frozen_banner.setStyleSheet("background-color: #dde6f0; border-radius: 4px;")
+        frozen_layout = QHBoxLayout(self.frozen_banner)
+        frozen_layout.setContentsMargins(8, 4, 8, 4)
+        self.frozen_label = QLabel("")
+        self.frozen_label.setWordWrap(True)
+        frozen_layout.addWidget(self.frozen_label, 1)
+        self.resume_all_btn = QPushButton("Resume All")
+        self.resume_all_btn.clicked.connect(self.resume_all_frozen)
+        frozen_layout.addWidget(self.resume_all_btn)
+        self.frozen_banner.hide()
+        main_layout.addWidget(self.frozen_banner)
+        
+        # Process table; rows are updated in place, the proxy handles sorting and filtering
+        self.process_model = ProcessTableModel(self.connections, self.detector, self.limiter,
+                                               self.pinned, self.leaks, self.freezer, self)
+        self.proxy_model = ProcessFilterProxyModel(self.search_index, self)
+        self.proxy_model.setSourceModel(self.process_model)
+        
+        self.process_table = QTableView()
+        self.process_table.setModel(self.proxy_model)
+        self.process_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.process_table.horizontalHeader().setDefaultSectionSize(90)
+        self.process_table.horizontalHeader().setStretchLastSection(True)
+        self.process_table.setColumnWidth(ProcessTableModel.COLUMNS.index("Name"), 200)
+        self.process_table.verticalHeader().setVisible(False)
+        self.process_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.process_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.process_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.process_table.setAlternatingRowColors(True)
         self.process_table.setSortingEnabled(True)
+        self.process_table.sortByColumn(0, Qt.AscendingOrder)
         self.process_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.process_table.customContextMenuRequested.connect(self.show_context_menu)
-        self.process_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.process_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        
+        # Sparkline columns draw straight from the history buffers
+        self.process_table.setItemDelegateForColumn(
+            ProcessTableModel.COLUMNS.index("CPU History"),
+            SparklineDelegate(self.history, 'cpu', "#2a82da", 10.0, self.process_table))
+        self.process_table.setItemDelegateForColumn(
+            ProcessTableModel.COLUMNS.index("Memory History"),
+            SparklineDelegate(self.history, 'rss', "#2e8b57", 1.0, self.process_table))
+        
+        # Keep the visible count current as the proxy adds and drops rows
+        self.proxy_model.rowsInserted.connect(self.update_status)
+        self.proxy_model.rowsRemoved.connect(self.update_status)
+        self.proxy_model.modelReset.connect(self.update_status)
+        self.proxy_model.layoutChanged.connect(self.update_status)
+        
+        # Process tree, built on first use and then kept current from deltas
+        self.tree_model = ProcessTreeModel(self)
+        self.tree_proxy = QSortFilterProxyModel(self)
+        self.tree_proxy.setSourceModel(self.tree_model)
+        self.tree_proxy.setSortRole(Qt.UserRole)
+        self.tree_proxy.setDynamicSortFilter(True)
+        
+        self.process_tree = QTreeView()
+        self.process_tree.setModel(self.tree_proxy)
+        self.process_tree.setColumnWidth(0, 260)
+        self.process_tree.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.process_tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.process_tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.process_tree.setAlternatingRowColors(True)
+        self.process_tree.setSortingEnabled(True)
+        self.process_tree.sortByColumn(0, Qt.AscendingOrder)
+        self.process_tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.process_tree.customContextMenuRequested.connect(self.show_context_menu)
+        self.process_tree.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        
+        # Processes grouped by image name, built on first use like the tree
+        self.group_model = ProcessGroupModel(self)
+        self.group_proxy = QSortFilterProxyModel(self)
+        self.group_proxy.setSourceModel(self.group_model)
+        self.group_proxy.setSortRole(Qt.UserRole)
+        self.group_proxy.setDynamicSortFilter(True)
         
-        main_layout.addWidget(self.process_table)
+        self.process_groups = QTreeView()
+        self.process_groups.setModel(self.group_proxy)
+        self.process_groups.setColumnWidth(0, 260)
+        self.process_groups.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.process_groups.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.process_groups.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.process_groups.setAlternatingRowColors(True)
+        self.process_groups.setSortingEnabled(True)
+        self.process_groups.sortByColumn(2, Qt.DescendingOrder)
+        self.process_groups.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.process_groups.customContextMenuRequested.connect(self.show_context_menu)
+        self.process_groups.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        
+        self.process_views = QStackedWidget()
+        self.process_views.addWidget(self.process_table)
+        self.process_views.addWidget(self.process_tree)
+        self.process_views.addWidget(self.process_groups)
+        main_layout.addWidget(self.process_views)
         
         # Process details
         details_group = QGroupBox("Process Details")
-        details_layout = QGridLayout(details_group)
+        details_group_layout = QVBoxLayout(details_group)
+        self.details_tabs = QTabWidget()
+        details_group_layout.addWidget(self.details_tabs)
+        
+        overview_tab = QWidget()
+        details_layout = QGridLayout(overview_tab)
         
         # Process info labels
         self.pid_label = QLabel("PID:")
@@ -118,6 +1041,8 @@ class ProcessTab(QWidget):
         self.threads_label = QLabel("Threads:")
         self.priority_label = QLabel("Priority:")
         self.started_label = QLabel("Started:")
+        self.sha256_label = QLabel("SHA-256:")
+        self.signature_label = QLabel("Signature:")
         
         # Process info values
         self.pid_value = QLabel("Select a process")
@@ -129,6 +1054,9 @@ class ProcessTab(QWidget):
         self.threads_value = QLabel("")
         self.priority_value = QLabel("")
         self.started_value = QLabel("")
+        self.sha256_value = QLabel("")
+        self.sha256_value.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.signature_value = QLabel("")
         
         # Add to grid
         details_layout.addWidget(self.pid_label, 0, 0)
@@ -149,6 +1077,61 @@ class ProcessTab(QWidget):
         details_layout.addWidget(self.priority_value, 4, 1)
         details_layout.addWidget(self.started_label, 4, 2)
         details_layout.addWidget(self.started_value, 4, 3)
+        details_layout.addWidget(self.sha256_label, 5, 0)
+        details_layout.addWidget(self.sha256_value, 5, 1)
+        details_layout.addWidget(self.signature_label, 5, 2)
+        details_layout.addWidget(self.signature_value, 5, 3)
+        
+        # Recent history of the selected process
+        self.history_chart = HistoryChart()
+        details_layout.addWidget(self.history_chart, 6, 0, 1, 4)
+        self.details_tabs.addTab(overview_tab, "Overview")
+        
+        # Connections of the selected process, from the shared connection index
+        self.connections_table = QTableWidget(0, 4)
+        self.connections_table.setHorizontalHeaderLabels(["Protocol", "Local Address", "Remote Address", "Status"])
+        self.connections_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.connections_table.verticalHeader().setVisible(False)
+        self.connections_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.connections_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.connections_table.setSortingEnabled(True)
+        self.details_tabs.addTab(self.connections_table, "Connections")
+        
+        # Per-thread CPU of the selected process
+        self.threads_table = QTableWidget(0, 6)
+        self.threads_table.setHorizontalHeaderLabels(["Thread ID", "CPU %", "User %", "System %",
+                                                      "User Time (s)", "System Time (s)"])
+        self.threads_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.threads_table.verticalHeader().setVisible(False)
+        self.threads_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.threads_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.threads_table.setSortingEnabled(True)
+        self.threads_table.sortByColumn(1, Qt.DescendingOrder)
+        self.details_tabs.addTab(self.threads_table, "Threads")
+        
+        # Memory of the selected process by mapped module or file
+        self.memory_map_tab = QWidget()
+        memory_map_layout = QVBoxLayout(self.memory_map_tab)
+        memory_map_header = QHBoxLayout()
+        self.memory_map_summary = QLabel("")
+        memory_map_header.addWidget(self.memory_map_summary, 1)
+        self.memory_map_reload_btn = QPushButton("Reload")
+        self.memory_map_reload_btn.clicked.connect(lambda: self.update_memory_map(reload=True))
+        memory_map_header.addWidget(self.memory_map_reload_btn)
+        memory_map_layout.addLayout(memory_map_header)
+        
+        self.memory_map_table = QTableWidget(0, 3)
+        self.memory_map_table.setHorizontalHeaderLabels(["Path", "RSS (MB)", "Private (MB)"])
+        self.memory_map_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.memory_map_table.horizontalHeader().setStretchLastSection(True)
+        self.memory_map_table.setColumnWidth(0, 420)
+        self.memory_map_table.verticalHeader().setVisible(False)
+        self.memory_map_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.memory_map_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.memory_map_table.setSortingEnabled(True)
+        self.memory_map_table.sortByColumn(1, Qt.DescendingOrder)
+        memory_map_layout.addWidget(self.memory_map_table)
+        self.details_tabs.addTab(self.memory_map_tab, "Memory Map")
         
         main_layout.addWidget(details_group)
         
@@ -157,7 +1140,7 @@ class ProcessTab(QWidget):
         actions_layout = QHBoxLayout(actions_group)
         
         self.end_process_btn = QPushButton("End Process")
-        self.end_process_btn.clicked.connect(self.end_selected_process)
+        self.end_process_btn.clicked.connect(lambda: self.end_selected_process())
         self.end_process_btn.setEnabled(False)
         
         self.set_priority_btn = QPushButton("Set Priority")
@@ -167,13 +1150,23 @@ class ProcessTab(QWidget):
         self.refresh_btn = QPushButton("Refresh Now")
         self.refresh_btn.clicked.connect(self.refresh)
         
+        self.rules_btn = QPushButton("Rules...")
+        self.rules_btn.clicked.connect(self.show_rules)
+        
         self.auto_refresh_check = QCheckBox("Auto Refresh")
         self.auto_refresh_check.setChecked(True)
         self.auto_refresh_check.stateChanged.connect(self.toggle_auto_refresh)
         
+        self.view_mode = QComboBox()
+        self.view_mode.addItems(["List", "Tree", "Grouped"])
+        self.view_mode.currentTextChanged.connect(self.change_view_mode)
+        
         actions_layout.addWidget(self.end_process_btn)
         actions_layout.addWidget(self.set_priority_btn)
         actions_layout.addWidget(self.refresh_btn)
+        actions_layout.addWidget(self.rules_btn)
+        actions_layout.addWidget(QLabel("View:"))
+        actions_layout.addWidget(self.view_mode)
         actions_layout.addWidget(self.auto_refresh_check)
         
         main_layout.addWidget(actions_group)
@@ -184,160 +1177,509 @@ class ProcessTab(QWidget):
         main_layout.addWidget(self.status_label)
     
     def refresh(self):
-        """Refresh the process list."""
-        try:
-            old_selection = None
-            if self.selected_pid:
-                old_selection = self.selected_pid
-            
-            # Get current processes
-            self.process_list = get_processes()
-            
-            # Clear and rebuild table
-            self.process_table.setSortingEnabled(False)  # Disable sorting temporarily
-            self.process_table.setRowCount(0)
-            
-            for i, proc in enumerate(self.process_list):
-                self.process_table.insertRow(i)
-                
-                # PID
-                pid_item = QTableWidgetItem(str(proc['pid']))
-                pid_item.setData(Qt.UserRole, proc['pid'])
-                self.process_table.setItem(i, 0, pid_item)
-                
-                # Name
-                self.process_table.setItem(i, 1, QTableWidgetItem(proc['name']))
-                
-                # CPU usage
-                cpu_item = QTableWidgetItem(f"{proc['cpu_percent']:.1f}%")
-                cpu_item.setData(Qt.UserRole, proc['cpu_percent'])
-                # Colorize high CPU usage
-                if proc['cpu_percent'] > 50:
-                    cpu_item.setForeground(Qt.red)
-                elif proc['cpu_percent'] > 20:
-                    cpu_item.setForeground(Qt.darkYellow)
-                self.process_table.setItem(i, 2, cpu_item)
-                
-                # Memory usage
-                memory_item = QTableWidgetItem(f"{proc['memory_mb']:.1f} MB")
-                memory_item.setData(Qt.UserRole, proc['memory_mb'])
-                self.process_table.setItem(i, 3, memory_item)
-                
-                # Status
-                self.process_table.setItem(i, 4, QTableWidgetItem(proc['status']))
-                
-                # Type (system or user)
-                self.process_table.setItem(i, 5, QTableWidgetItem(proc['type']))
-            
-            # Re-enable sorting
-            self.process_table.setSortingEnabled(True)
-            
-            # Update status
-            self.status_label.setText(f"Found {len(self.process_list)} processes. Last updated: {QDateTime.currentDateTime().toString('hh:mm:ss')}")
-            
-            # Restore selection if possible
-            if old_selection:
-                for row in range(self.process_table.rowCount()):
-                    pid_item = self.process_table.item(row, 0)
-                    if pid_item and int(pid_item.text()) == old_selection:
-                        self.process_table.selectRow(row)
-                        break
-            
-            # Apply current filter
-            self.apply_filter(
-                self.filter_widget.filter_text.text(),
-                self.filter_widget.filter_type.currentText()
-            )
-            
-        except Exception as e:
-            QMessageBox.warning(self, "Refresh Error", f"Error refreshing process list: {str(e)}")
-            self.status_label.setText(f"Error: {str(e)}")
+        """Start collecting the process list on the worker thread."""
+        if self.collector.isRunning():
+            return
+        
+        self.collector.start()
+    
+    def on_process_batch(self, delta):
+        """Apply a partial delta from the collector to the table."""
+        self.process_model.apply_delta(delta)
+        self.tree_model.apply_delta(delta)
+        self.group_model.apply_delta(delta)
+        self.memory_maps.forget(delta.exited)
+        self.leaks.forget(delta.exited)
+        if self.pinned.pinned():
+            self.unpin_processes(delta.exited)
+        if len(self.freezer):
+            self.freezer.forget(delta.exited)
+            self.update_frozen_banner()
+    
+    def on_collection_finished(self):
+        """Update the status once a collection pass completes."""
+        self.last_updated = QDateTime.currentDateTime().toString('hh:mm:ss')
+        self.update_status()
+        
+        # Every sparkline advanced a tick; repaint only the visible cells
+        self.process_table.viewport().update()
+        self.update_history_chart()
+        
+        # Live values of the selected process come from the new snapshot
+        if self.selected_key is not None:
+            proc = self.process_model.process_for_key(self.selected_key)
+            if proc is not None:
+                self.show_live_details(proc)
+    
+    def update_thread_sampling(self, *args):
+        """Sample threads only while a process is selected and the Threads tab is shown."""
+        if self.selected_key is None or self.details_tabs.currentWidget() is not self.threads_table:
+            self.thread_timer.stop()
+            self.thread_sampler = None
+            return
+        
+        if self.thread_sampler is None or self.thread_sampler.key != self.selected_key:
+            self.thread_sampler = ThreadSampler(self.selected_key)
+            self.threads_table.setRowCount(0)
+            self.sample_threads()
+        if not self.thread_timer.isActive():
+            self.thread_timer.start()
+    
+    def sample_threads(self):
+        """Take a thread sample of the selected process on the worker thread."""
+        if self.thread_sampler is None or self.thread_collector.isRunning():
+            return
+        
+        self.thread_collector.sampler = self.thread_sampler
+        self.thread_collector.start()
+    
+    def on_thread_sample(self, key, threads):
+        """Show a thread sample, highlighting the busiest threads."""
+        if self.thread_sampler is None or key != self.thread_sampler.key:
+            return
+        
+        self.threads_table.setSortingEnabled(False)
+        self.threads_table.setRowCount(len(threads))
+        highlight = QColor("#fff2cc")
+        
+        for row, thread in enumerate(threads):
+            values = (thread['id'], round(thread['cpu_percent'], 1), round(thread['user_percent'], 1),
+                      round(thread['system_percent'], 1), round(thread['user_time'], 2),
+                      round(thread['system_time'], 2))
+            for column, value in enumerate(values):
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, value)
+                if row < TOP_THREADS and thread['cpu_percent'] > 0:
+                    item.setBackground(highlight)
+                self.threads_table.setItem(row, column, item)
+        
+        self.threads_table.setSortingEnabled(True)
+        self.details_tabs.setTabText(self.details_tabs.indexOf(self.threads_table), f"Threads ({len(threads)})")
+    
+    def on_thread_sample_failed(self, key, message):
+        """Stop sampling a process whose threads cannot be read."""
+        if self.thread_sampler is not None and key == self.thread_sampler.key:
+            self.thread_timer.stop()
+            self.thread_sampler = None
+            self.threads_table.setRowCount(0)
+            self.status_label.setText(f"Cannot read threads of PID {key[0]}: {message}")
+    
+    def update_memory_map(self, *args, reload=False):
+        """Show the memory map of the selected process while the Memory Map tab is open."""
+        if self.details_tabs.currentWidget() is not self.memory_map_tab:
+            return
+        
+        key = self.selected_key
+        if key is None:
+            self.cancel_memory_map()
+            self.memory_map_key = None
+            self.memory_map_table.setRowCount(0)
+            self.memory_map_summary.setText("Select a process")
+            return
+        
+        if key == self.memory_map_key and not reload:
+            return
+        
+        self.cancel_memory_map()
+        self.memory_map_key = key
+        if reload:
+            self.memory_maps.forget([key])
+        
+        regions = self.memory_maps.get(key)
+        if regions is not None:
+            self.show_memory_map(regions)
+            return
+        
+        self.memory_map_table.setRowCount(0)
+        self.memory_map_summary.setText("Reading memory map...")
+        cancel = CancelToken()
+        self.memory_map_cancel = cancel
+        self.run_in_background(self.memory_maps.fetch, (key, cancel),
+                               on_result=lambda regions: self.on_memory_map(key, cancel, regions),
+                               on_error=lambda message: self.on_memory_map_failed(key, message))
+    
+    def cancel_memory_map(self):
+        """Abandon a memory map read that is still running."""
+        if self.memory_map_cancel is not None:
+            self.memory_map_cancel.cancel()
+            self.memory_map_cancel = None
+    
+    def on_memory_map(self, key, cancel, regions):
+        """Show a memory map read if it is still wanted."""
+        if cancel.cancelled or regions is None or key != self.memory_map_key:
+            return
+        self.memory_map_cancel = None
+        self.show_memory_map(regions)
+    
+    def on_memory_map_failed(self, key, message):
+        """Report a memory map that could not be read."""
+        if key == self.memory_map_key:
+            self.memory_map_cancel = None
+            self.memory_map_summary.setText(f"Cannot read memory map: {message}")
+    
+    def show_memory_map(self, regions):
+        """Fill the memory map table."""
+        self.memory_map_table.setSortingEnabled(False)
+        self.memory_map_table.setRowCount(len(regions))
+        
+        for row, region in enumerate(regions):
+            self.memory_map_table.setItem(row, 0, QTableWidgetItem(region['path']))
+            rss_item = QTableWidgetItem()
+            rss_item.setData(Qt.DisplayRole, round(region['rss'] / (1024 * 1024), 2))
+            self.memory_map_table.setItem(row, 1, rss_item)
+            private_item = QTableWidgetItem()
+            if region['private'] is None:
+                private_item.setText("N/A")
+            else:
+                private_item.setData(Qt.DisplayRole, round(region['private'] / (1024 * 1024), 2))
+            self.memory_map_table.setItem(row, 2, private_item)
+        
+        self.memory_map_table.setSortingEnabled(True)
+        total_rss = sum(region['rss'] for region in regions) / (1024 * 1024)
+        self.memory_map_summary.setText(f"{len(regions)} mapped regions, {total_rss:.1f} MB resident")
+    
+    def on_runaways_detected(self, runaways):
+        """Show a notification for processes that were just flagged as runaway."""
+        lines = [f"{proc['name']} (PID {proc['pid']}): {reason}" for proc, reason in runaways[:5]]
+        if len(runaways) > 5:
+            lines.append(f"and {len(runaways) - 5} more")
+        self.runaway_label.setText("Runaway processes detected:\n" + "\n".join(lines))
+        self.runaway_banner.show()
+    
+    def on_rules_applied(self, reports):
+        """Report the rules applied to new processes in the status line."""
+        failed = sum(1 for report in reports if report['failed'])
+        text = f"Rules applied to {len(reports)} new process(es)"
+        if failed:
+            text += f", {failed} with errors"
+        self.status_label.setText(text)
+    
+    def show_rules(self):
+        """Show the configured process rules and what they recently applied."""
+        engine = self.rule_engine
+        lines = [f"Rules file: {engine.config_file}", ""]
+        if engine.rules:
+            lines.extend(rule.describe() for rule in engine.rules)
+        else:
+            lines.append("No rules are enabled.")
+        
+        recent = list(engine.log)[-15:]
+        if recent:
+            lines.extend(["", "Recently applied:"])
+            for report in recent:
+                line = f"{report['name']} (PID {report['pid']}): {', '.join(report['applied']) or 'nothing'}"
+                if report['failed']:
+                    line += f"; failed: {', '.join(report['failed'])}"
+                lines.append(line)
+        
+        box = QMessageBox(self)
+        box.setWindowTitle("Process Rules")
+        box.setText("\n".join(lines))
+        reload_btn = box.addButton("Reload Rules", QMessageBox.ActionRole)
+        box.addButton(QMessageBox.Close)
+        box.exec_()
+        
+        if box.clickedButton() is reload_btn:
+            engine.load()
+            self.status_label.setText(f"Loaded {len(engine.rules)} process rule(s); they apply to processes started from now on")
+    
+    def on_connections_updated(self):
+        """Show connection counts and details from the rebuilt connection index."""
+        self.process_model.column_changed("Conns")
+        self.update_connections_table()
+    
+    def update_connections_table(self):
+        """List the connections of the selected process."""
+        self.connections_table.setSortingEnabled(False)
+        conns = self.connections.connections(self.selected_pid) if self.selected_pid else []
+        self.connections_table.setRowCount(len(conns))
+        
+        for row, conn in enumerate(conns):
+            fields = describe_connection(conn)
+            for column, field in enumerate(('protocol', 'local', 'remote', 'status')):
+                self.connections_table.setItem(row, column, QTableWidgetItem(fields[field]))
+        
+        self.connections_table.setSortingEnabled(True)
+        self.details_tabs.setTabText(1, f"Connections ({len(conns)})")
+    
+    def on_collection_failed(self, message):
+        """Report a failed collection pass."""
+        self.status_label.setText(f"Error: {message}")
+    
+    def update_status(self, *args):
+        """Show the visible and total process counts."""
+        text = f"Showing {self.proxy_model.rowCount()} of {self.process_model.rowCount()} processes"
+        if self.last_updated:
+            text += f". Last updated: {self.last_updated}"
+        self.status_label.setText(text)
     
     def apply_filter(self, text, filter_type):
         """Apply filtering to the process table."""
-        for row in range(self.process_table.rowCount()):
-            show_row = True
-            
-            # Text filter
-            if text:
-                name_match = text.lower() in self.process_table.item(row, 1).text().lower()
-                pid_match = text in self.process_table.item(row, 0).text()
-                show_row = name_match or pid_match
-            
-            # Type filter
-            if show_row and filter_type != "All":
-                if filter_type == "High CPU":
-                    cpu_item = self.process_table.item(row, 2)
-                    cpu_value = cpu_item.data(Qt.UserRole)
-                    show_row = cpu_value > 5.0  # Show processes using more than 5% CPU
-                
-                elif filter_type == "High Memory":
-                    memory_item = self.process_table.item(row, 3)
-                    memory_value = memory_item.data(Qt.UserRole)
-                    show_row = memory_value > 100.0  # Show processes using more than 100MB
-                
-                elif filter_type == "System Processes":
-                    show_row = self.process_table.item(row, 5).text() == "System"
-                
-                elif filter_type == "User Processes":
-                    show_row = self.process_table.item(row, 5).text() == "User"
-            
-            self.process_table.setRowHidden(row, not show_row)
+        self.proxy_model.set_filter(text, filter_type)
+    
+    def change_view_mode(self, mode):
+        """Switch between the flat list, the process tree and the grouped view."""
+        if mode == "Tree":
+            if not self.tree_model.built:
+                rows = [self.process_model.process_at(row)
+                        for row in range(self.process_model.rowCount())]
+                self.tree_model.populate(rows)
+                self.process_tree.expandToDepth(0)
+            self.process_views.setCurrentWidget(self.process_tree)
+        elif mode == "Grouped":
+            if not self.group_model.built:
+                rows = [self.process_model.process_at(row)
+                        for row in range(self.process_model.rowCount())]
+                self.group_model.populate(rows)
+            self.process_views.setCurrentWidget(self.process_groups)
+        else:
+            self.process_views.setCurrentWidget(self.process_table)
+        self.on_selection_changed()
+    
+    def current_view(self):
+        """Get the process view currently shown."""
+        return self.process_views.currentWidget()
+    
+    def processes_at(self, view, index):
+        """Get the process dictionaries behind a view index; a group gives all its members."""
+        if view is self.process_tree:
+            return [self.tree_model.node_at(self.tree_proxy.mapToSource(index)).row]
+        if view is self.process_groups:
+            return self.group_model.processes_at(self.group_proxy.mapToSource(index))
+        return [self.process_model.process_at(self.proxy_model.mapToSource(index).row())]
+    
+    def selected_processes(self):
+        """Get the process dictionaries of all selected rows."""
+        view = self.current_view()
+        processes = []
+        seen = set()
+        for index in view.selectionModel().selectedRows():
+            for proc in self.processes_at(view, index):
+                key = (proc['pid'], proc['create_time'])
+                if key not in seen:
+                    seen.add(key)
+                    processes.append(proc)
+        return processes
+    
+    def selected_process(self):
+        """Get the process dictionary of the current selected row, if any."""
+        view = self.current_view()
+        selection = view.selectionModel()
+        current = selection.currentIndex()
+        if not current.isValid() or not selection.isRowSelected(current.row(), current.parent()):
+            rows = selection.selectedRows()
+            if not rows:
+                return None
+            current = rows[0]
+        
+        processes = self.processes_at(view, current)
+        return processes[0] if processes else None
+    
+    def run_in_background(self, action, args=(), kwargs=None, on_result=None, on_error=None):
+        """
+        Run a process action on a worker thread.
         
-        # Update filtered count
-        visible_count = sum(1 for row in range(self.process_table.rowCount()) 
-                           if not self.process_table.isRowHidden(row))
+        Args:
+            action: Callable to run
+            args: Positional arguments for the action
+            kwargs: Keyword arguments for the action
+            on_result: Slot receiving the action's return value
+            on_error: Slot receiving the error message; a warning box by default
+        """
+        worker = ProcessActionWorker(action, args, kwargs, self)
+        if on_result is not None:
+            worker.resultReady.connect(on_result)
+        if on_error is not None:
+            worker.actionFailed.connect(on_error)
+        else:
+            worker.actionFailed.connect(
+                lambda message: QMessageBox.warning(self, "Error", f"Process action failed: {message}"))
+        worker.finished.connect(lambda: self.action_workers.discard(worker))
+        self.action_workers.add(worker)
+        worker.start()
+        return worker
+    
+    def update_history_chart(self):
+        """Show the history of the selected process in the details panel."""
+        if self.selected_key is None:
+            self.history_chart.set_series({})
+            return
+        
+        # Pinned processes show their high-resolution history
+        if self.pinned.is_pinned(self.selected_key):
+            history, caption = self.fast_history, "250 ms"
+        else:
+            history, caption = self.history, ""
+        self.history_chart.set_series({
+            metric: history.series(self.selected_key, metric)
+            for metric in ProcessHistory.METRICS
+        }, caption)
+    
+    def index_new_processes(self):
+        """Index processes that are new since the last pass; runs on a scheduler worker thread."""
+        if self.search_index.index_processes(self.registry.rows(), self.registry.is_live):
+            self.searchIndexed.emit()
+    
+    def refresh_connections(self):
+        """Rebuild the connection index; runs on a scheduler worker thread."""
+        if self.connections.refresh(force=True):
+            self.connectionsRefreshed.emit()
+    
+    def sample_leaks(self):
+        """Record handle and thread counts for leak trends; runs on a scheduler worker thread."""
+        rows = self.registry.rows()
+        if rows:
+            self.leaks.sample(rows, self.registry.handle_counts())
+            self.leaksSampled.emit()
+    
+    def on_leaks_sampled(self):
+        """Show the updated growth rates."""
+        self.process_model.column_changed("Handle Growth")
+    
+    def sample_pinned(self):
+        """Sample the pinned processes; runs on the scheduler thread."""
+        self.pinned.sample()
+        self.pinnedSampled.emit()
+    
+    def on_pinned_sampled(self):
+        """Redraw the chart when the selected process is pinned."""
+        # Pinned processes that exited were dropped by the sampler
+        if not self.pinned.pinned():
+            self.unpin_processes([])
+        elif self.selected_key is not None and self.pinned.is_pinned(self.selected_key):
+            self.update_history_chart()
+    
+    def pin_selected_processes(self):
+        """Sample the selected processes every 250 ms."""
+        processes = self.selected_processes()
+        failed = [proc['pid'] for proc in processes
+                  if not self.pinned.pin((proc['pid'], proc['create_time']))]
         
-        self.status_label.setText(f"Showing {visible_count} of {len(self.process_list)} processes")
+        if self.pinned.pinned():
+            self.scheduler.add_lane("pinned", PINNED_INTERVAL, self.sample_pinned, priority=0)
+        if failed:
+            QMessageBox.warning(
+                self,
+                "Failed",
+                f"Could not pin PID(s) {', '.join(str(pid) for pid in failed)}.\n"
+                f"At most {self.pinned.max_pinned} processes can be pinned."
+            )
+        self.process_table.viewport().update()
+        self.update_history_chart()
+    
+    def unpin_processes(self, keys):
+        """Stop fast sampling of processes, removing the lane once none are pinned."""
+        self.pinned.unpin(keys)
+        if not self.pinned.pinned():
+            self.scheduler.remove_lane("pinned")
+        self.process_table.viewport().update()
+        self.update_history_chart()
     
-    def on_selection_changed(self):
+    def unpin_selected_processes(self):
+        """Return the selected processes to the normal refresh rate."""
+        self.unpin_processes([(proc['pid'], proc['create_time']) for proc in self.selected_processes()])
+    
+    def on_selection_changed(self, *args):
         """Handle process selection change."""
-        selected_items = self.process_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            pid_item = self.process_table.item(row, 0)
+        proc = self.selected_process()
+        if proc:
+            self.selected_pid = proc['pid']
+            self.selected_key = (proc['pid'], proc['create_time'])
+            self.update_history_chart()
+            self.update_connections_table()
+            self.update_thread_sampling()
+            self.update_memory_map()
+            
+            # Enable action buttons
+            selected_count = len(self.selected_processes())
+            self.end_process_btn.setText("End Process" if selected_count == 1 else f"End {selected_count} Processes")
+            self.end_process_btn.setEnabled(True)
+            self.set_priority_btn.setEnabled(True)
             
-            if pid_item:
-                pid = int(pid_item.text())
-                self.selected_pid = pid
-                
-                # Enable action buttons
-                self.end_process_btn.setEnabled(True)
-                self.set_priority_btn.setEnabled(True)
-                
-                # Update process details
-                self.update_process_details(pid)
+            # Update process details
+            self.update_process_details(proc)
         else:
             self.clear_process_details()
     
-    def update_process_details(self, pid):
-        """Update the process details panel."""
-        try:
-            details = get_process_details(pid)
-            
-            if details:
-                self.pid_value.setText(str(details['pid']))
-                self.name_value.setText(details['name'])
-                self.path_value.setText(details['path'])
-                self.user_value.setText(details['username'])
-                self.memory_value.setText(f"{details['memory_mb']:.1f} MB")
-                self.cpu_value.setText(f"{details['cpu_percent']:.1f}%")
-                self.threads_value.setText(str(details['num_threads']))
-                self.priority_value.setText(details['priority'])
-                self.started_value.setText(details['create_time'])
-            else:
-                self.clear_process_details()
-                
-        except Exception as e:
-            self.pid_value.setText(f"Error: {str(e)}")
-            self.clear_process_details(keep_pid=True)
+    def update_process_details(self, proc):
+        """
+        Update the process details panel.
+        
+        Live values come from the snapshot row; static values come from the
+        registry's details cache, fetched on a worker thread on a miss.
+        """
+        self.show_live_details(proc)
+        
+        key = (proc['pid'], proc['create_time'])
+        details = self.registry.details.get(key)
+        if details is not None:
+            self.show_static_details(details)
+            return
+        
+        self.path_value.setText("Loading...")
+        self.priority_value.setText("")
+        self.started_value.setText("")
+        self.sha256_value.setText("")
+        self.signature_value.setText("")
+        self.run_in_background(self.registry.details.fetch, (key,),
+                               on_result=lambda details: self.on_static_details(key, details))
+    
+    def show_live_details(self, proc):
+        """Show the sampled values of a process."""
+        self.pid_value.setText(str(proc['pid']))
+        self.name_value.setText(proc['name'])
+        self.user_value.setText(proc['username'])
+        self.memory_value.setText(f"{proc['memory_mb']:.1f} MB")
+        self.cpu_value.setText(f"{proc['cpu_percent']:.1f}%")
+        self.threads_value.setText(str(proc['num_threads']))
+    
+    def show_static_details(self, details):
+        """Show the path, priority and start time of a process."""
+        self.path_value.setText(details['path'])
+        self.priority_value.setText(details['priority'])
+        self.started_value.setText(details['create_time'])
+        self.show_file_hash(details['path'])
+    
+    def show_file_hash(self, path):
+        """Show the hash and signature of an executable, hashing it in the background on a miss."""
+        entry = self.file_hashes.request(path, self.fileHashed.emit)
+        if entry is not None:
+            self.sha256_value.setText(entry['sha256'])
+            self.signature_value.setText(entry['signature'])
+        elif self.file_hashes.pending(path):
+            self.sha256_value.setText("Hashing...")
+            self.signature_value.setText("")
+        else:
+            self.sha256_value.setText("Unavailable")
+            self.signature_value.setText("")
+    
+    def on_file_hashed(self, path, entry):
+        """Show a computed hash if its executable is still displayed."""
+        if path != self.path_value.text():
+            return
+        if entry is None:
+            self.sha256_value.setText("Unavailable")
+            self.signature_value.setText("")
+        else:
+            self.sha256_value.setText(entry['sha256'])
+            self.signature_value.setText(entry['signature'])
+    
+    def on_static_details(self, key, details):
+        """Show fetched static details if their process is still selected."""
+        if key == self.selected_key:
+            self.show_static_details(details)
     
     def clear_process_details(self, keep_pid=False):
         """Clear the process details panel."""
         if not keep_pid:
             self.pid_value.setText("Select a process")
             self.selected_pid = None
-            
+            self.selected_key = None
+            self.history_chart.set_series({})
+            self.update_connections_table()
+            self.update_thread_sampling()
+            self.update_memory_map()
+        
         self.name_value.setText("")
         self.path_value.setText("")
         self.user_value.setText("")
@@ -346,46 +1688,67 @@ class ProcessTab(QWidget):
         self.threads_value.setText("")
         self.priority_value.setText("")
         self.started_value.setText("")
+        self.sha256_value.setText("")
+        self.signature_value.setText("")
         
         # Disable action buttons
         self.end_process_btn.setEnabled(False)
         self.set_priority_btn.setEnabled(False)
     
-    def end_selected_process(self):
-        """End the selected process."""
-        if not self.selected_pid:
+    def end_selected_process(self, include_children=False):
+        """End all selected processes, optionally with their descendants."""
+        processes = self.selected_processes()
+        if not processes:
             return
         
+        pids = [proc['pid'] for proc in processes]
+        if len(pids) == 1:
+            target = f"process with PID {pids[0]}"
+        else:
+            target = f"these {len(pids)} processes"
+        if include_children:
+            target += " and all of their child processes"
+        
         confirm = QMessageBox.question(
             self,
             "Confirm End Process",
-            f"Are you sure you want to end process with PID {self.selected_pid}?\n\nThis may cause data loss if the application has unsaved work.",
+            f"Are you sure you want to end {target}?\n\nThis may cause data loss if the application has unsaved work.",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
         
         if confirm == QMessageBox.Yes:
-            try:
-                result = kill_process(self.selected_pid)
-                if result:
-                    QMessageBox.information(
-                        self,
-                        "Success",
-                        f"Process with PID {self.selected_pid} has been terminated."
-                    )
-                    self.refresh()
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Failed",
-                        f"Could not terminate process with PID {self.selected_pid}.\nYou may not have sufficient privileges."
-                    )
-            except Exception as e:
-                QMessageBox.warning(
-                    self,
-                    "Error",
-                    f"Error terminating process: {str(e)}"
-                )
+            self.end_process_btn.setEnabled(False)
+            self.status_label.setText(f"Ending {len(pids)} process(es)...")
+            self.run_in_background(kill_processes, (pids,),
+                                   {'include_children': include_children},
+                                   self.on_processes_ended)
+    
+    def end_selected_process_tree(self):
+        """End the selected processes and all of their descendants."""
+        self.end_selected_process(include_children=True)
+    
+    def on_processes_ended(self, results):
+        """Report the per-PID results of ending processes."""
+        ended = [pid for pid, result in results.items() if result in ('terminated', 'killed')]
+        failed = {pid: result for pid, result in results.items() if pid not in ended}
+        
+        if failed:
+            details = "\n".join(f"PID {pid}: {result}" for pid, result in sorted(failed.items()))
+            QMessageBox.warning(
+                self,
+                "Failed",
+                f"Ended {len(ended)} of {len(results)} processes.\n\n{details}\n\nYou may not have sufficient privileges."
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"{len(ended)} process(es) have been terminated."
+            )
+        
+        self.on_selection_changed()
+        self.refresh()
     
     def set_process_priority(self):
         """Set the priority of the selected process."""
@@ -425,7 +1788,10 @@ class ProcessTab(QWidget):
                     "Success",
                     f"Process priority changed to {priority}."
                 )
-                self.update_process_details(self.selected_pid)
+                proc = self.selected_process()
+                if proc:
+                    self.registry.details.forget([(proc['pid'], proc['create_time'])])
+                    self.update_process_details(proc)
             else:
                 QMessageBox.warning(
                     self,
@@ -439,20 +1805,143 @@ class ProcessTab(QWidget):
                 f"Error changing process priority: {str(e)}"
             )
     
+    def limit_selected_cpu(self, limit):
+        """Limit the selected processes to a percentage of one CPU."""
+        processes = self.selected_processes()
+        failed = []
+        for proc in processes:
+            if proc['pid'] == os.getpid():
+                failed.append(f"PID {proc['pid']} ({proc['name']}): Cannot limit this application")
+            elif not self.limiter.set_limit((proc['pid'], proc['create_time']), limit):
+                failed.append(f"PID {proc['pid']} ({proc['name']}): Access denied or process has exited")
+        
+        if failed:
+            QMessageBox.warning(
+                self,
+                "Failed",
+                f"Could not limit {len(failed)} of {len(processes)} process(es).\n\n" + "\n".join(failed[:15])
+            )
+        self.status_label.setText(f"Limited {len(processes) - len(failed)} process(es) to {limit}% CPU")
+        self.process_table.viewport().update()
+    
+    def freeze_selected(self, scope="selection"):
+        """
+        Suspend the selected processes as one group on a worker thread.
+        
+        Args:
+            scope: "selection", "tree" to add all descendants, or "group"
+                   for every process with the same image name
+        """
+        processes = self.selected_processes()
+        if not processes:
+            return
+        
+        rows = [self.process_model.process_at(row) for row in range(self.process_model.rowCount())]
+        if scope == "tree":
+            processes = collect_tree(rows, processes)
+        elif scope == "group":
+            processes = collect_group(rows, processes)
+        
+        names = sorted({proc['name'] for proc in processes})
+        name = names[0] if len(names) == 1 else f"{names[0]} and {len(names) - 1} more"
+        confirm = QMessageBox.question(
+            self,
+            "Confirm Freeze",
+            f"Suspend {len(processes)} process(es) ({name})?\n\n"
+            "They keep their state and use no CPU until resumed. All frozen "
+            "processes are resumed when this application exits.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if confirm != QMessageBox.Yes:
+            return
+        
+        self.status_label.setText(f"Freezing {len(processes)} process(es)...")
+        self.run_in_background(self.freezer.freeze, (processes, name), on_result=self.on_frozen)
+    
+    def on_frozen(self, result):
+        """Report the per-PID results of a freeze."""
+        group, results = result
+        failed = [result for result in results if not result['ok']]
+        frozen = len(results) - len(failed)
+        
+        if failed:
+            details = "\n".join(f"PID {result['pid']} ({result['name']}): {result['error']}"
+                                 for result in failed[:15])
+            if len(failed) > 15:
+                details += f"\nand {len(failed) - 15} more"
+            QMessageBox.warning(self, "Freeze", f"Froze {frozen} of {len(results)} processes.\n\n{details}")
+        self.status_label.setText(f"Froze {frozen} process(es)" + (f" as {group.name}" if group else ""))
+        self.update_frozen_banner()
+        self.process_table.viewport().update()
+    
+    def resume_selected_frozen(self):
+        """Resume the frozen groups of the selected processes."""
+        group_ids = set()
+        for proc in self.selected_processes():
+            group = self.freezer.group_of((proc['pid'], proc['create_time']))
+            if group is not None:
+                group_ids.add(group.group_id)
+        if group_ids:
+            self.run_in_background(self.freezer.thaw, (sorted(group_ids),), on_result=self.on_thawed)
+    
+    def resume_all_frozen(self):
+        """Resume every frozen group."""
+        self.run_in_background(self.freezer.thaw_all, on_result=self.on_thawed)
+    
+    def on_thawed(self, results):
+        """Report the per-PID results of resuming frozen processes."""
+        failed = [result for result in results
+                  if not result['ok'] and result['error'] != "Process has exited"]
+        if failed:
+            details = "\n".join(f"PID {result['pid']} ({result['name']}): {result['error']}"
+                                 for result in failed[:15])
+            QMessageBox.warning(self, "Resume", f"Could not resume {len(failed)} process(es).\n\n{details}")
+        self.status_label.setText(f"Resumed {len(results) - len(failed)} process(es)")
+        self.update_frozen_banner()
+        self.process_table.viewport().update()
+    
+    def update_frozen_banner(self):
+        """Show how many processes are frozen, hiding the banner when none are."""
+        groups = self.freezer.groups()
+        if not groups:
+            self.frozen_banner.hide()
+            return
+        count = sum(len(group) for group in groups)
+        names = ", ".join(group.name for group in groups[:3])
+        if len(groups) > 3:
+            names += f" and {len(groups) - 3} more"
+        self.frozen_label.setText(f"{count} process(es) frozen in {len(groups)} group(s): {names}")
+        self.frozen_banner.show()
+    
+    def remove_selected_cpu_limit(self):
+        """Remove the CPU limit of the selected processes, resuming them."""
+        self.limiter.remove([(proc['pid'], proc['create_time']) for proc in self.selected_processes()])
+        self.process_table.viewport().update()
+    
     def show_context_menu(self, position):
         """Show context menu for process list."""
-        if not self.process_table.selectedItems():
+        view = self.current_view()
+        index = view.indexAt(position)
+        if not index.isValid():
             return
         
-        row = self.process_table.itemAt(position).row()
-        self.process_table.selectRow(row)
+        # Keep a multi-row selection when right-clicking inside it
+        if not view.selectionModel().isRowSelected(index.row(), index.parent()):
+            view.selectionModel().select(index, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
         
         menu = QMenu(self)
         
-        end_process_action = QAction("End Process", self)
-        end_process_action.triggered.connect(self.end_selected_process)
+        selected_count = len(self.selected_processes())
+        end_label = "End Process" if selected_count == 1 else f"End {selected_count} Processes"
+        end_process_action = QAction(end_label, self)
+        end_process_action.triggered.connect(lambda: self.end_selected_process())
         menu.addAction(end_process_action)
         
+        end_tree_action = QAction("End Process Tree", self)
+        end_tree_action.triggered.connect(self.end_selected_process_tree)
+        menu.addAction(end_tree_action)
+        
         priority_menu = QMenu("Set Priority", self)
         
         priorities = [
@@ -472,13 +1961,51 @@ class ProcessTab(QWidget):
         
         menu.addMenu(priority_menu)
         
+        limit_menu = QMenu("Limit CPU", self)
+        for limit in (50, 25, 10, 5):
+            action = QAction(f"{limit}% of one core", self)
+            action.triggered.connect(lambda checked, l=limit: self.limit_selected_cpu(l))
+            limit_menu.addAction(action)
+        
+        selected = self.selected_processes()
+        if any(self.limiter.limit((proc['pid'], proc['create_time'])) is not None for proc in selected):
+            limit_menu.addSeparator()
+            remove_limit_action = QAction("Remove CPU Limit", self)
+            remove_limit_action.triggered.connect(self.remove_selected_cpu_limit)
+            limit_menu.addAction(remove_limit_action)
+        
+        menu.addMenu(limit_menu)
+        
+        freeze_menu = QMenu("Freeze", self)
+        for label, scope in (("Selected Processes", "selection"), ("Process Tree", "tree"),
+                             ("Application Group", "group")):
+            action = QAction(label, self)
+            action.triggered.connect(lambda checked, s=scope: self.freeze_selected(s))
+            freeze_menu.addAction(action)
+        
+        if any(self.freezer.is_frozen((proc['pid'], proc['create_time'])) for proc in selected):
+            freeze_menu.addSeparator()
+            resume_action = QAction("Resume Frozen Group", self)
+            resume_action.triggered.connect(self.resume_selected_frozen)
+            freeze_menu.addAction(resume_action)
+        
+        menu.addMenu(freeze_menu)
+        
+        if all(self.pinned.is_pinned((proc['pid'], proc['create_time'])) for proc in selected):
+            pin_action = QAction("Unpin", self)
+            pin_action.triggered.connect(self.unpin_selected_processes)
+        else:
+            pin_action = QAction("Pin (Sample Every 250 ms)", self)
+            pin_action.triggered.connect(self.pin_selected_processes)
+        menu.addAction(pin_action)
+        
         menu.addSeparator()
         
         refresh_action = QAction("Refresh", self)
         refresh_action.triggered.connect(self.refresh)
         menu.addAction(refresh_action)
         
-        menu.exec_(self.process_table.mapToGlobal(position))
+        menu.exec_(view.viewport().mapToGlobal(position))
     
     def toggle_auto_refresh(self, state):
         """Toggle auto-refresh on/off."""
@@ -486,3 +2013,16 @@ class ProcessTab(QWidget):
             self.refresh_timer.start()
         else:
             self.refresh_timer.stop()
+    
+    def shutdown(self):
+        """Stop background work before the application exits."""
+        self.refresh_timer.stop()
+        self.thread_timer.stop()
+        self.scheduler.stop()
+        self.limiter.stop()
+        self.file_hashes.shutdown()
+        self.collector.wait()
+        self.thread_collector.wait()
+        for worker in list(self.action_workers):
+            worker.wait()
+        self.freezer.thaw_all()
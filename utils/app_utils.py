@@ -234,6 +234,7 @@ def get_app_details(app_data):
             if exe_files:
                 try:
                     main_exe = exe_files[0]
+                    details['executable'] = main_exe
                     
                     # Get file information
                     file_info = win32com.client.Dispatch("Scripting.FileSystemObject").GetFileVersion(main_exe)
@@ -419,6 +419,7 @@ def get_startup_details(item):
             
             # Get file information
             if os.path.exists(cmd):
+                details['executable'] = cmd
                 try:
                     # Get file version info
                     info = win32api.GetFileVersionInfo(cmd, "\\")
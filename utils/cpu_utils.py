@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CPU utility functions for Windows System Manager.
+Provides per-core utilization history and the core affinity of the busiest processes.
+"""
+
+import heapq
+import threading
+from array import array
+
+import psutil
+
+# A process using about one full core (this close to 100%) is likely bound by a single thread
+SINGLE_THREAD_PERCENT = 90.0
+
+class CoreHistory:
+    """
+    Ring buffer of per-logical-core utilization.
+    
+    Each sample() makes one psutil.cpu_percent(percpu=True) call, which
+    measures every core since the previous call, and stores the values in
+    one preallocated array('f') holding `length` samples per core.
+    """
+    
+    def __init__(self, length=120):
+        self.length = length
+        self.cores = psutil.cpu_count(logical=True) or 1
+        self._data = array('f', bytes(4 * length * self.cores))
+        self._count = 0  # samples ever taken
+        self._lock = threading.Lock()
+        
+        # The first call only sets the baseline
+        psutil.cpu_percent(percpu=True)
+    
+    def sample(self):
+        """
+        Sample all cores once.
+        
+        Returns:
+            list: Utilization of each core in percent
+        """
+        values = psutil.cpu_percent(percpu=True)
+        with self._lock:
+            pos = self._count % self.length
+            for core, value in enumerate(values[:self.cores]):
+                self._data[core * self.length + pos] = value
+            self._count += 1
+        return values
+    
+    def series(self, core):
+        """
+        Get the recorded samples of a core.
+        
+        Args:
+            core: Logical core number
+        
+        Returns:
+            list: Samples, oldest first
+        """
+        with self._lock:
+            count = min(self._count, self.length)
+            start = core * self.length
+            end = self._count % self.length
+            if self._count <= self.length:
+                return self._data[start:start + count].tolist()
+            return (self._data[start + end:start + self.length].tolist() +
+                    self._data[start:start + end].tolist())
+    
+    def latest(self):
+        """
+        Get the last sample of every core.
+        
+        Returns:
+            list: Utilization of each core in percent, zeros before the first sample
+        """
+        with self._lock:
+            if not self._count:
+                return [0.0] * self.cores
+            pos = (self._count - 1) % self.length
+            return [self._data[core * self.length + pos] for core in range(self.cores)]
+
+def get_top_affinities(rows, top_n=10):
+    """
+    Get the core affinity of the busiest processes.
+    
+    Only the top_n processes by CPU use are opened, each once.
+    
+    Args:
+        rows: Process dictionaries with pid, create_time, name and cpu_percent
+        top_n: Number of processes to include
+    
+    Returns:
+        list: Dictionaries with pid, name, cpu_percent, affinity (sorted core
+              numbers, or None if it cannot be read) and single_thread
+              (using about one full core), busiest first
+    """
+    busiest = heapq.nlargest(top_n, rows, key=lambda row: row['cpu_percent'])
+    results = []
+    
+    for row in busiest:
+        affinity = None
+        try:
+            proc = psutil.Process(row['pid'])
+            if proc.create_time() != row['create_time']:
+                continue
+            affinity = sorted(proc.cpu_affinity())
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            continue
+        except (psutil.AccessDenied, AttributeError):
+            pass
+        except Exception as e:
+            print(f"Error getting affinity of PID {row['pid']}: {str(e)}")
+        
+        results.append({
+            'pid': row['pid'],
+            'name': row['name'],
+            'cpu_percent': row['cpu_percent'],
+            'affinity': affinity,
+            'single_thread': SINGLE_THREAD_PERCENT <= row['cpu_percent'] <= 200 - SINGLE_THREAD_PERCENT
+        })
+    
+    return results
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Executable hashing for Windows System Manager.
+Caches the SHA-256 and signature status of files on disk, keyed by path, size and modification time.
+"""
+
+import os
+import json
+import mmap
+import atexit
+import ctypes
+import hashlib
+import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Entries kept in the cache file; the oldest are dropped first
+MAX_ENTRIES = 5000
+
+# Signature states
+SIGNED = "Signed"
+UNSIGNED = "No embedded signature"
+INVALID = "Invalid signature"
+UNKNOWN = "Unknown"
+
+# WinVerifyTrust results that mean the file carries no embedded signature
+TRUST_E_NOSIGNATURE = 0x800B0100
+TRUST_E_SUBJECT_FORM_UNKNOWN = 0x800B0003
+TRUST_E_PROVIDER_UNKNOWN = 0x800B0001
+
+def file_identity(path):
+    """
+    Get the cache identity of a file.
+    
+    Args:
+        path: File path
+    
+    Returns:
+        tuple: (normalized path, size, mtime in ns), or None if the file cannot be read
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return os.path.normcase(os.path.abspath(path)), stat.st_size, stat.st_mtime_ns
+
+def hash_file(path):
+    """
+    Get the SHA-256 of a file, reading it through a memory map.
+    
+    Args:
+        path: File path
+    
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        except ValueError:
+            # Empty files cannot be mapped
+            pass
+    return digest.hexdigest()
+
+# Structures for WinVerifyTrust
+class GUID(ctypes.Structure):
+    _fields_ = [("Data1", ctypes.c_ulong), ("Data2", ctypes.c_ushort),
+                ("Data3", ctypes.c_ushort), ("Data4", ctypes.c_ubyte * 8)]
+
+class WINTRUST_FILE_INFO(ctypes.Structure):
+    _fields_ = [("cbStruct", ctypes.c_ulong), ("pcwszFilePath", ctypes.c_wchar_p),
+                ("hFile", ctypes.c_void_p), ("pgKnownSubject", ctypes.POINTER(GUID))]
+
+class WINTRUST_DATA(ctypes.Structure):
+    _fields_ = [("cbStruct", ctypes.c_ulong), ("pPolicyCallbackData", ctypes.c_void_p),
+                ("pSIPClientData", ctypes.c_void_p), ("dwUIChoice", ctypes.c_ulong),
+                ("fdwRevocationChecks", ctypes.c_ulong), ("dwUnionChoice", ctypes.c_ulong),
+                ("pFile", ctypes.POINTER(WINTRUST_FILE_INFO)), ("dwStateAction", ctypes.c_ulong),
+                ("hWVTStateData", ctypes.c_void_p), ("pwszURLReference", ctypes.c_wchar_p),
+                ("dwProvFlags", ctypes.c_ulong), ("dwUIContext", ctypes.c_ulong),
+                ("pSignatureSettings", ctypes.c_void_p)]
+
+# WINTRUST_ACTION_GENERIC_VERIFY_V2
+GENERIC_VERIFY_V2 = GUID(0x00AAC56B, 0xCD44, 0x11D0,
+                         (ctypes.c_ubyte * 8)(0x8C, 0xC2, 0x00, 0xC0, 0x4F, 0xC2, 0x95, 0xEE))
+
+def check_signature(path):
+    """
+    Check the embedded Authenticode signature of a file.
+    
+    Revocation is not checked and nothing is fetched from the network.
+    Files signed only through a system catalog report no embedded signature.
+    
+    Args:
+        path: File path
+    
+    Returns:
+        str: SIGNED, UNSIGNED, INVALID, or UNKNOWN outside Windows
+    """
+    if platform.system() != 'Windows':
+        return UNKNOWN
+    
+    file_info = WINTRUST_FILE_INFO(ctypes.sizeof(WINTRUST_FILE_INFO), path, None, None)
+    data = WINTRUST_DATA()
+    data.cbStruct = ctypes.sizeof(WINTRUST_DATA)
+    data.dwUIChoice = 2           # WTD_UI_NONE
+    data.fdwRevocationChecks = 0  # WTD_REVOKE_NONE
+    data.dwUnionChoice = 1        # WTD_CHOICE_FILE
+    data.pFile = ctypes.pointer(file_info)
+    data.dwStateAction = 1        # WTD_STATEACTION_VERIFY
+    data.dwProvFlags = 0x1000     # WTD_CACHE_ONLY_URL_RETRIEVAL
+    
+    verify = ctypes.windll.wintrust.WinVerifyTrust
+    verify.restype = ctypes.c_long
+    try:
+        result = verify(None, ctypes.byref(GENERIC_VERIFY_V2), ctypes.byref(data)) & 0xFFFFFFFF
+    finally:
+        data.dwStateAction = 2    # WTD_STATEACTION_CLOSE
+        verify(None, ctypes.byref(GENERIC_VERIFY_V2), ctypes.byref(data))
+    
+    if result == 0:
+        return SIGNED
+    if result in (TRUST_E_NOSIGNATURE, TRUST_E_SUBJECT_FORM_UNKNOWN, TRUST_E_PROVIDER_UNKNOWN):
+        return UNSIGNED
+    return INVALID
+
+class FileHashCache:
+    """
+    Persistent cache of file hashes and signature states.
+    
+    Entries are stored per path along with the size and modification time
+    they were computed for, so a file is only hashed again after it
+    changes. Misses are hashed on a thread pool; concurrent requests for
+    the same file share one job and all of their callbacks are called
+    with its result. The cache is written back on save() and at exit.
+    """
+    
+    def __init__(self, cache_file=None, workers=2):
+        if cache_file is None:
+            data_dir = os.path.join(os.path.expanduser('~'), 'AppData', 'Local', 'WindowsSystemManager')
+            cache_file = os.path.join(data_dir, 'file_hashes.json')
+        
+        self.cache_file = cache_file
+        self._entries = {}   # normalized path -> {size, mtime, sha256, signature}
+        self._pending = {}   # identity -> callbacks waiting for the result
+        self._futures = set()  # hashing jobs not yet finished
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file-hash")
+        self.load()
+        atexit.register(self.save)
+    
+    def load(self):
+        """Load cached entries from the cache file."""
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                entries = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading file hash cache: {e}")
+            return
+        if isinstance(entries, dict):
+            with self._lock:
+                self._entries = entries
+    
+    def save(self):
+        """Write the cache file if entries were added since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            # Drop the oldest entries beyond the limit
+            for path in list(self._entries)[:max(0, len(self._entries) - MAX_ENTRIES)]:
+                del self._entries[path]
+            data = json.dumps(self._entries)
+            self._dirty = False
+        
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            temp_file = self.cache_file + '.tmp'
+            with open(temp_file, 'w') as f:
+                f.write(data)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"Error saving file hash cache: {e}")
+    
+    def lookup(self, path):
+        """
+        Get the cached hash of a file if it has not changed since.
+        
+        Args:
+            path: File path
+        
+        Returns:
+            dict: Entry with sha256 and signature, or None on a miss
+        """
+        identity = file_identity(path)
+        if identity is None:
+            return None
+        return self._cached(identity)
+    
+    def request(self, path, callback):
+        """
+        Get the hash of a file, computing it in the background on a miss.
+        
+        Args:
+            path: File path
+            callback: Called as callback(path, entry) from a pool thread
+                      once the file is hashed; entry is None on failure
+        
+        Returns:
+            dict: The cached entry on a hit, in which case callback is not
+                  called; None otherwise
+        """
+        identity = file_identity(path)
+        if identity is None:
+            return None
+        
+        with self._lock:
+            entry = self._cached(identity)
+            if entry is not None:
+                return entry
+            waiting = self._pending.get(identity)
+            if waiting is not None:
+                waiting.append((path, callback))
+                return None
+            self._pending[identity] = [(path, callback)]
+        
+        future = self._pool.submit(self._compute, identity)
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return None
+    
+    def pending(self, path):
+        """Check whether a file is being hashed."""
+        identity = file_identity(path)
+        return identity is not None and identity in self._pending
+    
+    def shutdown(self):
+        """Stop the hashing threads and save the cache."""
+        # Cancel queued jobs by hand; shutdown(cancel_futures=True) needs Python 3.9
+        for future in list(self._futures):
+            future.cancel()
+        self._pool.shutdown(wait=False)
+        self.save()
+    
+    def _cached(self, identity):
+        """Get the entry of an identity if its size and mtime still match."""
+        path, size, mtime = identity
+        entry = self._entries.get(path)
+        if entry is not None and entry['size'] == size and entry['mtime'] == mtime:
+            return entry
+        return None
+    
+    def _compute(self, identity):
+        """Hash a file and hand the result to everyone waiting for it."""
+        path, size, mtime = identity
+        try:
+            entry = {
+                'size': size,
+                'mtime': mtime,
+                'sha256': hash_file(path),
+                'signature': check_signature(path)
+            }
+        except Exception as e:
+            print(f"Error hashing {path}: {e}")
+            entry = None
+        
+        with self._lock:
+            if entry is not None:
+                # Re-inserting moves the path to the newest end
+                self._entries.pop(path, None)
+                self._entries[path] = entry
+                self._dirty = True
+            waiting = self._pending.pop(identity, [])
+        
+        for requested_path, callback in waiting:
+            try:
+                callback(requested_path, entry)
+            except Exception as e:
+                # The receiver may have been closed meanwhile
+                print(f"Error delivering hash of {requested_path}: {e}")
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+def shared_hash_cache():
+    """Get the cache shared by all tabs, creating it on first use."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = FileHashCache()
+        return _shared_cache
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Runaway process detection for Windows System Manager.
+Flags processes whose CPU or memory use stays far above their own baseline or a fixed ceiling.
+"""
+
+import os
+import json
+import math
+import threading
+
+import psutil
+
+# Detector settings that can be set in the configuration file; a ceiling of null is not checked.
+# The CPU ceiling is a percentage of all logical cores together.
+DEFAULT_SETTINGS = {
+    'cpu_ceiling': 90.0,
+    'rss_ceiling_mb': None,
+    'z_threshold': 3.0,
+    'sustain': 3,
+    'min_cpu_excess': 20.0,
+    'min_rss_excess_mb': 200.0
+}
+
+def load_runaway_settings(config_file=None):
+    """
+    Read the runaway detection settings, creating the file with the defaults if it is missing.
+    
+    Args:
+        config_file: Path of the JSON settings file
+    
+    Returns:
+        dict: Keyword arguments for RunawayDetector; unknown or invalid
+              entries are replaced by their defaults
+    """
+    if config_file is None:
+        data_dir = os.path.join(os.path.expanduser('~'), 'AppData', 'Local', 'WindowsSystemManager')
+        config_file = os.path.join(data_dir, 'runaway_detection.json')
+    
+    if not os.path.exists(config_file):
+        try:
+            os.makedirs(os.path.dirname(config_file), exist_ok=True)
+            with open(config_file, 'w') as f:
+                json.dump(DEFAULT_SETTINGS, f, indent=2)
+        except (IOError, OSError) as e:
+            print(f"Error writing runaway detection settings: {str(e)}")
+        return dict(DEFAULT_SETTINGS)
+    
+    try:
+        with open(config_file, 'r') as f:
+            config = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error reading runaway detection settings: {str(e)}")
+        return dict(DEFAULT_SETTINGS)
+    
+    settings = dict(DEFAULT_SETTINGS)
+    if not isinstance(config, dict):
+        return settings
+    for name, default in DEFAULT_SETTINGS.items():
+        if name not in config:
+            continue
+        value = config[name]
+        if value is None and 'ceiling' in name:
+            settings[name] = None
+            continue
+        try:
+            settings[name] = int(value) if name == 'sustain' else float(value)
+        except (TypeError, ValueError):
+            print(f"Skipping invalid runaway detection setting {name}: {value!r}")
+    return settings
+
+class RunawayDetector:
+    """
+    Streaming detector of runaway processes.
+    
+    Each process keeps an exponentially weighted mean and variance of its
+    CPU and memory use, updated in O(1) per sample. Every live process is
+    sampled once per registry update, whether or not its row changed, so
+    `sustain` counts consecutive updates. A sample is out of line when it
+    is above a ceiling, or more
+    than `z_threshold` deviations (and at least a minimum amount) above
+    the process's baseline after `warmup` samples. Out of line samples are
+    folded into the baseline with the much smaller `adapt_alpha`, so a
+    spike stands out while a lasting step change becomes the new normal
+    after a few dozen samples. A process is flagged after `sustain`
+    consecutive out of line samples and cleared by the first normal one.
+    A ceiling of None is not checked. CPU use is per core, as in the
+    registry, and is divided by the number of logical cores before it is
+    compared with the CPU ceiling.
+    """
+    
+    # Per-process state layout
+    _COUNT, _CPU_MEAN, _CPU_VAR, _RSS_MEAN, _RSS_VAR, _STREAK = range(6)
+    
+    def __init__(self, alpha=0.1, z_threshold=3.0, sustain=3, warmup=10,
+                 cpu_ceiling=90.0, rss_ceiling_mb=None,
+                 min_cpu_excess=20.0, min_rss_excess_mb=200.0, adapt_alpha=0.005, cores=None):
+        self.alpha = alpha
+        self.cores = cores or psutil.cpu_count(logical=True) or 1
+        self.adapt_alpha = adapt_alpha
+        self.z_threshold = z_threshold
+        self.sustain = sustain
+        self.warmup = warmup
+        self.cpu_ceiling = cpu_ceiling
+        self.rss_ceiling_mb = rss_ceiling_mb
+        self.min_cpu_excess = min_cpu_excess
+        self.min_rss_excess_mb = min_rss_excess_mb
+        self._state = {}    # (pid, create_time) -> [count, cpu mean, cpu var, rss mean, rss var, streak]
+        self._flagged = {}  # (pid, create_time) -> reason
+        self._lock = threading.Lock()
+    
+    def observe(self, key, cpu, rss):
+        """
+        Feed one sample of a process.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+            cpu: CPU usage in percent
+            rss: Resident memory in MB
+        
+        Returns:
+            str: Reason if the process became flagged with this sample, otherwise None
+        """
+        with self._lock:
+            return self._observe(key, cpu, rss)
+    
+    def sample(self, rows):
+        """
+        Feed one sample of every live process and drop the state of the rest.
+        
+        Args:
+            rows: All process dictionaries after a registry update
+        
+        Returns:
+            list: (process dictionary, reason) of processes flagged by this sample
+        """
+        flagged = []
+        live = set()
+        with self._lock:
+            for proc in rows:
+                key = (proc['pid'], proc['create_time'])
+                live.add(key)
+                reason = self._observe(key, proc['cpu_percent'], proc['memory_mb'])
+                if reason:
+                    flagged.append((proc, reason))
+            for key in [key for key in self._state if key not in live]:
+                del self._state[key]
+                self._flagged.pop(key, None)
+        return flagged
+    
+    def reason(self, key):
+        """
+        Get why a process is flagged.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+        
+        Returns:
+            str: Reason, or None if the process is not flagged
+        """
+        return self._flagged.get(key)
+    
+    def flagged(self):
+        """Get the reasons of all flagged processes by identity."""
+        with self._lock:
+            return dict(self._flagged)
+    
+    def __len__(self):
+        return len(self._state)
+    
+    def _observe(self, key, cpu, rss):
+        """Update a process's statistics; the caller holds the lock."""
+        state = self._state.get(key)
+        if state is None:
+            self._state[key] = [1, cpu, 0.0, rss, 0.0, 0]
+            return None
+        
+        count = state[self._COUNT]
+        cpu_share = cpu / self.cores
+        if self.cpu_ceiling is not None and cpu_share >= self.cpu_ceiling:
+            cpu_reason = f"CPU {cpu_share:.0f}% of all cores above the {self.cpu_ceiling:.0f}% ceiling"
+        else:
+            cpu_reason = self._check(cpu, state[self._CPU_MEAN], state[self._CPU_VAR], count,
+                                     None, self.min_cpu_excess, "CPU", "%")
+        rss_reason = self._check(rss, state[self._RSS_MEAN], state[self._RSS_VAR], count,
+                                 self.rss_ceiling_mb, self.min_rss_excess_mb, "Memory", " MB")
+        reason = cpu_reason or rss_reason
+        
+        alpha = self.alpha if reason is None else self.adapt_alpha
+        state[self._COUNT] = count + 1
+        state[self._CPU_MEAN], state[self._CPU_VAR] = self._update(
+            state[self._CPU_MEAN], state[self._CPU_VAR], cpu, alpha)
+        state[self._RSS_MEAN], state[self._RSS_VAR] = self._update(
+            state[self._RSS_MEAN], state[self._RSS_VAR], rss, alpha)
+        
+        if reason is None:
+            state[self._STREAK] = 0
+            self._flagged.pop(key, None)
+            return None
+        
+        state[self._STREAK] += 1
+        if state[self._STREAK] < self.sustain:
+            return None
+        
+        newly_flagged = key not in self._flagged
+        self._flagged[key] = reason
+        return reason if newly_flagged else None
+    
+    def _check(self, value, mean, var, count, ceiling, min_excess, label, unit):
+        """Describe why a sample is out of line, or return None if it is normal."""
+        if ceiling is not None and value >= ceiling:
+            return f"{label} {value:.0f}{unit} above the {ceiling:.0f}{unit} ceiling"
+        
+        if count >= self.warmup:
+            excess = value - mean
+            if excess >= min_excess and excess > self.z_threshold * math.sqrt(var):
+                return f"{label} {value:.0f}{unit}, baseline {mean:.0f}{unit}"
+        return None
+    
+    def _update(self, mean, var, value, alpha):
+        """Exponentially weighted update of a mean and variance."""
+        diff = value - mean
+        increment = alpha * diff
+        mean += increment
+        var = (1 - alpha) * (var + diff * increment)
+        return mean, var
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Network connection index for Windows System Manager.
+Maps process IDs to their TCP/UDP connections from one system-wide query.
+"""
+
+import socket
+import time
+
+import psutil
+
+def format_address(addr):
+    """Format a connection address as host:port."""
+    if not addr:
+        return ""
+    if ':' in addr.ip:
+        return f"[{addr.ip}]:{addr.port}"
+    return f"{addr.ip}:{addr.port}"
+
+def describe_connection(conn):
+    """
+    Get the display fields of a connection.
+    
+    Args:
+        conn: Connection tuple from psutil.net_connections
+    
+    Returns:
+        dict: Protocol, local and remote address, and status
+    """
+    if conn.type == socket.SOCK_STREAM:
+        protocol = "TCP"
+    elif conn.type == socket.SOCK_DGRAM:
+        protocol = "UDP"
+    else:
+        protocol = str(conn.type)
+    if conn.family == socket.AF_INET6:
+        protocol += "6"
+    
+    return {
+        'protocol': protocol,
+        'local': format_address(conn.laddr),
+        'remote': format_address(conn.raddr),
+        'status': conn.status if conn.status != psutil.CONN_NONE else ""
+    }
+
+class ConnectionIndex:
+    """
+    TCP/UDP connections of all processes, indexed by PID.
+    
+    The index is built from a single psutil.net_connections() call instead
+    of one Process.connections() call per process, so lookups are O(1).
+    Connections change less often than CPU usage is worth sampling, so
+    refresh() only rebuilds the index once it is older than `max_age`.
+    """
+    
+    def __init__(self, max_age=10.0):
+        self.max_age = max_age
+        self._by_pid = {}  # pid -> list of connections
+        self._built_at = None
+    
+    def refresh(self, force=False):
+        """
+        Rebuild the index if it is stale.
+        
+        Args:
+            force: Rebuild regardless of the index's age
+        
+        Returns:
+            bool: True if the index was rebuilt
+        """
+        now = time.monotonic()
+        if not force and self._built_at is not None and now - self._built_at < self.max_age:
+            return False
+        
+        try:
+            connections = psutil.net_connections(kind='inet')
+        except (psutil.AccessDenied, OSError) as e:
+            print(f"Error getting network connections: {str(e)}")
+            connections = []
+        
+        by_pid = {}
+        for conn in connections:
+            if conn.pid:
+                by_pid.setdefault(conn.pid, []).append(conn)
+        
+        # One assignment, so readers on the GUI thread see either the old or the new index
+        self._by_pid = by_pid
+        self._built_at = now
+        return True
+    
+    def connections(self, pid):
+        """
+        Get the connections owned by a process.
+        
+        Args:
+            pid: Process ID
+        
+        Returns:
+            list: Connection tuples from psutil.net_connections
+        """
+        return self._by_pid.get(pid, [])
+    
+    def count(self, pid):
+        """Get the number of connections owned by a process."""
+        return len(self._by_pid.get(pid, ()))
+    
+    def __len__(self):
+        return sum(len(conns) for conns in self._by_pid.values())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Process freezing for Windows System Manager.
+Suspends sets of processes as named groups and resumes them together.
+"""
+
+import os
+import time
+import atexit
+import threading
+
+import psutil
+
+def collect_tree(rows, roots):
+    """
+    Get processes together with all of their descendants.
+    
+    A process whose parent PID was reused (the parent started later) is
+    not counted as a child.
+    
+    Args:
+        rows: Process dictionaries with pid, ppid and create_time
+        roots: Process dictionaries to start from
+    
+    Returns:
+        list: The roots followed by their descendants, without duplicates
+    """
+    children = {}
+    for row in rows:
+        children.setdefault(row.get('ppid'), []).append(row)
+    
+    result = []
+    seen = set()
+    pending = list(roots)
+    while pending:
+        proc = pending.pop()
+        key = (proc['pid'], proc['create_time'])
+        if key in seen:
+            continue
+        seen.add(key)
+        result.append(proc)
+        pending.extend(child for child in children.get(proc['pid'], [])
+                       if child['pid'] != proc['pid'] and child['create_time'] >= proc['create_time'])
+    return result
+
+def collect_group(rows, roots):
+    """
+    Get every process that shares an image name with one of the given processes.
+    
+    Args:
+        rows: Process dictionaries with pid, create_time and name
+        roots: Process dictionaries whose names to match, case-insensitively
+    
+    Returns:
+        list: Matching process dictionaries
+    """
+    names = {proc['name'].lower() for proc in roots}
+    return [row for row in rows if row['name'].lower() in names]
+
+class FrozenGroup:
+    """Processes suspended together by one freeze."""
+    
+    def __init__(self, group_id, name, members):
+        self.group_id = group_id
+        self.name = name
+        self.members = members  # (pid, create_time) -> (psutil.Process, name)
+        self.frozen_at = time.time()
+    
+    def __len__(self):
+        return len(self.members)
+
+class ProcessFreezer:
+    """
+    Suspends and resumes sets of processes as groups.
+    
+    freeze() suspends every process of a selection and records the ones
+    that were suspended as one group; thaw() resumes a group as a unit.
+    Both return a result per PID and are meant to run on a worker thread.
+    Processes under a CpuLimiter are held by the limiter while frozen, so
+    its duty cycle does not resume them. Every group is resumed by
+    thaw_all(), which also runs at interpreter exit.
+    """
+    
+    def __init__(self, limiter=None):
+        self.limiter = limiter
+        self._groups = {}  # group id -> FrozenGroup
+        self._frozen = {}  # (pid, create_time) -> group id
+        self._next_id = 1
+        self._lock = threading.Lock()
+        atexit.register(self.thaw_all)
+    
+    def freeze(self, processes, name):
+        """
+        Suspend processes as one group.
+        
+        Args:
+            processes: Process dictionaries with pid, create_time and name
+            name: Group name shown to the user
+        
+        Returns:
+            tuple: (FrozenGroup or None if nothing was suspended, list of
+                   result dictionaries with pid, name, ok and error)
+        """
+        results = []
+        members = {}
+        candidates = []
+        
+        with self._lock:
+            for proc in processes:
+                key = (proc['pid'], proc['create_time'])
+                if proc['pid'] == os.getpid():
+                    results.append(self._result(proc, "Cannot freeze this application"))
+                elif key in self._frozen:
+                    results.append(self._result(proc, "Already frozen"))
+                else:
+                    candidates.append(proc)
+            
+            keys = [(proc['pid'], proc['create_time']) for proc in candidates]
+            if self.limiter is not None:
+                self.limiter.hold(keys)
+            
+            for proc in candidates:
+                key = (proc['pid'], proc['create_time'])
+                try:
+                    handle = psutil.Process(proc['pid'])
+                    if handle.create_time() != proc['create_time']:
+                        raise psutil.NoSuchProcess(proc['pid'])
+                    handle.suspend()
+                    members[key] = (handle, proc['name'])
+                    results.append(self._result(proc))
+                except psutil.NoSuchProcess:
+                    results.append(self._result(proc, "Process has exited"))
+                except psutil.AccessDenied:
+                    results.append(self._result(proc, "Access denied"))
+                except Exception as e:
+                    results.append(self._result(proc, str(e)))
+            
+            if self.limiter is not None:
+                self.limiter.release([key for key in keys if key not in members])
+            
+            if not members:
+                return None, results
+            
+            group = FrozenGroup(self._next_id, name, members)
+            self._next_id += 1
+            self._groups[group.group_id] = group
+            for key in members:
+                self._frozen[key] = group.group_id
+        return group, results
+    
+    def thaw(self, group_ids):
+        """
+        Resume every process of the given groups.
+        
+        Args:
+            group_ids: IDs of groups returned by freeze()
+        
+        Returns:
+            list: Result dictionaries with pid, name, ok and error
+        """
+        results = []
+        with self._lock:
+            for group_id in group_ids:
+                group = self._groups.pop(group_id, None)
+                if group is None:
+                    continue
+                for key in group.members:
+                    self._frozen.pop(key, None)
+                
+                for key, (handle, name) in group.members.items():
+                    proc = {'pid': key[0], 'name': name}
+                    try:
+                        handle.resume()
+                        results.append(self._result(proc))
+                    except psutil.NoSuchProcess:
+                        results.append(self._result(proc, "Process has exited"))
+                    except psutil.AccessDenied:
+                        results.append(self._result(proc, "Access denied"))
+                    except Exception as e:
+                        results.append(self._result(proc, str(e)))
+                
+                if self.limiter is not None:
+                    self.limiter.release(list(group.members))
+        return results
+    
+    def thaw_all(self):
+        """
+        Resume every frozen group.
+        
+        Returns:
+            list: Result dictionaries of all groups
+        """
+        return self.thaw(list(self._groups))
+    
+    def group_of(self, key):
+        """
+        Get the group a process is frozen in.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+        
+        Returns:
+            FrozenGroup: The group, or None if the process is not frozen
+        """
+        group_id = self._frozen.get(key)
+        return self._groups.get(group_id) if group_id is not None else None
+    
+    def is_frozen(self, key):
+        """Check whether a process is frozen."""
+        return key in self._frozen
+    
+    def groups(self):
+        """Get the frozen groups, oldest first."""
+        with self._lock:
+            return list(self._groups.values())
+    
+    def forget(self, keys):
+        """
+        Drop exited processes from their groups, dropping groups once empty.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        with self._lock:
+            gone = []
+            for key in keys:
+                group_id = self._frozen.pop(key, None)
+                if group_id is None:
+                    continue
+                gone.append(key)
+                group = self._groups[group_id]
+                del group.members[key]
+                if not group.members:
+                    del self._groups[group_id]
+            
+            # The limiter drops exited targets once they are back in its duty cycle
+            if gone and self.limiter is not None:
+                self.limiter.release(gone)
+    
+    def __len__(self):
+        return len(self._frozen)
+    
+    @staticmethod
+    def _result(proc, error=None):
+        """Build the result of one process."""
+        return {'pid': proc['pid'], 'name': proc['name'], 'ok': error is None, 'error': error}
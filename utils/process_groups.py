@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Process grouping for Windows System Manager.
+Collapses processes with the same image name into groups with summed usage.
+"""
+
+from utils.process_tree import TreeListener
+
+# Values summed over each group
+GROUP_FIELDS = ('cpu_percent', 'memory_mb', 'num_threads')
+
+class GroupMember:
+    """A process inside a group."""
+    
+    def __init__(self, key, row, group):
+        self.key = key
+        self.row = row
+        self.group = group
+
+class ProcessGroup:
+    """Processes sharing an image name, with their summed usage."""
+    
+    def __init__(self, name):
+        self.name = name
+        self.members = []
+        self.totals = {field: 0 for field in GROUP_FIELDS}
+    
+    def __len__(self):
+        return len(self.members)
+
+class ProcessGroups:
+    """
+    Processes grouped by image name, kept current from registry deltas.
+    
+    Names are compared case-insensitively. apply_delta() only touches the
+    groups of processes in the delta: members are added or removed and
+    the change in usage is added to the group totals, so the list is never
+    regrouped as a whole. Structural changes are reported to a
+    TreeListener with groups as top-level nodes and members below them.
+    """
+    
+    def __init__(self, listener=None):
+        self.listener = listener if listener is not None else TreeListener()
+        self.groups = []
+        self._by_name = {}  # lowercase name -> ProcessGroup
+        self._members = {}  # (pid, create_time) -> GroupMember
+    
+    def build(self, rows):
+        """
+        Group a full snapshot.
+        
+        Args:
+            rows: Process dictionaries with pid, create_time and name
+        """
+        self.groups = []
+        self._by_name = {}
+        self._members = {}
+        
+        for row in rows:
+            group = self._by_name.get(row['name'].lower())
+            if group is None:
+                group = ProcessGroup(row['name'])
+                self._by_name[row['name'].lower()] = group
+                self.groups.append(group)
+            member = GroupMember((row['pid'], row['create_time']), row, group)
+            group.members.append(member)
+            self._members[member.key] = member
+            for field in GROUP_FIELDS:
+                group.totals[field] += row.get(field, 0)
+    
+    def apply_delta(self, delta):
+        """
+        Apply a registry delta to the affected groups.
+        
+        Args:
+            delta: ProcessDelta with added, changed and exited processes
+        """
+        for key in delta.exited:
+            member = self._members.get(key)
+            if member is not None:
+                self._remove(member)
+        
+        for row in delta.changed:
+            member = self._members.get((row['pid'], row['create_time']))
+            if member is None:
+                continue
+            group = member.group
+            for field in GROUP_FIELDS:
+                group.totals[field] += row.get(field, 0) - member.row.get(field, 0)
+            member.row = row
+            self.listener.node_changed(member)
+            self.listener.node_changed(group)
+        
+        for row in delta.added:
+            key = (row['pid'], row['create_time'])
+            if key not in self._members:
+                self._add(key, row)
+    
+    def group_of(self, key):
+        """Get the group of a process identity, if it is grouped."""
+        member = self._members.get(key)
+        return member.group if member is not None else None
+    
+    def _add(self, key, row):
+        """Add a process to its group, creating the group if needed."""
+        group = self._by_name.get(row['name'].lower())
+        if group is None:
+            group = ProcessGroup(row['name'])
+            self.listener.begin_insert(None, len(self.groups))
+            self._by_name[row['name'].lower()] = group
+            self.groups.append(group)
+            self.listener.end_insert()
+        
+        member = GroupMember(key, row, group)
+        self.listener.begin_insert(group, len(group.members))
+        group.members.append(member)
+        self._members[key] = member
+        self.listener.end_insert()
+        
+        for field in GROUP_FIELDS:
+            group.totals[field] += row.get(field, 0)
+        self.listener.node_changed(group)
+    
+    def _remove(self, member):
+        """Remove a process from its group, dropping the group once empty."""
+        group = member.group
+        self.listener.begin_remove(group, group.members.index(member))
+        group.members.remove(member)
+        del self._members[member.key]
+        self.listener.end_remove()
+        
+        if not group.members:
+            self.listener.begin_remove(None, self.groups.index(group))
+            self.groups.remove(group)
+            del self._by_name[group.name.lower()]
+            self.listener.end_remove()
+            return
+        
+        for field in GROUP_FIELDS:
+            group.totals[field] -= member.row.get(field, 0)
+        self.listener.node_changed(group)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Process history storage for Windows System Manager.
+Keeps recent CPU, memory and I/O samples for live processes in fixed-size ring buffers.
+"""
+
+import threading
+from array import array
+
+class ProcessHistory:
+    """
+    Fixed-size, array-backed history of per-process samples.
+    
+    Every metric is one preallocated array('f') holding a ring buffer of
+    `length` samples for each of `max_processes` slots, so memory use is
+    fixed up front (see memory_bytes). A process identity is given a slot
+    on first sight and the slot is recycled when the process exits.
+    
+    Only processes that changed need to be recorded on a tick; processes
+    that were not recorded repeat their last value.
+    """
+    
+    METRICS = ('cpu', 'rss', 'io')
+    
+    def __init__(self, length=200, max_processes=2048):
+        self.length = length
+        self.max_processes = max_processes
+        self._data = {metric: array('f', bytes(4 * length * max_processes))
+                      for metric in self.METRICS}
+        self._last_tick = array('q', bytes(8 * max_processes))
+        self._first_tick = array('q', bytes(8 * max_processes))
+        self._slots = {}  # (pid, create_time) -> slot number
+        self._free = list(range(max_processes - 1, -1, -1))
+        self._tick = 0
+        self._lock = threading.Lock()
+    
+    def begin_tick(self):
+        """Start a new sampling interval."""
+        with self._lock:
+            self._tick += 1
+    
+    def record(self, key, cpu, rss, io):
+        """
+        Record the current sample of a process.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+            cpu: CPU usage in percent
+            rss: Resident memory in MB
+            io: Disk I/O in bytes per second
+        """
+        with self._lock:
+            self._record(key, {'cpu': cpu, 'rss': rss, 'io': io})
+    
+    def apply_delta(self, delta):
+        """
+        Record added and changed processes and release exited ones.
+        
+        Args:
+            delta: ProcessDelta from the process registry
+        """
+        with self._lock:
+            for proc in delta.added + delta.changed:
+                self._record((proc['pid'], proc['create_time']), {
+                    'cpu': proc['cpu_percent'],
+                    'rss': proc['memory_mb'],
+                    'io': proc.get('io_bytes_per_sec', 0)
+                })
+            for key in delta.exited:
+                self._release(key)
+    
+    def release(self, keys):
+        """
+        Free the slots of processes that have exited.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        with self._lock:
+            for key in keys:
+                self._release(key)
+    
+    def series(self, key, metric):
+        """
+        Get the recorded samples of a process, oldest first.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+            metric: One of METRICS
+        
+        Returns:
+            list: Up to `length` samples ending at the current tick
+        """
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                return []
+            
+            data = self._data[metric]
+            base = slot * self.length
+            last_tick = self._last_tick[slot]
+            first_tick = max(self._first_tick[slot], self._tick - self.length + 1)
+            last_value = data[base + last_tick % self.length]
+            
+            values = []
+            for tick in range(first_tick, self._tick + 1):
+                if tick <= last_tick:
+                    values.append(data[base + tick % self.length])
+                else:
+                    values.append(last_value)
+            return values
+    
+    def __contains__(self, key):
+        return key in self._slots
+    
+    def __len__(self):
+        return len(self._slots)
+    
+    def memory_bytes(self):
+        """
+        Get the fixed memory footprint of the sample buffers.
+        
+        Returns:
+            int: Bytes allocated for samples and slot bookkeeping
+        """
+        samples = sum(data.itemsize * len(data) for data in self._data.values())
+        bookkeeping = (self._last_tick.itemsize * len(self._last_tick) +
+                       self._first_tick.itemsize * len(self._first_tick))
+        return samples + bookkeeping
+    
+    def _record(self, key, values):
+        """Write a sample for a process; the caller holds the lock."""
+        slot = self._slots.get(key)
+        if slot is None:
+            if not self._free:
+                return
+            slot = self._free.pop()
+            self._slots[key] = slot
+            self._first_tick[slot] = self._tick
+            self._last_tick[slot] = self._tick
+        
+        base = slot * self.length
+        last_tick = self._last_tick[slot]
+        
+        # Repeat the last value over the ticks where the process was unchanged
+        gap_start = max(last_tick + 1, self._tick - self.length + 1)
+        for metric, value in values.items():
+            data = self._data[metric]
+            last_value = data[base + last_tick % self.length]
+            for tick in range(gap_start, self._tick):
+                data[base + tick % self.length] = last_value
+            data[base + self._tick % self.length] = value
+        
+        self._last_tick[slot] = self._tick
+    
+    def _release(self, key):
+        """Return a process's slot to the free list; the caller holds the lock."""
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self._free.append(slot)
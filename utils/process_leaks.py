@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Leak trend detection for Windows System Manager.
+Tracks handle and thread counts per process and flags counts that grow steadily.
+"""
+
+import math
+import threading
+from array import array
+
+class RollingTrend:
+    """
+    Least-squares slope of the last `window` samples, updated in O(1).
+    
+    Samples are taken at equal intervals, so x is the sample number. The
+    sums of y, x*y and y*y are kept for the window; the oldest sample is
+    subtracted as a new one is added, using the ring buffer of values.
+    """
+    
+    __slots__ = ('values', 'count', 'total', 'sum_y', 'sum_xy', 'sum_yy')
+    
+    def __init__(self, window):
+        self.values = array('f', bytes(4 * window))
+        self.count = 0   # samples in the window
+        self.total = 0   # samples ever added; the x of the next sample
+        self.sum_y = 0.0
+        self.sum_xy = 0.0
+        self.sum_yy = 0.0
+    
+    def add(self, y):
+        """Add the next sample, dropping the oldest once the window is full."""
+        window = len(self.values)
+        x = self.total
+        pos = x % window
+        if self.count == window:
+            old = self.values[pos]
+            self.sum_y -= old
+            self.sum_xy -= (x - window) * old
+            self.sum_yy -= old * old
+        else:
+            self.count += 1
+        
+        self.values[pos] = y
+        self.sum_y += y
+        self.sum_xy += x * y
+        self.sum_yy += y * y
+        self.total += 1
+    
+    def fit(self):
+        """
+        Get the slope and correlation of the samples in the window.
+        
+        Returns:
+            tuple: (slope per sample, correlation coefficient); (0.0, 0.0)
+                   with fewer than three samples or constant values
+        """
+        n = self.count
+        if n < 3:
+            return 0.0, 0.0
+        
+        first = self.total - n
+        sum_x = n * first + n * (n - 1) / 2
+        # n * sum(x^2) - sum(x)^2 for n consecutive integers
+        x_spread = n * n * (n * n - 1) / 12
+        covariance = n * self.sum_xy - sum_x * self.sum_y
+        y_spread = n * self.sum_yy - self.sum_y * self.sum_y
+        if y_spread <= 1e-9:
+            return 0.0, 0.0
+        
+        slope = covariance / x_spread
+        correlation = covariance / math.sqrt(x_spread * y_spread)
+        return slope, correlation
+
+class LeakTrendTracker:
+    """
+    Flags processes whose handle or thread count grows steadily.
+    
+    Processes are sampled every `interval` seconds into compact ring
+    buffers of `window` samples. A process is flagged when, over at least
+    `min_samples` samples, a count rises by more than the per-hour
+    threshold with a correlation of at least `min_correlation`, meaning
+    it grows steadily rather than in one jump.
+    """
+    
+    def __init__(self, interval=60.0, window=120, min_samples=30, min_correlation=0.9,
+                 handles_per_hour=20.0, threads_per_hour=2.0):
+        self.interval = interval
+        self.window = window
+        self.min_samples = min_samples
+        self.min_correlation = min_correlation
+        self.handles_per_hour = handles_per_hour
+        self.threads_per_hour = threads_per_hour
+        self._trends = {}  # (pid, create_time) -> (handle trend, thread trend)
+        self._growth = {}  # (pid, create_time) -> (handles/hour, threads/hour, flagged)
+        self._forgotten = set()  # exited identities that may still be in a row snapshot
+        self._lock = threading.Lock()
+    
+    def sample(self, rows, handle_counts):
+        """
+        Record the handle and thread counts of all live processes.
+        
+        Processes not in `rows` are dropped, processes already forgotten
+        are not sampled again, and processes whose handle count could not
+        be read skip this sample rather than recording a false 0.
+        
+        Args:
+            rows: Process dictionaries with num_threads
+            handle_counts: (pid, create_time) -> handle count, as read by
+                           ProcessRegistry.handle_counts()
+        """
+        per_hour = 3600.0 / self.interval
+        live = {(row['pid'], row['create_time']) for row in rows}
+        with self._lock:
+            for key in [key for key in self._trends if key not in live]:
+                del self._trends[key]
+                self._growth.pop(key, None)
+            # Identities never come back, so forgotten ones can be dropped once gone from the rows
+            self._forgotten &= live
+            
+            for row in rows:
+                key = (row['pid'], row['create_time'])
+                handles = handle_counts.get(key)
+                if handles is None or key in self._forgotten:
+                    continue
+                trends = self._trends.get(key)
+                if trends is None:
+                    trends = (RollingTrend(self.window), RollingTrend(self.window))
+                    self._trends[key] = trends
+                trends[0].add(handles)
+                trends[1].add(row.get('num_threads', 0))
+                
+                if trends[0].count < self.min_samples:
+                    continue
+                handle_slope, handle_r = trends[0].fit()
+                thread_slope, thread_r = trends[1].fit()
+                handle_growth = handle_slope * per_hour
+                thread_growth = thread_slope * per_hour
+                flagged = ((handle_growth >= self.handles_per_hour and handle_r >= self.min_correlation) or
+                           (thread_growth >= self.threads_per_hour and thread_r >= self.min_correlation))
+                self._growth[key] = (handle_growth, thread_growth, flagged)
+    
+    def growth(self, key):
+        """
+        Get the growth of a process's counts.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+        
+        Returns:
+            tuple: (handles per hour, threads per hour, flagged), or None
+                   until enough samples have been taken
+        """
+        return self._growth.get(key)
+    
+    def forget(self, keys):
+        """
+        Drop the history of processes that have exited.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        with self._lock:
+            for key in keys:
+                self._trends.pop(key, None)
+                self._growth.pop(key, None)
+                self._forgotten.add(key)
+    
+    def __len__(self):
+        return len(self._trends)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CPU limiter for Windows System Manager.
+Caps the CPU use of chosen processes by suspending and resuming them on a duty cycle.
+"""
+
+import os
+import time
+import atexit
+import threading
+
+import psutil
+
+class LimitedProcess:
+    """A process under a CPU limit and its duty cycle state."""
+    
+    def __init__(self, key, proc, limit):
+        self.key = key
+        self.proc = proc
+        self.limit = limit
+        self.run_fraction = 1.0
+        self.suspended = False
+        self.last_cpu = None
+        self.last_time = None
+        self.measured = 0.0
+
+class CpuLimiter:
+    """
+    Limits processes to a share of one CPU by duty cycling suspend/resume.
+    
+    One scheduler thread serves every limited process. Each period it
+    resumes all targets, then suspends each one once its share of the
+    period has run out. Every `adjust_interval` seconds the share is
+    corrected from the CPU time the process actually used, so the limit
+    holds whatever the process's load. Limits are in percent of one
+    CPU, like the registry's cpu_percent.
+    
+    Targets are resumed when their limit is removed, when the limiter is
+    stopped and, as a last resort, at interpreter exit. Held processes,
+    such as frozen ones, keep their limit but are left out of the duty
+    cycle until they are released.
+    """
+    
+    MIN_FRACTION = 0.02
+    
+    def __init__(self, period=0.1, adjust_interval=1.0):
+        self.period = period
+        self.adjust_interval = adjust_interval
+        self._targets = {}  # (pid, create_time) -> LimitedProcess
+        self._held = set()  # (pid, create_time) identities left out of the duty cycle
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread = None
+        atexit.register(self.stop)
+    
+    def set_limit(self, key, limit):
+        """
+        Limit a process to a percentage of one CPU.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+            limit: CPU limit in percent, above 0
+        
+        Returns:
+            bool: True if the limit was set; never for this application's
+                  own process, whose suspension would stop the limiter too
+        """
+        if limit <= 0 or key[0] == os.getpid():
+            return False
+        
+        try:
+            proc = psutil.Process(key[0])
+            if proc.create_time() != key[1]:
+                return False
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+        
+        with self._lock:
+            target = self._targets.get(key)
+            if target is None:
+                self._targets[key] = LimitedProcess(key, proc, limit)
+            else:
+                target.limit = limit
+            self._start()
+        return True
+    
+    def hold(self, keys):
+        """
+        Leave processes out of the duty cycle, resuming any it suspended.
+        
+        Used before another component suspends the processes, so the
+        limiter neither resumes them nor holds a suspension of its own.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        with self._lock:
+            for key in keys:
+                self._held.add(key)
+                target = self._targets.get(key)
+                if target is not None:
+                    self._resume(target)
+    
+    def release(self, keys):
+        """
+        Return held processes to the duty cycle.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        with self._lock:
+            for key in keys:
+                self._held.discard(key)
+                target = self._targets.get(key)
+                if target is not None:
+                    # CPU time measured while held would skew the share
+                    target.last_time = None
+            if any(key not in self._held for key in self._targets):
+                self._start()
+    
+    def remove(self, keys):
+        """
+        Remove the limits of processes and resume them.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        with self._lock:
+            for key in keys:
+                target = self._targets.pop(key, None)
+                if target is not None:
+                    self._resume(target)
+    
+    def limit(self, key):
+        """
+        Get the CPU limit of a process.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+        
+        Returns:
+            float: Limit in percent, or None if the process is not limited
+        """
+        target = self._targets.get(key)
+        return target.limit if target is not None else None
+    
+    def limits(self):
+        """Get the limits of all limited processes by identity."""
+        with self._lock:
+            return {key: target.limit for key, target in self._targets.items()}
+    
+    def stop(self):
+        """Remove all limits, resume every target and stop the scheduler thread."""
+        with self._lock:
+            self._stopping = True
+            for target in self._targets.values():
+                self._resume(target)
+            self._targets = {}
+            thread = self._thread
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+    
+    def __len__(self):
+        return len(self._targets)
+    
+    def _start(self):
+        """Start the scheduler thread if it is not running; the caller holds the lock."""
+        self._stopping = False
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="CpuLimiter", daemon=True)
+            self._thread.start()
+    
+    def _run(self):
+        """Scheduler loop; runs until no targets outside the held set are left."""
+        while True:
+            with self._lock:
+                targets = [target for key, target in self._targets.items() if key not in self._held]
+                if self._stopping or not targets:
+                    self._thread = None
+                    return
+            
+            start = time.monotonic()
+            for target in targets:
+                self._adjust(target, start)
+            
+            # Everyone runs at the start of the period, shortest share first to stop
+            with self._lock:
+                for target in targets:
+                    self._resume(target)
+            
+            for target in sorted(targets, key=lambda target: target.run_fraction):
+                if target.run_fraction >= 1.0:
+                    break
+                if self._sleep_until(start + target.run_fraction * self.period):
+                    break
+                with self._lock:
+                    if self._targets.get(target.key) is target and target.key not in self._held:
+                        self._suspend(target)
+            
+            self._sleep_until(start + self.period)
+    
+    def _sleep_until(self, deadline):
+        """Sleep until a deadline; returns True if woken to stop."""
+        delay = deadline - time.monotonic()
+        if delay > 0 and self._wake.wait(delay):
+            self._wake.clear()
+            return self._stopping
+        return False
+    
+    def _adjust(self, target, now):
+        """Correct a target's run fraction from its measured CPU use."""
+        if target.last_time is not None and now - target.last_time < self.adjust_interval:
+            return
+        
+        try:
+            times = target.proc.cpu_times()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            with self._lock:
+                if self._targets.get(target.key) is target:
+                    del self._targets[target.key]
+            return
+        
+        cpu = times.user + times.system
+        if target.last_time is not None:
+            target.measured = max(0.0, (cpu - target.last_cpu) / (now - target.last_time) * 100)
+            if target.measured > 0:
+                fraction = target.run_fraction * target.limit / target.measured
+            else:
+                fraction = target.run_fraction * 2
+            # Move halfway to the new fraction to avoid oscillating
+            fraction = (target.run_fraction + fraction) / 2
+            target.run_fraction = min(1.0, max(self.MIN_FRACTION, fraction))
+        
+        target.last_cpu = cpu
+        target.last_time = now
+    
+    def _suspend(self, target):
+        """Suspend a target; the caller holds the lock."""
+        if target.suspended:
+            return
+        try:
+            target.proc.suspend()
+            target.suspended = True
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            print(f"Error suspending process {target.key[0]}: {str(e)}")
+            self._targets.pop(target.key, None)
+    
+    def _resume(self, target):
+        """Resume a target if it is suspended; the caller holds the lock."""
+        if not target.suspended:
+            return
+        try:
+            target.proc.resume()
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            print(f"Error resuming process {target.key[0]}: {str(e)}")
+        target.suspended = False
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Memory map analysis for Windows System Manager.
+Breaks the memory of a process down by mapped module or path, with a short-lived cache.
+"""
+
+import time
+import threading
+
+import psutil
+
+class CancelToken:
+    """Flag that lets the GUI abandon a memory map read it no longer needs."""
+    
+    def __init__(self):
+        self._event = threading.Event()
+    
+    def cancel(self):
+        """Ask the reader to stop."""
+        self._event.set()
+    
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+def read_memory_maps(key, cancel=None):
+    """
+    Read the memory of a process grouped by mapped path.
+    
+    Private bytes are only reported where psutil provides them; on Windows
+    memory_maps() has RSS only and `private` is None. Once the slow
+    memory_maps() call has been made its result is always returned, so a
+    read cancelled meanwhile can still be cached.
+    
+    Args:
+        key: (pid, create_time) identity of the process
+        cancel: Optional CancelToken checked before the maps are read
+    
+    Returns:
+        list: Dictionaries with path, rss and private bytes, largest RSS
+              first, or None if the read was cancelled before it started
+    
+    Raises:
+        psutil.NoSuchProcess: If the process has exited
+        psutil.AccessDenied: If the memory maps cannot be read
+    """
+    proc = psutil.Process(key[0])
+    if proc.create_time() != key[1]:
+        raise psutil.NoSuchProcess(key[0])
+    if cancel is not None and cancel.cancelled:
+        return None
+    
+    maps = proc.memory_maps(grouped=True)
+    
+    regions = []
+    for region in maps:
+        private = None
+        if hasattr(region, 'private_clean'):
+            private = region.private_clean + region.private_dirty
+        elif hasattr(region, 'private'):
+            private = region.private
+        regions.append({
+            'path': region.path or "[anonymous]",
+            'rss': region.rss,
+            'private': private
+        })
+    
+    regions.sort(key=lambda region: region['rss'], reverse=True)
+    return regions
+
+class MemoryMapCache:
+    """
+    Memory map results per (pid, create_time), kept for `ttl` seconds.
+    
+    Reading the maps of a large process is slow, so switching between
+    processes or reopening the view reuses a recent result.
+    """
+    
+    def __init__(self, ttl=30.0):
+        self.ttl = ttl
+        self._entries = {}  # (pid, create_time) -> (read time, regions)
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """
+        Get a cached result that has not expired.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+        
+        Returns:
+            list: Regions from read_memory_maps, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                return None
+            return entry[1]
+    
+    def put(self, key, regions):
+        """Cache the regions of a process."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), regions)
+    
+    def fetch(self, key, cancel=None):
+        """
+        Get the regions of a process from the cache or read them.
+        
+        A read that completes after being cancelled is still cached; the
+        caller decides whether to show it.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+            cancel: Optional CancelToken for the read
+        
+        Returns:
+            list: Regions, or None if the read was cancelled before it started
+        """
+        regions = self.get(key)
+        if regions is None:
+            regions = read_memory_maps(key, cancel)
+            if regions is not None:
+                self.put(key, regions)
+        return regions
+    
+    def forget(self, keys):
+        """
+        Drop results of processes that have exited.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
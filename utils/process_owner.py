@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Process owner classification for Windows System Manager.
+Caches whether a process belongs to the current user or the system.
+"""
+
+class TokenQuery:
+    """Interface for reading the user SID from process tokens."""
+    
+    def current_user_sid(self):
+        """Return the SID of the user running this application."""
+        raise NotImplementedError
+    
+    def process_user_sid(self, pid):
+        """Return the SID of the user owning the given process."""
+        raise NotImplementedError
+
+class Win32TokenQuery(TokenQuery):
+    """Token queries through the Win32 security API."""
+    
+    def current_user_sid(self):
+        import win32api
+        import win32con
+        import win32security
+        
+        token = win32security.OpenProcessToken(win32api.GetCurrentProcess(), win32con.TOKEN_QUERY)
+        try:
+            return win32security.GetTokenInformation(token, win32security.TokenUser)[0]
+        finally:
+            token.Close()
+    
+    def process_user_sid(self, pid):
+        import win32api
+        import win32con
+        import win32security
+        
+        proc_handle = win32api.OpenProcess(win32con.PROCESS_QUERY_INFORMATION, False, pid)
+        try:
+            token = win32security.OpenProcessToken(proc_handle, win32con.TOKEN_QUERY)
+            try:
+                return win32security.GetTokenInformation(token, win32security.TokenUser)[0]
+            finally:
+                token.Close()
+        finally:
+            proc_handle.Close()
+
+class ProcessOwnerCache:
+    """
+    Caches the System/User classification of processes.
+    
+    The owner of a live process never changes, so each (pid, create_time)
+    identity is classified once. The current user's SID is resolved once
+    per session.
+    """
+    
+    def __init__(self, token_query=None):
+        self._query = token_query if token_query is not None else Win32TokenQuery()
+        self._current_sid = None
+        self._current_sid_resolved = False
+        self._types = {}  # (pid, create_time) -> "System" or "User"
+    
+    def current_user_sid(self):
+        """
+        Get the current user's SID, resolving it on first use.
+        
+        Returns:
+            The SID, or None if it could not be determined
+        """
+        if not self._current_sid_resolved:
+            self._current_sid_resolved = True
+            try:
+                self._current_sid = self._query.current_user_sid()
+            except Exception as e:
+                print(f"Could not get current user SID: {str(e)}")
+        return self._current_sid
+    
+    def classify(self, key, username=None):
+        """
+        Classify a process as a system or user process.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+            username: Process owner name; processes without one are System
+        
+        Returns:
+            str: "User" if owned by the current user, otherwise "System"
+        """
+        proc_type = self._types.get(key)
+        if proc_type is not None:
+            return proc_type
+        
+        proc_type = "System"
+        current_sid = self.current_user_sid()
+        if current_sid and username:
+            try:
+                if self._query.process_user_sid(key[0]) == current_sid:
+                    proc_type = "User"
+            except Exception:
+                pass
+        
+        self._types[key] = proc_type
+        return proc_type
+    
+    def forget(self, keys):
+        """
+        Drop cached classifications for processes that have exited.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        for key in keys:
+            self._types.pop(key, None)
+    
+    def __len__(self):
+        return len(self._types)
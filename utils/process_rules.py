@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Process rules for Windows System Manager.
+Applies configured priority, CPU affinity and I/O priority to processes as they start.
+"""
+
+import os
+import re
+import json
+import time
+import fnmatch
+import threading
+from collections import deque
+
+import psutil
+
+# Priority names and the psutil constants behind them (Windows only)
+PRIORITY_CLASSES = {
+    'idle': 'IDLE_PRIORITY_CLASS',
+    'below_normal': 'BELOW_NORMAL_PRIORITY_CLASS',
+    'normal': 'NORMAL_PRIORITY_CLASS',
+    'above_normal': 'ABOVE_NORMAL_PRIORITY_CLASS',
+    'high': 'HIGH_PRIORITY_CLASS',
+    'realtime': 'REALTIME_PRIORITY_CLASS'
+}
+PRIORITIES = tuple(PRIORITY_CLASSES)
+
+# I/O priority names and the psutil constants behind them (Windows only)
+IO_PRIORITIES = {
+    'very_low': 'IOPRIO_VERYLOW',
+    'low': 'IOPRIO_LOW',
+    'normal': 'IOPRIO_NORMAL',
+    'high': 'IOPRIO_HIGH'
+}
+
+# Example written to a new rules file
+DEFAULT_RULES = {
+    'rules': [
+        {'pattern': '*backup*.exe', 'priority': 'below_normal', 'affinity': '2-3', 'io_priority': 'low', 'enabled': False},
+        {'pattern': 'sqlservr.exe', 'priority': 'high', 'enabled': False}
+    ]
+}
+
+def parse_affinity(value):
+    """
+    Parse a CPU list such as [2, 3] or "0-1,4".
+    
+    Args:
+        value: List of CPU numbers or a string of numbers and ranges
+    
+    Returns:
+        list: Sorted CPU numbers
+    """
+    if isinstance(value, str):
+        cpus = set()
+        for part in value.split(','):
+            part = part.strip()
+            if '-' in part:
+                first, last = part.split('-', 1)
+                cpus.update(range(int(first), int(last) + 1))
+            elif part:
+                cpus.add(int(part))
+        return sorted(cpus)
+    return sorted({int(cpu) for cpu in value})
+
+class ProcessRule:
+    """A name pattern and the settings applied to matching processes."""
+    
+    def __init__(self, pattern, priority=None, affinity=None, io_priority=None):
+        if priority is not None and priority not in PRIORITIES:
+            raise ValueError(f"unknown priority '{priority}'")
+        if io_priority is not None and io_priority not in IO_PRIORITIES:
+            raise ValueError(f"unknown I/O priority '{io_priority}'")
+        
+        self.pattern = pattern
+        self.priority = priority
+        self.affinity = parse_affinity(affinity) if affinity is not None else None
+        self.io_priority = io_priority
+    
+    def describe(self):
+        """Get a short description of the rule's settings."""
+        settings = []
+        if self.priority:
+            settings.append(f"priority {self.priority}")
+        if self.affinity:
+            settings.append(f"cores {','.join(str(cpu) for cpu in self.affinity)}")
+        if self.io_priority:
+            settings.append(f"I/O {self.io_priority}")
+        return f"{self.pattern} -> {', '.join(settings) or 'nothing'}"
+
+class ProcessRuleEngine:
+    """
+    Applies process rules to new processes.
+    
+    Rules are read from a JSON file and compiled once: patterns without
+    wildcards go into a dictionary, the rest are translated to regular
+    expressions. The first rule in file order that matches a process name
+    wins, and the result is memoized per name. Only processes in a delta's
+    `added` list that started after the engine was created are evaluated,
+    so processes already running at launch are left alone, and each new
+    process is opened once.
+    """
+    
+    def __init__(self, config_file=None, log_size=200):
+        if config_file is None:
+            data_dir = os.path.join(os.path.expanduser('~'), 'AppData', 'Local', 'WindowsSystemManager')
+            config_file = os.path.join(data_dir, 'process_rules.json')
+        
+        self.config_file = config_file
+        self.started_at = time.time()
+        self.rules = []
+        self.log = deque(maxlen=log_size)
+        self._exact = {}     # lowercase name -> (rule number, rule)
+        self._wildcards = [] # (rule number, compiled pattern, rule)
+        self._matches = {}   # lowercase name -> rule or None
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        """Read and compile the rules file, creating an example if it is missing."""
+        if not os.path.exists(self.config_file):
+            self._write_default()
+        
+        try:
+            with open(self.config_file, 'r') as f:
+                config = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error reading process rules: {str(e)}")
+            config = {}
+        if not isinstance(config, dict):
+            print("Error reading process rules: the file does not hold an object")
+            config = {}
+        
+        entries = config.get('rules', [])
+        if not isinstance(entries, list):
+            print("Error reading process rules: 'rules' is not a list")
+            entries = []
+        
+        rules = []
+        for entry in entries:
+            if not isinstance(entry, dict):
+                print(f"Skipping invalid process rule {entry}: not an object")
+                continue
+            if not entry.get('enabled', True):
+                continue
+            try:
+                rules.append(ProcessRule(entry['pattern'], entry.get('priority'),
+                                         entry.get('affinity'), entry.get('io_priority')))
+            except (KeyError, ValueError, TypeError) as e:
+                print(f"Skipping invalid process rule {entry}: {str(e)}")
+        
+        self.compile(rules)
+    
+    def compile(self, rules):
+        """
+        Compile rules into matchers.
+        
+        Args:
+            rules: ProcessRule objects in priority order
+        """
+        exact = {}
+        wildcards = []
+        for number, rule in enumerate(rules):
+            pattern = rule.pattern.lower()
+            if any(char in pattern for char in '*?['):
+                wildcards.append((number, re.compile(fnmatch.translate(pattern)), rule))
+            else:
+                exact.setdefault(pattern, (number, rule))
+        
+        with self._lock:
+            self.rules = list(rules)
+            self._exact = exact
+            self._wildcards = wildcards
+            self._matches = {}
+    
+    def match(self, name):
+        """
+        Find the rule for a process name.
+        
+        Args:
+            name: Process name
+        
+        Returns:
+            ProcessRule: First matching rule, or None
+        """
+        name = name.lower()
+        with self._lock:
+            if name in self._matches:
+                return self._matches[name]
+            
+            number, rule = self._exact.get(name, (len(self.rules), None))
+            for wildcard_number, pattern, wildcard_rule in self._wildcards:
+                if wildcard_number >= number:
+                    break
+                if pattern.match(name):
+                    rule = wildcard_rule
+                    break
+            
+            self._matches[name] = rule
+            return rule
+    
+    def apply_delta(self, delta):
+        """
+        Apply rules to the processes added in a delta.
+        
+        Args:
+            delta: ProcessDelta from the process registry
+        
+        Returns:
+            list: Report dictionaries of the processes a rule was applied to
+        """
+        if not self.rules:
+            return []
+        
+        reports = []
+        for proc in delta.added:
+            if proc['create_time'] < self.started_at:
+                continue
+            rule = self.match(proc['name'])
+            if rule is not None:
+                report = self.apply_rule(proc, rule)
+                reports.append(report)
+                self.log.append(report)
+        return reports
+    
+    def apply_rule(self, proc, rule):
+        """
+        Apply a rule's settings to a process.
+        
+        Args:
+            proc: Process dictionary
+            rule: ProcessRule to apply
+        
+        Returns:
+            dict: pid, name, rule and the lists of applied and failed settings
+        """
+        applied = []
+        failed = []
+        pid = proc['pid']
+        report = {
+            'pid': pid,
+            'name': proc['name'],
+            'rule': rule.pattern,
+            'applied': applied,
+            'failed': failed
+        }
+        
+        try:
+            handle = psutil.Process(pid)
+            if handle.create_time() != proc['create_time']:
+                raise psutil.NoSuchProcess(pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            failed.append(f"process: {str(e)}")
+            return report
+        
+        if rule.priority:
+            priority_class = getattr(psutil, PRIORITY_CLASSES[rule.priority], None)
+            if priority_class is None:
+                failed.append(f"priority {rule.priority}: not supported")
+            else:
+                try:
+                    handle.nice(priority_class)
+                    applied.append(f"priority {rule.priority}")
+                except (psutil.NoSuchProcess, psutil.AccessDenied, ValueError, OSError) as e:
+                    failed.append(f"priority: {str(e)}")
+        
+        if rule.affinity:
+            try:
+                handle.cpu_affinity(rule.affinity)
+                applied.append(f"cores {','.join(str(cpu) for cpu in rule.affinity)}")
+            except (psutil.NoSuchProcess, psutil.AccessDenied, ValueError, OSError) as e:
+                failed.append(f"affinity: {str(e)}")
+        
+        if rule.io_priority:
+            io_class = getattr(psutil, IO_PRIORITIES[rule.io_priority], None)
+            if io_class is None:
+                failed.append(f"I/O {rule.io_priority}: not supported")
+            else:
+                try:
+                    handle.ionice(io_class)
+                    applied.append(f"I/O {rule.io_priority}")
+                except (psutil.NoSuchProcess, psutil.AccessDenied, ValueError, OSError) as e:
+                    failed.append(f"I/O priority: {str(e)}")
+        
+        return report
+    
+    def _write_default(self):
+        """Write the example rules file."""
+        try:
+            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+            with open(self.config_file, 'w') as f:
+                json.dump(DEFAULT_RULES, f, indent=2)
+        except (IOError, OSError) as e:
+            print(f"Error writing process rules: {str(e)}")
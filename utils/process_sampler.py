@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tiered sampling for Windows System Manager.
+Runs sampling tasks at their own rates and samples pinned processes at high frequency.
+"""
+
+import heapq
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import psutil
+
+class SamplingLane:
+    """A sampling task with its own interval and priority."""
+    
+    def __init__(self, name, interval, task, priority=0, background=False):
+        self.name = name
+        self.interval = interval
+        self.task = task
+        self.priority = priority
+        self.background = background
+        self.next_run = 0.0
+
+class LaneScheduler:
+    """
+    Runs sampling lanes at their own intervals.
+    
+    Lanes run on the scheduler thread. When several are due at once they
+    run in priority order (lowest number first), but a running lane is
+    never interrupted, so lanes that can block for long should be added
+    with background=True. Those are handed to a small worker pool and the
+    scheduler thread stays free for the fast lanes. A background lane is
+    not queued again until its run has finished. A lane that overruns
+    skips the ticks it missed rather than running them back to back.
+    """
+    
+    def __init__(self):
+        self._lanes = {}  # name -> SamplingLane
+        self._queue = []  # (next run, priority, sequence, lane)
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread = None
+        self._pool = None
+    
+    def add_lane(self, name, interval, task, priority=0, background=False):
+        """
+        Add a lane, replacing any lane with the same name.
+        
+        Args:
+            name: Lane name
+            interval: Seconds between runs
+            task: Callable run on the scheduler thread, or on a worker
+                  thread for background lanes
+            priority: Lower numbers run first when lanes are due together
+            background: Run the task on a worker thread, for tasks that
+                        may block
+        """
+        lane = SamplingLane(name, interval, task, priority, background)
+        with self._lock:
+            self._lanes[name] = lane
+            lane.next_run = time.monotonic()
+            self._push(lane)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sampling-lane")
+            if self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name="LaneScheduler", daemon=True)
+                self._thread.start()
+        self._wake.set()
+    
+    def remove_lane(self, name):
+        """Stop running a lane."""
+        with self._lock:
+            self._lanes.pop(name, None)
+    
+    def stop(self):
+        """Stop the scheduler thread and wait for it and any background lane still running."""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+            pool = self._pool
+            self._pool = None
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        if pool is not None:
+            pool.shutdown(wait=True)
+    
+    def _push(self, lane):
+        """Queue a lane's next run; the caller holds the lock."""
+        self._sequence += 1
+        heapq.heappush(self._queue, (lane.next_run, lane.priority, self._sequence, lane))
+    
+    def _run(self):
+        """Scheduler loop."""
+        while True:
+            with self._lock:
+                if self._stopping:
+                    self._thread = None
+                    return
+                
+                # Drop queue entries of removed or replaced lanes
+                while self._queue and self._lanes.get(self._queue[0][3].name) is not self._queue[0][3]:
+                    heapq.heappop(self._queue)
+                
+                if not self._queue:
+                    lane = None
+                    delay = None
+                else:
+                    lane = self._queue[0][3]
+                    delay = lane.next_run - time.monotonic()
+                    if delay <= 0:
+                        heapq.heappop(self._queue)
+            
+            if lane is None or delay > 0:
+                self._wake.wait(delay)
+                self._wake.clear()
+                continue
+            
+            if lane.background:
+                with self._lock:
+                    pool = self._pool
+                if pool is not None:
+                    pool.submit(self._run_lane, lane)
+            else:
+                self._run_lane(lane)
+            
+    def _run_lane(self, lane):
+        """Run a lane's task once and queue its next run."""
+        try:
+            lane.task()
+        except Exception as e:
+            print(f"Error in sampling lane {lane.name}: {str(e)}")
+        
+        with self._lock:
+            if self._lanes.get(lane.name) is lane:
+                now = time.monotonic()
+                lane.next_run += lane.interval
+                if lane.next_run < now:
+                    # Overran; skip the missed ticks
+                    lane.next_run = now + lane.interval
+                self._push(lane)
+        
+        # A background lane may now be due before whatever the scheduler waits for
+        if lane.background:
+            self._wake.set()
+
+class PinnedSampler:
+    """
+    High-frequency sampler for a few pinned processes.
+    
+    Each sample() reads CPU times, memory and I/O counters of the pinned
+    processes only and records them in its own ProcessHistory, so their
+    history is kept at the sampling resolution while the rest of the
+    table keeps the normal refresh rate.
+    """
+    
+    def __init__(self, history, max_pinned=8):
+        self.history = history
+        self.max_pinned = max_pinned
+        self._targets = {}  # (pid, create_time) -> [psutil.Process, cpu total, I/O bytes, sample time]
+        self._lock = threading.Lock()
+    
+    def pin(self, key):
+        """
+        Pin a process for high-frequency sampling.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+        
+        Returns:
+            bool: True if the process is pinned
+        """
+        with self._lock:
+            if key in self._targets:
+                return True
+            if len(self._targets) >= self.max_pinned:
+                return False
+        
+        try:
+            proc = psutil.Process(key[0])
+            if proc.create_time() != key[1]:
+                return False
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+        
+        with self._lock:
+            self._targets[key] = [proc, None, None, None]
+        return True
+    
+    def unpin(self, keys):
+        """
+        Stop sampling processes and drop their history.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        released = []
+        with self._lock:
+            for key in keys:
+                if self._targets.pop(key, None) is not None:
+                    released.append(key)
+        if released:
+            self.history.release(released)
+    
+    def is_pinned(self, key):
+        return key in self._targets
+    
+    def pinned(self):
+        """Get the identities of the pinned processes."""
+        with self._lock:
+            return list(self._targets)
+    
+    def __len__(self):
+        return len(self._targets)
+    
+    def sample(self):
+        """
+        Sample every pinned process once.
+        
+        Returns:
+            bool: True if any process was sampled
+        """
+        with self._lock:
+            targets = list(self._targets.items())
+        if not targets:
+            return False
+        
+        self.history.begin_tick()
+        gone = []
+        for key, target in targets:
+            proc = target[0]
+            try:
+                with proc.oneshot():
+                    cpu_times = proc.cpu_times()
+                    rss = proc.memory_info().rss / (1024 * 1024)
+                    try:
+                        io = proc.io_counters()
+                        io_total = io.read_bytes + io.write_bytes
+                    except (psutil.AccessDenied, AttributeError):
+                        io_total = None
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                gone.append(key)
+                continue
+            
+            now = time.monotonic()
+            cpu_total = cpu_times.user + cpu_times.system
+            cpu_percent = io_rate = 0.0
+            if target[3] is not None:
+                elapsed = now - target[3]
+                if elapsed > 0:
+                    cpu_percent = max(0.0, (cpu_total - target[1]) / elapsed * 100)
+                    if io_total is not None and target[2] is not None:
+                        io_rate = max(0.0, (io_total - target[2]) / elapsed)
+            target[1:] = [cpu_total, io_total, now]
+            
+            self.history.record(key, cpu_percent, rss, io_rate)
+        
+        if gone:
+            self.unpin(gone)
+        return True
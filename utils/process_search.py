@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Process search index for Windows System Manager.
+Indexes the name, executable path and command line of live processes for filtering.
+"""
+
+import re
+import threading
+
+import psutil
+
+# Characters that separate tokens in paths and command lines
+TOKEN_SEPARATORS = re.compile(r'[\s\\/"\'=,;]+')
+
+def read_search_fields(pid):
+    """
+    Read the executable path and command line of a process.
+    
+    Args:
+        pid: Process ID
+    
+    Returns:
+        tuple: (exe, cmdline list); fields that cannot be read are empty
+    """
+    exe = ""
+    cmdline = []
+    try:
+        proc = psutil.Process(pid)
+        with proc.oneshot():
+            try:
+                exe = proc.exe() or ""
+            except (psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+            try:
+                cmdline = proc.cmdline() or []
+            except (psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+    return exe, cmdline
+
+class ProcessSearchIndex:
+    """
+    Token index over the name, executable path and command line of processes.
+    
+    The path and command line of a process never change, so each
+    (pid, create_time) identity is read from the OS once and kept until
+    the process exits. Queries only look at the index: every whitespace
+    separated term must occur in a process's text, and terms are matched
+    as substrings of the indexed tokens, so "manage" finds "manage.py".
+    """
+    
+    def __init__(self):
+        self._text = {}      # (pid, create_time) -> lowercase searchable text
+        self._tokens = {}    # (pid, create_time) -> set of tokens
+        self._postings = {}  # token -> set of (pid, create_time)
+        self._lock = threading.Lock()
+    
+    def add(self, key, name, exe, cmdline, is_live=None):
+        """
+        Index a process.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+            name: Process name
+            exe: Executable path
+            cmdline: Command line arguments
+            is_live: Optional callable telling whether the process still
+                     runs; checked under the lock forget() takes, so a
+                     process that exited meanwhile is not indexed again
+        """
+        text = " ".join([name, exe] + list(cmdline)).lower()
+        tokens = {token for token in TOKEN_SEPARATORS.split(text) if token}
+        
+        with self._lock:
+            if key in self._text or (is_live is not None and not is_live(key)):
+                return
+            self._text[key] = text
+            self._tokens[key] = tokens
+            for token in tokens:
+                self._postings.setdefault(token, set()).add(key)
+    
+    def index_processes(self, rows, is_live=None):
+        """
+        Index processes that are not in the index yet, reading their fields from the OS.
+        
+        Args:
+            rows: Process dictionaries with pid, create_time and name
+            is_live: Optional callable telling whether a process still runs,
+                     such as ProcessRegistry.is_live
+        
+        Returns:
+            int: Number of processes added to the index
+        """
+        added = 0
+        for row in rows:
+            key = (row['pid'], row['create_time'])
+            if key in self:
+                continue
+            exe, cmdline = read_search_fields(row['pid'])
+            self.add(key, row['name'], exe, cmdline, is_live)
+            if key in self:
+                added += 1
+        return added
+    
+    def forget(self, keys):
+        """
+        Drop processes that have exited from the index.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        with self._lock:
+            for key in keys:
+                self._text.pop(key, None)
+                for token in self._tokens.pop(key, ()):
+                    posting = self._postings.get(token)
+                    if posting is not None:
+                        posting.discard(key)
+                        if not posting:
+                            del self._postings[token]
+    
+    def query(self, text):
+        """
+        Find the processes matching every term of a query.
+        
+        Args:
+            text: Whitespace separated search terms
+        
+        Returns:
+            set: (pid, create_time) identities of matching processes
+        """
+        terms = text.lower().split()
+        if not terms:
+            return set()
+        
+        with self._lock:
+            result = None
+            for term in terms:
+                if TOKEN_SEPARATORS.search(term):
+                    # A term spanning several tokens, such as part of a path
+                    keys = {key for key, indexed in self._text.items() if term in indexed}
+                else:
+                    keys = set()
+                    for token, posting in self._postings.items():
+                        if term in token:
+                            keys |= posting
+                
+                result = keys if result is None else result & keys
+                if not result:
+                    break
+            return result
+    
+    def __contains__(self, key):
+        return key in self._text
+    
+    def __len__(self):
+        return len(self._text)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-thread CPU sampling for Windows System Manager.
+Breaks the CPU use of one process down by thread from successive thread time samples.
+"""
+
+import time
+
+import psutil
+
+class ThreadSampler:
+    """
+    Samples the threads of a single process.
+    
+    Each call to sample() reads Process.threads() once and turns the
+    user and system time of every thread into percentages of one CPU over
+    the time since the previous call. The first sample only sets the
+    baseline, so its percentages are zero.
+    """
+    
+    def __init__(self, key):
+        self.key = key
+        self._proc = None
+        self._last = {}  # thread id -> (user time, system time)
+        self._last_time = None
+    
+    def sample(self):
+        """
+        Sample the process's threads.
+        
+        Returns:
+            list: Thread dictionaries with id, cpu_percent, user_percent,
+                  system_percent, user_time and system_time, busiest first
+        
+        Raises:
+            psutil.NoSuchProcess: If the process has exited
+            psutil.AccessDenied: If the threads cannot be read
+        """
+        if self._proc is None:
+            self._proc = psutil.Process(self.key[0])
+            if self._proc.create_time() != self.key[1]:
+                raise psutil.NoSuchProcess(self.key[0])
+        
+        threads = self._proc.threads()
+        now = time.monotonic()
+        elapsed = now - self._last_time if self._last_time is not None else 0
+        
+        rows = []
+        current = {}
+        for thread in threads:
+            current[thread.id] = (thread.user_time, thread.system_time)
+            user_percent = system_percent = 0.0
+            last = self._last.get(thread.id)
+            if last is not None and elapsed > 0:
+                user_percent = max(0.0, (thread.user_time - last[0]) / elapsed * 100)
+                system_percent = max(0.0, (thread.system_time - last[1]) / elapsed * 100)
+            rows.append({
+                'id': thread.id,
+                'cpu_percent': user_percent + system_percent,
+                'user_percent': user_percent,
+                'system_percent': system_percent,
+                'user_time': thread.user_time,
+                'system_time': thread.system_time
+            })
+        
+        # Threads that exited are dropped with the old sample
+        self._last = current
+        self._last_time = now
+        
+        rows.sort(key=lambda row: row['cpu_percent'], reverse=True)
+        return rows
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Process tree for Windows System Manager.
+Links processes to their parents and keeps CPU, memory and thread totals per subtree.
+"""
+
+# Values summed over each subtree
+TOTAL_FIELDS = ('cpu_percent', 'memory_mb', 'num_threads')
+
+class ProcessNode:
+    """A process in the tree with the totals of its subtree."""
+    
+    def __init__(self, key, row):
+        self.key = key
+        self.row = row
+        self.parent = None
+        self.children = []
+        self.totals = {field: row.get(field, 0) for field in TOTAL_FIELDS}
+    
+    def child_row(self, child):
+        """Get the position of a child node among this node's children."""
+        return self.children.index(child)
+
+class TreeListener:
+    """
+    Receives structural changes from a ProcessTree.
+    
+    Insert and remove calls bracket the change to the tree, so a Qt model
+    can forward them as begin/end notifications. A parent of None means
+    the list of root nodes.
+    """
+    
+    def begin_insert(self, parent, row):
+        pass
+    
+    def end_insert(self):
+        pass
+    
+    def begin_remove(self, parent, row):
+        pass
+    
+    def end_remove(self):
+        pass
+    
+    def node_changed(self, node):
+        pass
+
+class ProcessTree:
+    """
+    Parent/child view of a process snapshot with incremental subtree totals.
+    
+    build() links a snapshot by ppid in one pass. apply_delta() then
+    updates totals along the ancestor chain of each added, changed or
+    exited process instead of recomputing the whole tree.
+    """
+    
+    def __init__(self, listener=None):
+        self.listener = listener if listener is not None else TreeListener()
+        self.nodes = {}   # (pid, create_time) -> ProcessNode
+        self.roots = []
+        self._by_pid = {}  # pid -> node
+        self._waiting = {}  # ppid -> root nodes whose parent has not been seen yet
+    
+    def build(self, rows):
+        """
+        Build the tree from a full snapshot in O(n).
+        
+        Args:
+            rows: Process dictionaries with pid, ppid and create_time
+        """
+        self.nodes = {}
+        self.roots = []
+        self._by_pid = {}
+        self._waiting = {}
+        
+        for row in rows:
+            node = ProcessNode((row['pid'], row['create_time']), row)
+            self.nodes[node.key] = node
+            self._by_pid[row['pid']] = node
+        
+        for node in self.nodes.values():
+            parent = self._find_parent(node)
+            if parent is None:
+                self.roots.append(node)
+            else:
+                node.parent = parent
+                parent.children.append(node)
+        
+        # Sum subtree totals children-first, without recursion
+        order = []
+        stack = list(self.roots)
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children)
+        for node in reversed(order):
+            if node.parent is not None:
+                for field in TOTAL_FIELDS:
+                    node.parent.totals[field] += node.totals[field]
+    
+    def apply_delta(self, delta):
+        """
+        Apply a registry delta, updating only the affected ancestor chains.
+        
+        Args:
+            delta: ProcessDelta with added, changed and exited processes
+        """
+        for key in delta.exited:
+            node = self.nodes.get(key)
+            if node is not None:
+                self._remove(node)
+        
+        for row in delta.changed:
+            node = self.nodes.get((row['pid'], row['create_time']))
+            if node is None:
+                continue
+            diff = {field: row.get(field, 0) - node.row.get(field, 0) for field in TOTAL_FIELDS}
+            node.row = row
+            self._propagate(node, diff)
+        
+        for row in delta.added:
+            key = (row['pid'], row['create_time'])
+            if key not in self.nodes:
+                self._add(ProcessNode(key, row))
+    
+    def _find_parent(self, node):
+        """Find a node's live parent; a reused parent PID is not a parent."""
+        parent = self._by_pid.get(node.row.get('ppid'))
+        if parent is None or parent is node:
+            return None
+        if parent.row['create_time'] > node.row['create_time']:
+            return None
+        return parent
+    
+    def _propagate(self, node, diff):
+        """Add a difference to a node's totals and those of its ancestors."""
+        while node is not None:
+            for field in TOTAL_FIELDS:
+                node.totals[field] += diff[field]
+            self.listener.node_changed(node)
+            node = node.parent
+    
+    def _add(self, node):
+        """Attach a new process below its parent and adopt waiting children."""
+        parent = self._find_parent(node)
+        siblings = parent.children if parent is not None else self.roots
+        
+        self.listener.begin_insert(parent, len(siblings))
+        node.parent = parent
+        siblings.append(node)
+        self.nodes[node.key] = node
+        self._by_pid[node.key[0]] = node
+        self.listener.end_insert()
+        
+        if parent is not None:
+            self._propagate(parent, node.totals)
+        elif node.row.get('ppid'):
+            # Parent may still arrive later in the same update
+            self._waiting.setdefault(node.row['ppid'], []).append(node)
+        
+        for child in self._waiting.pop(node.key[0], []):
+            if child.parent is None and child.key in self.nodes and self._find_parent(child) is node:
+                self._move_to_root_parent(child, node)
+    
+    def _move_to_root_parent(self, child, parent):
+        """Move a root node below its newly seen parent."""
+        self.listener.begin_remove(None, self.roots.index(child))
+        self.roots.remove(child)
+        self.listener.end_remove()
+        
+        self.listener.begin_insert(parent, len(parent.children))
+        child.parent = parent
+        parent.children.append(child)
+        self.listener.end_insert()
+        
+        self._propagate(parent, child.totals)
+    
+    def _remove(self, node):
+        """Detach an exited process; its children become roots."""
+        parent = node.parent
+        siblings = parent.children if parent is not None else self.roots
+        
+        self.listener.begin_remove(parent, siblings.index(node))
+        siblings.remove(node)
+        del self.nodes[node.key]
+        if self._by_pid.get(node.key[0]) is node:
+            del self._by_pid[node.key[0]]
+        waiting = self._waiting.get(node.row.get('ppid'))
+        if waiting and node in waiting:
+            waiting.remove(node)
+        self.listener.end_remove()
+        
+        if parent is not None:
+            self._propagate(parent, {field: -node.totals[field] for field in TOTAL_FIELDS})
+        
+        # Orphans move to the top level, keeping their own subtrees
+        orphans = node.children
+        node.children = []
+        for child in orphans:
+            self.listener.begin_insert(None, len(self.roots))
+            child.parent = None
+            self.roots.append(child)
+            self.listener.end_insert()
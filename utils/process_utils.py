@@ -12,108 +12,534 @@ import sys
 import win32process
 import win32con
 import win32api
-import win32security
 import pywintypes
+import threading
+import time
 from datetime import datetime
 
-def get_processes():
+from utils.process_owner import ProcessOwnerCache
+from utils import nt_snapshot
+
+class ProcessDelta:
     """
-    Get list of running processes with details.
+    Changes between two process registry updates.
+    
+    added and changed hold process dictionaries, exited holds the
+    (pid, create_time) keys of processes that are gone.
+    """
+    
+    def __init__(self, added=None, changed=None, exited=None):
+        self.added = added if added is not None else []
+        self.changed = changed if changed is not None else []
+        self.exited = exited if exited is not None else []
+    
+    def is_empty(self):
+        """Return True if nothing changed."""
+        return not (self.added or self.changed or self.exited)
+
+class ProcessDetailsCache:
+    """
+    Caches the static details of processes by (pid, create_time).
+    
+    Executable path, start time and priority class are read together in a
+    single oneshot() pass the first time they are needed; live values such
+    as CPU and memory come from the registry snapshot instead. Details are
+    only cached while `is_live` reports the process as running, so a read
+    that finishes after the process exited is not kept.
+    """
+    
+    def __init__(self, is_live=None):
+        self.is_live = is_live
+        self._details = {}  # (pid, create_time) -> details dict
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """
+        Get cached details without touching the process.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+            
+        Returns:
+            dict: Cached details, or None if not fetched yet
+        """
+        with self._lock:
+            return self._details.get(key)
+    
+    def fetch(self, key):
+        """
+        Get the details of a process, reading them on a cache miss.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+            
+        Returns:
+            dict: Details with path, create_time and priority; "Unknown"
+                  values if the process has exited
+        """
+        details = self.get(key)
+        if details is not None:
+            return details
+        
+        details = read_static_details(key[0], key[1])
+        if details is None:
+            return {'path': "Unknown", 'create_time': "Unknown", 'priority': "Unknown"}
+        with self._lock:
+            # forget() takes the lock too, so an exited process is either
+            # not live here or removed right after
+            if self.is_live is None or self.is_live(key):
+                self._details[key] = details
+        return details
+    
+    def forget(self, keys):
+        """
+        Drop cached details, for exited processes or changed priorities.
+        
+        Args:
+            keys: Iterable of (pid, create_time) identities
+        """
+        with self._lock:
+            for key in keys:
+                self._details.pop(key, None)
+
+def read_static_details(pid, create_time=None):
+    """
+    Read the details of a process that do not change while it runs.
     
+    Args:
+        pid: Process ID
+        create_time: Expected start time; a process with another start time
+                     has reused the PID and is not read
+        
     Returns:
-        list: List of process dictionaries with pid, name, cpu, memory usage, etc.
+        dict: path, create_time (formatted) and priority, or None if the
+              process has exited or the PID was reused
     """
-    processes = []
+    # Windows priority constants (not part of psutil)
+    priority_map = {
+        win32process.IDLE_PRIORITY_CLASS: "Idle",
+        win32process.BELOW_NORMAL_PRIORITY_CLASS: "Below Normal",
+        win32process.NORMAL_PRIORITY_CLASS: "Normal",
+        win32process.ABOVE_NORMAL_PRIORITY_CLASS: "Above Normal",
+        win32process.HIGH_PRIORITY_CLASS: "High",
+        win32process.REALTIME_PRIORITY_CLASS: "Realtime"
+    }
     
-    # Use thread with timeout to prevent UI freezing
-    import threading
+    details = {
+        'path': "Access denied",
+        'create_time': "Unknown",
+        'priority': "Unknown"
+    }
     
-    def safe_collect():
-        nonlocal processes
-        try:
-            # Get current Windows user SID - with error handling
-            current_user_sid = None
+    try:
+        process = psutil.Process(pid)
+        with process.oneshot():
+            if create_time is not None and process.create_time() != create_time:
+                return None
+            
             try:
-                current_user_sid = win32security.GetTokenInformation(
-                    win32security.OpenProcessToken(win32api.GetCurrentProcess(), win32con.TOKEN_QUERY),
-                    win32security.TokenUser
-                )[0]
+                details['path'] = process.exe() or "Unknown"
+            except psutil.AccessDenied:
+                pass
+            
+            try:
+                create_time = datetime.fromtimestamp(process.create_time())
+                details['create_time'] = create_time.strftime("%Y-%m-%d %H:%M:%S")
+            except psutil.AccessDenied:
+                pass
+            
+            try:
+                details['priority'] = priority_map.get(process.nice(), "Unknown")
+            except psutil.AccessDenied:
+                pass
+    except (psutil.NoSuchProcess, psutil.ZombieProcess):
+        return None
+    except Exception as e:
+        print(f"Error getting process details for {pid}: {str(e)}")
+    
+    return details
+
+class ProcessRegistry:
+    """
+    Persistent table of running processes keyed by (pid, create_time).
+    
+    The expensive enumeration (name, user, type) happens only the first time
+    a process identity is seen; System/User types come from a
+    ProcessOwnerCache. Every update samples CPU, memory and disk I/O for all
+    live processes in one pass, computing rates from each process's counter
+    deltas over one shared wall-clock interval, and returns a ProcessDelta.
+    Updates are serialized, so the registry can be driven from a worker
+    thread while other callers read rows().
+    
+    With the native backend the live counters of all processes come from a
+    single NtQuerySystemInformation snapshot instead of opening every
+    process; psutil is used when the snapshot is unavailable or fails.
+    """
+    
+    def __init__(self, owner_cache=None, details_cache=None, native=None):
+        self._owners = owner_cache if owner_cache is not None else ProcessOwnerCache()
+        self.details = details_cache if details_cache is not None else ProcessDetailsCache(self.is_live)
+        self.native = nt_snapshot.is_available() if native is None else native
+        self._entries = {}  # (pid, create_time) -> entry dict
+        self._keys = {}     # pid -> (pid, create_time)
+        self._last_sample = None
+        self._lock = threading.Lock()
+    
+    def update(self, on_batch=None, batch_size=64):
+        """
+        Sample all running processes once.
+        
+        Args:
+            on_batch: Optional callable receiving a partial ProcessDelta for
+                every batch_size processes sampled, so results can be shown
+                before the pass completes. Exited processes arrive in the
+                last batch.
+            batch_size: Number of processes sampled per partial delta
+            
+        Returns:
+            ProcessDelta: Processes added, changed and exited since the last update
+        """
+        with self._lock:
+            return self._update(on_batch, batch_size)
+    
+    def _update(self, on_batch, batch_size):
+        """Sample all running processes; the caller holds the lock."""
+        now = time.monotonic()
+        elapsed = now - self._last_sample if self._last_sample else 0
+        self._last_sample = now
+        
+        delta = ProcessDelta()
+        batch = ProcessDelta()
+        sampled = 0
+        entries = {}
+        keys = {}
+        
+        snapshot = self._native_snapshot()
+        for pid in (snapshot if snapshot is not None else psutil.pids()):
+            # Skip system processes that often cause freezes
+            if pid < 10:
+                continue
+            
+            entry = self._entries.get(self._keys.get(pid))
+            is_new = False
+            try:
+                if snapshot is not None:
+                    record = snapshot[pid]
+                    # A known PID with a different start time has been reused
+                    if entry is None or entry['start'] != record.create_time:
+                        entry = self._enumerate(pid)
+                        entry['start'] = record.create_time
+                        is_new = True
+                    counters = self._native_counters(record)
+                else:
+                    # A known PID that is no longer running has been reused
+                    if entry is None or not entry['proc'].is_running():
+                        entry = self._enumerate(pid)
+                        is_new = True
+                    counters = self._read_counters(entry['proc'])
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
             except Exception as e:
-                print(f"Could not get current user SID: {str(e)}")
+                print(f"Error sampling PID {pid}: {str(e)}")
+                continue
+            cpu_total, memory_mb, status, num_threads, io_counters = counters
             
-            # Iterate through processes with timeout protection
-            for proc in psutil.process_iter(['pid', 'name', 'username', 'status']):
-                try:
-                    # Get basic process info first
-                    proc_info = proc.info
-                    
-                    # Skip system processes that often cause freezes
-                    if proc_info['pid'] < 10:
-                        continue
-                    
-                    # Get memory info separately to handle exceptions
-                    memory_mb = 0
-                    try:
-                        if hasattr(proc, 'memory_info') and proc.memory_info():
-                            memory_mb = proc.memory_info().rss / (1024**2)
-                    except:
-                        pass
-                    
-                    # Get CPU usage separately with minimal interval
-                    cpu_percent = 0
-                    try:
-                        cpu_percent = proc.cpu_percent(interval=0.05)
-                    except:
-                        pass
-                    
-                    # Determine if this is a system or user process - with timeout protection
-                    proc_type = "System"
-                    if current_user_sid and proc_info.get('username'):
-                        try:
-                            proc_handle = win32api.OpenProcess(win32con.PROCESS_QUERY_INFORMATION, False, proc_info['pid'])
-                            proc_token = win32security.OpenProcessToken(proc_handle, win32con.TOKEN_QUERY)
-                            proc_user_sid = win32security.GetTokenInformation(proc_token, win32security.TokenUser)[0]
-                            
-                            if proc_user_sid == current_user_sid:
-                                proc_type = "User"
-                        except:
-                            pass
-                    
-                    # Add process to list
-                    processes.append({
-                        'pid': proc_info['pid'],
-                        'name': proc_info.get('name', 'Unknown'),
-                        'username': proc_info.get('username', 'N/A'),
-                        'status': proc_info.get('status', 'Unknown'),
-                        'cpu_percent': cpu_percent,
-                        'memory_mb': memory_mb,
-                        'type': proc_type
-                    })
-                    
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    pass
-                except Exception as e:
-                    # Catch any other errors to prevent freezing
-                    print(f"Error processing PID {proc.pid if hasattr(proc, 'pid') else 'unknown'}: {str(e)}")
-                    continue
-        except Exception as e:
-            print(f"Error collecting processes: {str(e)}")
+            # CPU% from the shared interval; a new process has no baseline yet
+            cpu_percent = 0.0
+            if not is_new and elapsed > 0:
+                cpu_percent = max(0.0, (cpu_total - entry['cpu_total']) / elapsed * 100)
+            entry['cpu_total'] = cpu_total
+            
+            # Disk I/O rates from the same interval and the same oneshot pass
+            io_rates = (0.0, 0.0, 0.0, 0.0)
+            if not is_new and elapsed > 0 and io_counters is not None and entry['io_counters'] is not None:
+                io_rates = tuple(max(0.0, (now_value - then_value) / elapsed)
+                                 for now_value, then_value in zip(io_counters, entry['io_counters']))
+            entry['io_counters'] = io_counters
+            
+            sample = {
+                'cpu_percent': cpu_percent,
+                'memory_mb': memory_mb,
+                'status': status,
+                'num_threads': num_threads,
+                'io_read_bytes_per_sec': io_rates[0],
+                'io_write_bytes_per_sec': io_rates[1],
+                'io_read_ops_per_sec': io_rates[2],
+                'io_write_ops_per_sec': io_rates[3],
+                'io_bytes_per_sec': io_rates[0] + io_rates[1]
+            }
+            
+            old_row = entry['row']
+            if is_new or self._row_changed(old_row, sample):
+                # Rows are replaced rather than mutated so consumers can keep them
+                entry['row'] = dict(old_row, **sample)
+                if is_new:
+                    batch.added.append(entry['row'])
+                else:
+                    batch.changed.append(entry['row'])
+            
+            key = entry['key']
+            entries[key] = entry
+            keys[pid] = key
+            
+            # Hand off a partial delta every batch_size processes
+            sampled += 1
+            if sampled % batch_size == 0 and not batch.is_empty():
+                self._flush_batch(batch, delta, on_batch)
+                batch = ProcessDelta()
+        
+        batch.exited = [key for key in self._entries if key not in entries]
+        
+        # Replace the entries first, so details read meanwhile for exited
+        # processes are not cached after forget()
+        self._entries = entries
+        self._keys = keys
+        self._owners.forget(batch.exited)
+        self.details.forget(batch.exited)
+        
+        self._flush_batch(batch, delta, on_batch)
+        return delta
+    
+    def _native_snapshot(self):
+        """Take a native snapshot as a dict of pid -> NtProcess, or None to use psutil."""
+        if not self.native:
+            return None
+        try:
+            return {record.pid: record for record in nt_snapshot.query_process_snapshot()}
+        except (OSError, ValueError) as e:
+            # Stay on psutil for the rest of the session
+            print(f"Native process snapshot failed, using psutil: {str(e)}")
+            self.native = False
+            return None
     
-    # Run process collection in a thread with timeout
-    collector_thread = threading.Thread(target=safe_collect)
-    collector_thread.daemon = True
-    collector_thread.start()
-    collector_thread.join(timeout=3)  # 3 second timeout
+    @staticmethod
+    def _native_counters(record):
+        """Get the live counters of a process from its snapshot record."""
+        return (
+            record.user_time + record.system_time,
+            record.working_set / (1024**2),
+            psutil.STATUS_STOPPED if record.suspended else psutil.STATUS_RUNNING,
+            record.num_threads,
+            (record.read_bytes, record.write_bytes, record.read_count, record.write_count)
+        )
+    
+    @classmethod
+    def _read_counters(cls, proc):
+        """Get the live counters of a process by opening it, in one oneshot pass."""
+        with proc.oneshot():
+            times = proc.cpu_times()
+            return (
+                times.user + times.system,
+                proc.memory_info().rss / (1024**2),
+                proc.status(),
+                proc.num_threads(),
+                cls._io_counters(proc)
+            )
+    
+    @staticmethod
+    def _flush_batch(batch, delta, on_batch):
+        """Merge a partial delta into the full one and pass it on."""
+        delta.added.extend(batch.added)
+        delta.changed.extend(batch.changed)
+        delta.exited.extend(batch.exited)
+        if on_batch is not None:
+            on_batch(batch)
+    
+    def rows(self):
+        """
+        Get the current process dictionaries.
+        
+        Returns:
+            list: Process dictionaries from the last update
+        """
+        return [entry['row'] for entry in self._entries.values()]
+    
+    def is_live(self, key):
+        """
+        Check whether a process was running at the last update.
+        
+        Args:
+            key: (pid, create_time) identity of the process
+        
+        Returns:
+            bool: True if the process is in the registry
+        """
+        return key in self._entries
+    
+    def age(self):
+        """
+        Get how old the current rows are.
+        
+        Returns:
+            float: Seconds since the last update started, or None before the first
+        """
+        if not self._last_sample:
+            return None
+        return time.monotonic() - self._last_sample
+    
+    def get(self, pid):
+        """
+        Get the current process dictionary for a PID.
+        
+        Args:
+            pid: Process ID
+            
+        Returns:
+            dict: Process dictionary, or None if the PID is not known
+        """
+        entry = self._entries.get(self._keys.get(pid))
+        return entry['row'] if entry else None
+    
+    def handle_counts(self):
+        """
+        Read the open handle count of every known process.
+        
+        Handle counts are not part of the rows, since no column shows them
+        and reading them on every update would cost a call per process.
+        This is meant for slow samplers such as leak tracking; it uses one
+        native snapshot where available and the registry's open process
+        handles otherwise.
+        
+        Returns:
+            dict: (pid, create_time) -> handle count (file descriptors
+                  outside Windows); processes whose count cannot be read
+                  are left out
+        """
+        entries = list(self._entries.values())
+        counts = {}
+        
+        if self.native:
+            try:
+                records = {record.pid: record for record in nt_snapshot.query_process_snapshot()}
+                for entry in entries:
+                    record = records.get(entry['key'][0])
+                    if record is not None and record.create_time == entry['start']:
+                        counts[entry['key']] = record.num_handles
+                return counts
+            except (OSError, ValueError) as e:
+                print(f"Native handle count snapshot failed: {str(e)}")
+        
+        for entry in entries:
+            try:
+                counts[entry['key']] = self._num_handles(entry['proc'])
+            except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
+                continue
+        return counts
+    
+    def _enumerate(self, pid):
+        """Collect the static details of a newly seen process."""
+        proc = psutil.Process(pid)
+        proc_info = proc.as_dict(['name', 'username', 'ppid'])
+        create_time = proc.create_time()
+        key = (pid, create_time)
+        
+        return {
+            'key': key,
+            'proc': proc,
+            'start': None,
+            'cpu_total': 0,
+            'io_counters': None,
+            'row': {
+                'pid': pid,
+                'ppid': proc_info.get('ppid') or 0,
+                'create_time': create_time,
+                'name': proc_info.get('name') or 'Unknown',
+                'username': proc_info.get('username') or 'N/A',
+                'status': 'Unknown',
+                'cpu_percent': 0,
+                'memory_mb': 0,
+                'io_bytes_per_sec': 0,
+                'io_read_bytes_per_sec': 0,
+                'io_write_bytes_per_sec': 0,
+                'io_read_ops_per_sec': 0,
+                'io_write_ops_per_sec': 0,
+                'num_threads': 0,
+                'type': self._owners.classify(key, proc_info.get('username'))
+            }
+        }
+    
+    @staticmethod
+    def _num_handles(proc):
+        """Get a process's open handle count, or its file descriptors outside Windows."""
+        if hasattr(proc, 'num_handles'):
+            return proc.num_handles()
+        return proc.num_fds()
+    
+    @staticmethod
+    def _io_counters(proc):
+        """Get a process's disk (read bytes, write bytes, reads, writes), if accessible."""
+        try:
+            io = proc.io_counters()
+            return (io.read_bytes, io.write_bytes, io.read_count, io.write_count)
+        except (psutil.AccessDenied, AttributeError):
+            return None
+    
+    @staticmethod
+    def _row_changed(row, sample):
+        """Check whether sampled values differ at display precision."""
+        for field, value in sample.items():
+            old_value = row.get(field)
+            if isinstance(value, float):
+                # Byte rates are shown in KB/s, everything else to one decimal
+                scale = 1024 if field.endswith('bytes_per_sec') else 1
+                if round(old_value / scale, 1) != round(value / scale, 1):
+                    return True
+            elif old_value != value:
+                return True
+        return False
+
+# Shared registry so CPU deltas and process identities carry over between refreshes
+_registry = ProcessRegistry()
+
+def get_process_registry():
+    """
+    Get the shared process registry.
+    
+    Returns:
+        ProcessRegistry: Registry used by get_processes
+    """
+    return _registry
+
+def get_process_delta():
+    """
+    Update the shared process registry.
+    
+    Returns:
+        ProcessDelta: Processes added, changed and exited since the last update
+    """
+    try:
+        return _registry.update()
+    except Exception as e:
+        print(f"Error collecting processes: {str(e)}")
+        return ProcessDelta()
+
+def get_processes():
+    """
+    Get list of running processes with details.
+    
+    Returns:
+        list: List of process dictionaries with pid, name, cpu, memory usage, etc.
+    """
+    get_process_delta()
+    processes = _registry.rows()
     
     # Return at least a minimal set
     if not processes:
         processes = [{
             'pid': 0,
+            'ppid': 0,
+            'create_time': 0,
             'name': 'System Monitor',
             'username': 'System',
             'status': 'running',
             'cpu_percent': 0,
             'memory_mb': 0,
+            'io_bytes_per_sec': 0,
+            'io_read_bytes_per_sec': 0,
+            'io_write_bytes_per_sec': 0,
+            'io_read_ops_per_sec': 0,
+            'io_write_ops_per_sec': 0,
+            'num_threads': 0,
             'type': 'System'
         }]
     
@@ -129,135 +555,112 @@ def kill_process(pid):
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        process = psutil.Process(pid)
-        process.terminate()
-        
-        # Wait for process to terminate
-        gone, still_alive = psutil.wait_procs([process], timeout=3)
-        
-        if process in still_alive:
-            # Force kill if termination didn't work
-            process.kill()
-        
-        return True
-    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
-        print(f"Error killing process {pid}: {str(e)}")
+    result = kill_processes([pid])[pid]
+    if result not in ('terminated', 'killed'):
+        print(f"Error killing process {pid}: {result}")
         return False
+    return True
 
-def get_process_details(pid):
+def kill_processes(pids, include_children=False, timeout=3):
     """
-    Get detailed information about a specific process with timeout protection.
+    Terminate several processes with one shared wait.
+    
+    Every target is sent terminate() first, the whole set is waited on once,
+    and only processes still alive after the timeout are killed.
     
     Args:
-        pid: Process ID
+        pids: Process IDs to terminate
+        include_children: Also end all descendants of each process
+        timeout: Seconds to wait for the processes to exit before killing them
         
     Returns:
-        dict: Process details including path, threads, etc.
+        dict: PID -> result, one of 'terminated', 'killed', 'not found',
+              'access denied' or 'failed'. Descendants appear under their own PIDs.
     """
-    import threading
+    results = {}
+    targets = {}  # pid -> psutil.Process
     
-    result = [None]  # Use list to store result from thread
+    # Resolve targets, and their descendants if requested
+    for pid in pids:
+        try:
+            proc = psutil.Process(pid)
+            family = [proc]
+            if include_children:
+                family.extend(proc.children(recursive=True))
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            results[pid] = 'not found'
+            continue
+        except psutil.AccessDenied:
+            results[pid] = 'access denied'
+            continue
+        
+        for member in family:
+            targets.setdefault(member.pid, member)
     
-    def collect_details():
+    # Send every terminate before waiting on any of them
+    waiting = []
+    for pid, proc in targets.items():
         try:
-            process = psutil.Process(pid)
-            
-            # Build process details with error handling for each component
-            details = {'pid': pid}
-            
-            # Basic process name - essential
-            try:
-                details['name'] = process.name()
-            except:
-                details['name'] = "Unknown"
-            
-            # Get process creation time
-            try:
-                create_time = datetime.fromtimestamp(process.create_time())
-                details['create_time'] = create_time.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                details['create_time'] = "Unknown"
-            
-            # Get process priority
-            # Windows priority constants (not part of psutil)
-            priority_map = {
-                win32process.IDLE_PRIORITY_CLASS: "Idle",
-                win32process.BELOW_NORMAL_PRIORITY_CLASS: "Below Normal",
-                win32process.NORMAL_PRIORITY_CLASS: "Normal",
-                win32process.ABOVE_NORMAL_PRIORITY_CLASS: "Above Normal",
-                win32process.HIGH_PRIORITY_CLASS: "High",
-                win32process.REALTIME_PRIORITY_CLASS: "Realtime"
-            }
-            
-            try:
-                win_proc = win32api.OpenProcess(win32con.PROCESS_QUERY_INFORMATION, False, pid)
-                priority = win32process.GetPriorityClass(win_proc)
-                details['priority'] = priority_map.get(priority, "Unknown")
-            except:
-                details['priority'] = "Unknown"
-            
-            # Get executable path
-            try:
-                details['path'] = process.exe()
-            except:
-                details['path'] = "Access denied"
-            
-            # Status
-            try:
-                details['status'] = process.status()
-            except:
-                details['status'] = "Unknown"
-            
-            # Username
-            try:
-                details['username'] = process.username()
-            except:
-                details['username'] = "N/A"
-            
-            # CPU usage - with minimal interval
-            try:
-                details['cpu_percent'] = process.cpu_percent(interval=0.05)
-            except:
-                details['cpu_percent'] = 0
-            
-            # Memory usage
-            try:
-                details['memory_mb'] = process.memory_info().rss / (1024**2)
-            except:
-                details['memory_mb'] = 0
-            
-            # Thread count
-            try:
-                details['num_threads'] = process.num_threads()
-            except:
-                details['num_threads'] = 0
-            
-            result[0] = details
-            
+            proc.terminate()
+            waiting.append(proc)
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            results[pid] = 'terminated'
+        except psutil.AccessDenied:
+            results[pid] = 'access denied'
         except Exception as e:
-            print(f"Error getting process details for {pid}: {str(e)}")
-            # Return basic info even if we fail
-            result[0] = {
-                'pid': pid,
-                'name': "Process information unavailable",
-                'path': "Unknown",
-                'status': "Unknown",
-                'username': "N/A",
-                'cpu_percent': 0,
-                'memory_mb': 0,
-                'num_threads': 0,
-                'priority': "Unknown",
-                'create_time': "Unknown"
-            }
+            print(f"Error terminating process {pid}: {str(e)}")
+            results[pid] = 'failed'
+    
+    gone, still_alive = psutil.wait_procs(waiting, timeout=timeout)
+    for proc in gone:
+        results[proc.pid] = 'terminated'
+    
+    # Force kill only the survivors
+    for proc in still_alive:
+        try:
+            proc.kill()
+            results[proc.pid] = 'killed'
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            results[proc.pid] = 'terminated'
+        except psutil.AccessDenied:
+            results[proc.pid] = 'access denied'
+        except Exception as e:
+            print(f"Error killing process {proc.pid}: {str(e)}")
+            results[proc.pid] = 'failed'
+    
+    return results
+
+def get_process_details(pid):
+    """
+    Get detailed information about a specific process.
+    
+    Live values come from the shared registry's last snapshot and static
+    values from its details cache, so no sampling or waiting happens here.
     
-    # Run with timeout protection
-    collector_thread = threading.Thread(target=collect_details)
-    collector_thread.daemon = True
-    collector_thread.start()
-    collector_thread.join(timeout=2)  # 2 second timeout
+    Args:
+        pid: Process ID
+        
+    Returns:
+        dict: Process details including path, threads, etc.
+    """
+    row = _registry.get(pid)
+    if row is None:
+        return {
+            'pid': pid,
+            'name': "Process information unavailable",
+            'path': "Unknown",
+            'status': "Unknown",
+            'username': "N/A",
+            'cpu_percent': 0,
+            'memory_mb': 0,
+            'num_threads': 0,
+            'priority': "Unknown",
+            'create_time': "Unknown"
+        }
     
-    return result[0]
+    details = dict(row)
+    details.update(_registry.details.fetch((row['pid'], row['create_time'])))
+    return details
 
 def set_process_priority(pid, priority):
     """